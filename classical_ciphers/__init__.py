@@ -0,0 +1,113 @@
+'''
+The classical_ciphers package collects the ciphers of this repository together with the tools built on them: streaming, file and batch encryption, cryptanalysis, the command line, the service and the benchmark.
+
+Import:
+    - The package is imported without importing any cipher: the names it offers are loaded through the module __getattr__ when first used;
+    - The cipher classes, such as CaesarCipher or HillCipher, and the main functions of the tools are available directly from the package;
+    - Every module can also be imported by its name, for example classical_ciphers.hill_cipher;
+    - NumPy is imported only when a cipher first needs it for a long text, so a short-lived process starts quickly.
+
+Registry:
+    - CIPHERS maps the names used by the command line and the service to the cipher classes;
+    - create_cipher builds a cipher from its name and a key given as text, and cipher_class returns the class of a name.
+
+Running:
+    - python -m classical_ciphers runs the command-line interface;
+    - python -X importtime -m classical_ciphers shows what the start of a process imports, and python -m classical_ciphers.benchmark --startup measures it.
+
+Пакет classical_ciphers объединяет шифры этого репозитория и инструменты на их основе: потоковое, файловое и пакетное шифрование, криптоанализ, командную строку, сервис и замер производительности.
+
+Импорт:
+    - Пакет импортируется без импорта какого-либо шифра: предоставляемые им имена загружаются через __getattr__ модуля при первом использовании;
+    - Классы шифров, например CaesarCipher или HillCipher, и основные функции инструментов доступны прямо из пакета;
+    - Любой модуль можно импортировать и по имени, например classical_ciphers.hill_cipher;
+    - NumPy импортируется только тогда, когда он впервые нужен шифру для длинного текста, поэтому короткоживущий процесс запускается быстро.
+
+Реестр:
+    - CIPHERS сопоставляет имена, используемые командной строкой и сервисом, классам шифров;
+    - create_cipher создаёт шифр по имени и ключу, заданному текстом, а cipher_class возвращает класс по имени.
+
+Запуск:
+    - python -m classical_ciphers запускает интерфейс командной строки;
+    - python -X importtime -m classical_ciphers показывает, что импортирует запуск процесса, а python -m classical_ciphers.benchmark --startup измеряет это.
+
+Paketti classical_ciphers kokoaa tämän repositorion salaukset ja niiden varaan rakennetut työkalut: virta-, tiedosto- ja eräsalauksen, kryptoanalyysin, komentorivin, palvelun ja suorituskykymittauksen.
+
+Tuonti:
+    - Paketti tuodaan tuomatta yhtään salausta: sen tarjoamat nimet ladataan moduulin __getattr__-funktion kautta ensimmäisellä käytöllä;
+    - Salausluokat, kuten CaesarCipher tai HillCipher, ja työkalujen tärkeimmät funktiot ovat saatavilla suoraan paketista;
+    - Jokaisen moduulin voi tuoda myös nimellä, esimerkiksi classical_ciphers.hill_cipher;
+    - NumPy tuodaan vasta, kun salaus tarvitsee sitä ensimmäisen kerran pitkälle tekstille, joten lyhytikäinen prosessi käynnistyy nopeasti.
+
+Rekisteri:
+    - CIPHERS liittää komentorivin ja palvelun käyttämät nimet salausluokkiin;
+    - create_cipher luo salauksen nimestä ja tekstinä annetusta avaimesta, ja cipher_class palauttaa nimen luokan.
+
+Suorittaminen:
+    - python -m classical_ciphers suorittaa komentorivikäyttöliittymän;
+    - python -X importtime -m classical_ciphers näyttää, mitä prosessin käynnistys tuo, ja python -m classical_ciphers.benchmark --startup mittaa sen.
+'''
+
+import importlib
+
+from .registry import CIPHERS, cipher_class, create_cipher
+
+EXPORTS = {
+    'AffineCipher': 'affine_cipher',
+    'AtbashCipher': 'atbash_cipher',
+    'BeaufortCipher': 'beaufort_cipher',
+    'CaesarCipher': 'caesar_cipher',
+    'GronsfeldCipher': 'gronsfeld_cipher',
+    'HillCipher': 'hill_cipher',
+    'PlayfairCipher': 'playfair_cipher',
+    'PolybiusCipher': 'polybius_square_cipher',
+    'RailFenceCipher': 'rail_fence_cipher',
+    'VigenereCipher': 'vigenere_cipher',
+    'TranslationTable': 'translation_table',
+    'Alphabet': 'alphabet',
+    'get_alphabet': 'alphabet',
+    'CipherPipeline': 'pipeline',
+    'key_schedules': 'key_schedule',
+    'process_chunks': 'streaming',
+    'encrypt_file': 'file_encryption',
+    'decrypt_file': 'file_encryption',
+    'encrypt_many': 'batch',
+    'decrypt_many': 'batch',
+    'pack': 'packed_container',
+    'unpack': 'packed_container',
+    'ContainerReader': 'packed_container',
+    'ContainerWriter': 'packed_container',
+    'crack_caesar': 'monoalphabetic_cracker',
+    'crack_affine': 'monoalphabetic_cracker',
+    'crack_vigenere': 'polyalphabetic_analysis',
+    'crack_beaufort': 'polyalphabetic_analysis',
+    'recover_key': 'hill_key_recovery',
+    'crack_hill': 'hill_key_recovery',
+    'crack_playfair': 'playfair_annealing',
+    'profile': 'instrumentation',
+}
+
+MODULES = (
+    'affine_cipher', 'alphabet', 'atbash_cipher', 'backends', 'batch', 'beaufort_cipher', 'benchmark', 'caesar_cipher',
+    'cipher_cli', 'cipher_service', 'file_encryption', 'gronsfeld_cipher', 'hill_cipher', 'hill_key_recovery',
+    'instrumentation', 'key_schedule', 'language_model', 'modular_arithmetic', 'monoalphabetic_cracker',
+    'packed_container', 'pipeline', 'playfair_annealing', 'playfair_cipher', 'polyalphabetic_analysis',
+    'polybius_square_cipher', 'rail_fence_cipher', 'registry', 'streaming', 'translation_table',
+    'vectorized_keystream', 'vigenere_cipher', 'zigzag',
+)
+
+__all__ = ['CIPHERS', 'cipher_class', 'create_cipher'] + sorted(EXPORTS)
+
+def __getattr__(name: str):
+    if name in EXPORTS:
+        value = getattr(importlib.import_module(f'.{EXPORTS[name]}', __name__), name)
+    elif name in MODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(EXPORTS) | set(MODULES))
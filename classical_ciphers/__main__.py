@@ -0,0 +1,5 @@
+import sys
+
+from .cipher_cli import main
+
+sys.exit(main())
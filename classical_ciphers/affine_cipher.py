@@ -57,70 +57,95 @@ Purku:
     - Korvataan salattu kirjain sillä kirjaimella, joka on lasketussa sijainnissa.
 """
 
+from functools import partial
+
+from .alphabet import get_alphabet
+from .key_schedule import key_schedules, schedule_attributes
+from .modular_arithmetic import greatest_common_divisor, modular_inverse
+from .streaming import StatelessTransform
+from .translation_table import TranslationTable, build_byte_table, translate_buffer
+
+SCHEDULE_ATTRIBUTES = ('inverted_a', 'alphabet', 'reverse_alphabet', 'encoding_table', 'decoding_table', 'encoding_bytes', 'decoding_bytes')
+
+def transform_letter(character: str, multiplier: int, increment: int, alphabet: dict, reverse_alphabet: dict) -> str:
+    if not character.isalpha():
+        return character
+
+    position = alphabet[character.upper()]
+    new_position = (multiplier * position + increment) % len(alphabet) or len(alphabet)
+    return reverse_alphabet[new_position]
+
 class AffineCipher:
 
-    def __init__(self, a: int, b: int):
+    def __init__(self, a: int, b: int, alphabet=None):
+
+        self.letters = get_alphabet(alphabet)
+        self.m = len(self.letters)
 
-        if self.greatest_common_divisor(a, 26) != 1:
-            raise ValueError("The coefficient 'a' must be relatively prime to 26!")
+        if self.greatest_common_divisor(a, self.m) != 1:
+            raise ValueError(f"The coefficient 'a' must be relatively prime to {self.m}!")
 
         self.a = a
         self.b = b
-        self.m = 26
-
-        self.alphabet = {
-            'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8,
-            'I': 9, 'J': 10, 'K': 11, 'L': 12, 'M': 13, 'N': 14, 'O': 15,
-            'P': 16, 'Q': 17, 'R': 18, 'S': 19, 'T': 20, 'U': 21, 'V': 22,
-            'W': 23, 'X': 24, 'Y': 25, 'Z': 26
-        }
-
-        self.reverse_alphabet = {
-            1: 'A', 2: 'B', 3: 'C', 4: 'D', 5: 'E', 6: 'F', 7: 'G', 8: 'H',
-            9: 'I', 10: 'J', 11: 'K', 12: 'L', 13: 'M', 14: 'N', 15: 'O',
-            16: 'P', 17: 'Q', 18: 'R', 19: 'S', 20: 'T', 21: 'U', 22: 'V',
-            23: 'W', 24: 'X', 25: 'Y', 26: 'Z'
-        }
+        self.__dict__.update(key_schedules.get((type(self), a, b, self.letters), self.create_schedule))
+
+    def create_schedule(self) -> dict:
+        self.inverted_a = self.multiplicative_inverse(self.a, self.m)
+
+        self.alphabet = {}
+        self.reverse_alphabet = {}
+        for position, letter in enumerate(self.letters, start=1):
+            self.alphabet[letter] = position
+            self.reverse_alphabet[position] = letter
+
+        # Decryption computes a^-1 * (x - b) as a^-1 * x - a^-1 * b.
+        encode_character = partial(transform_letter, multiplier=self.a, increment=self.b, alphabet=self.alphabet, reverse_alphabet=self.reverse_alphabet)
+        decode_character = partial(transform_letter, multiplier=self.inverted_a, increment=-self.inverted_a * self.b, alphabet=self.alphabet,
+                                   reverse_alphabet=self.reverse_alphabet)
+
+        self.encoding_table = TranslationTable(encode_character, self.letters.characters)
+        self.decoding_table = TranslationTable(decode_character, self.letters.characters)
+        self.encoding_bytes = build_byte_table(encode_character) if self.letters.is_ascii else None
+        self.decoding_bytes = build_byte_table(decode_character) if self.letters.is_ascii else None
+
+        return schedule_attributes(self, SCHEDULE_ATTRIBUTES)
 
     def greatest_common_divisor(self, a: int, b: int) -> int:
-        while b:
-            a, b = b, a % b
-        return a
+        return greatest_common_divisor(a, b)
 
     def multiplicative_inverse(self, a: int, m: int) -> int:
-        for number in range(1, m):
-            if (a * number) % m == 1:
-                return number
-        raise ValueError("Inverse element not found!")
+        inverse = modular_inverse(a, m)
+        if inverse is None:
+            raise ValueError("Inverse element not found!")
+        return inverse
 
     def encode_character(self, character: str) -> str:
-        if character.isalpha():
-            character = character.upper()
-            position = self.alphabet[character]
-            new_position = (self.a * position + self.b) % self.m
-            return self.reverse_alphabet[new_position]
-        return character
+        return self.encoding_table.translate_character(character)
 
     def decode_character(self, character: str) -> str:
-        if character.isalpha():
-            character = character.upper()
-            position = self.alphabet[character]
-            inverted_a = self.multiplicative_inverse(self.a, self.m)
-            new_position = (inverted_a * (position - self.b)) % self.m
-            return self.reverse_alphabet[new_position]
-        return character
+        return self.decoding_table.translate_character(character)
 
     def encode(self, text: str) -> str:
-        encoded_text = []
-        for character in text:
-            encoded_text.append(self.encode_character(character))
-        return ''.join(encoded_text)
+        return self.encoding_table.translate(text)
 
     def decode(self, text: str) -> str:
-        decoded_text = []
-        for character in text:
-            decoded_text.append(self.decode_character(character))
-        return ''.join(decoded_text)
+        return self.decoding_table.translate(text)
+
+    def translate_buffer(self, buffer, encrypt: bool = True, offset: int = 0, destination=None) -> int:
+        translate_buffer(buffer, self.encoding_bytes if encrypt else self.decoding_bytes, destination)
+        return offset
+
+    def encode_into(self, buffer, destination=None, offset: int = 0) -> int:
+        return self.translate_buffer(buffer, True, offset, destination)
+
+    def decode_into(self, buffer, destination=None, offset: int = 0) -> int:
+        return self.translate_buffer(buffer, False, offset, destination)
+
+    def encoder(self):
+        return StatelessTransform(self.encode)
+
+    def decoder(self):
+        return StatelessTransform(self.decode)
 
 if __name__ == "__main__":
 
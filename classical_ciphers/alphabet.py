@@ -0,0 +1,173 @@
+'''
+An alphabet is the ordered set of letters a cipher works with. The modular ciphers take the size of the alphabet as their modulus, so the same cipher can encrypt English, Russian or Finnish text.
+
+Alphabets:
+    - latin: the 26 letters from A to Z, the default of every cipher;
+    - russian: the 33 letters from А to Я, with Ё after Е;
+    - finnish: the 29 letters from A to Z followed by Å, Ä and Ö;
+    - A custom alphabet is made from any string of distinct letters, in the order given.
+
+Tables:
+    - Each alphabet is compiled once: the index of every letter in both cases and the padding letter of block ciphers;
+    - The NumPy arrays that map code points to indices and indices back to code points are built the first time a long text is vectorized; the same lookup marks the letters outside the alphabet;
+    - Custom alphabets with the same letters are the same object, so their tables are not built again;
+    - Two alphabets with the same letters are equal, so the key schedules of a cipher are shared between them.
+
+Text:
+    - A text is vectorized through its code points, so the fast paths of the ciphers work with any alphabet and not only with ASCII;
+    - Letters outside the alphabet are left to the character-by-character code, which treats them as before.
+
+Алфавит - это упорядоченный набор букв, с которым работает шифр. Модульные шифры берут размер алфавита в качестве модуля, поэтому один и тот же шифр может шифровать английский, русский или финский текст.
+
+Алфавиты:
+    - latin: 26 букв от A до Z, алфавит по умолчанию для каждого шифра;
+    - russian: 33 буквы от А до Я, где Ё стоит после Е;
+    - finnish: 29 букв от A до Z, за которыми следуют Å, Ä и Ö;
+    - Собственный алфавит составляется из любой строки различных букв в заданном порядке.
+
+Таблицы:
+    - Каждый алфавит компилируется один раз: индекс каждой буквы в обоих регистрах и буква-заполнитель блочных шифров;
+    - Массивы NumPy, отображающие кодовые точки в индексы и индексы обратно в кодовые точки, создаются при первой векторизации длинного текста; тот же поиск отмечает буквы вне алфавита;
+    - Собственные алфавиты с одинаковыми буквами являются одним и тем же объектом, поэтому их таблицы не строятся повторно;
+    - Два алфавита с одинаковыми буквами равны, поэтому расписания ключей шифра у них общие.
+
+Текст:
+    - Текст векторизуется через свои кодовые точки, поэтому быстрые пути шифров работают с любым алфавитом, а не только с ASCII;
+    - Буквы вне алфавита обрабатываются посимвольным кодом, который обращается с ними как прежде.
+
+Aakkosto on järjestetty joukko kirjaimia, joiden kanssa salaus toimii. Modulaariset salaukset käyttävät aakkoston kokoa moduulinaan, joten sama salaus voi salata englantia, venäjää tai suomea.
+
+Aakkostot:
+    - latin: 26 kirjainta A:sta Z:aan, jokaisen salauksen oletus;
+    - russian: 33 kirjainta А:sta Я:hen, Ё heti Е:n jälkeen;
+    - finnish: 29 kirjainta A:sta Z:aan ja niiden perässä Å, Ä ja Ö;
+    - Oma aakkosto muodostetaan mistä tahansa erillisten kirjainten merkkijonosta annetussa järjestyksessä.
+
+Taulukot:
+    - Jokainen aakkosto käännetään kerran: jokaisen kirjaimen indeksi molemmissa kirjainkoissa ja lohkosalausten täytekirjain;
+    - NumPy-taulukot, jotka kuvaavat koodipisteet indekseiksi ja indeksit takaisin koodipisteiksi, rakennetaan, kun pitkä teksti vektoroidaan ensimmäisen kerran; sama haku merkitsee aakkoston ulkopuoliset kirjaimet;
+    - Omat aakkostot, joilla on samat kirjaimet, ovat sama olio, joten niiden taulukoita ei rakenneta uudelleen;
+    - Kaksi aakkostoa, joilla on samat kirjaimet, ovat yhtä suuret, joten salauksen avainaikataulut jaetaan niiden kesken.
+
+Teksti:
+    - Teksti vektoroidaan koodipisteidensä kautta, joten salausten nopeat polut toimivat millä tahansa aakkostolla eivätkä vain ASCII:lla;
+    - Aakkoston ulkopuoliset kirjaimet jätetään merkki kerrallaan toimivalle koodille, joka käsittelee ne kuten ennenkin.
+'''
+
+import string
+from functools import lru_cache
+
+from .backends import numpy
+from .translation_table import code_point_text, text_code_points
+
+CUSTOM_ALPHABET_CACHE_SIZE = 64
+NOT_A_LETTER = -1
+FOREIGN_LETTER = -2
+OUTSIDE_TABLE = -3
+
+class Alphabet:
+
+    def __init__(self, name: str, letters: str, padding: str = None):
+        uppercase = letters.upper()
+        lowercase = uppercase.lower()
+
+        if len(uppercase) < 2 or not uppercase.isalpha():
+            raise ValueError("An alphabet must consist of at least two letters!")
+        if len(uppercase) != len(letters) or len(lowercase) != len(letters) or len(set(uppercase)) != len(uppercase):
+            raise ValueError("The letters of an alphabet must be distinct!")
+
+        self.name = name
+        self.uppercase = uppercase
+        self.lowercase = lowercase
+        self.characters = uppercase + lowercase
+        self.padding = padding or ('X' if 'X' in uppercase else uppercase[-1])
+        if self.padding not in uppercase:
+            raise ValueError(f"The padding letter {self.padding} is not in the alphabet!")
+
+        self.indices = {}
+        for index, (upper_letter, lower_letter) in enumerate(zip(uppercase, lowercase)):
+            self.indices[lower_letter] = index
+            self.indices[upper_letter] = index
+
+        self.is_ascii = uppercase.isascii()
+        self.code_indices = None
+        self.letter_codes = None
+
+    def __len__(self) -> int:
+        return len(self.uppercase)
+
+    def __iter__(self):
+        return iter(self.uppercase)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Alphabet):
+            return NotImplemented
+        return self.uppercase == other.uppercase and self.padding == other.padding
+
+    def __hash__(self) -> int:
+        return hash((self.uppercase, self.padding))
+
+    def __repr__(self) -> str:
+        return f"Alphabet({self.name!r}, {self.uppercase!r})"
+
+    def index_arrays(self) -> tuple:
+        if self.code_indices is None:
+            codes = [ord(character) for character in self.characters]
+
+            code_indices = []
+            for code in range(max(codes) + 1):
+                code_indices.append(FOREIGN_LETTER if chr(code).isalpha() else NOT_A_LETTER)
+            for index, code in enumerate(codes):
+                code_indices[code] = index
+
+            # Code points above the table are clipped to its last entry.
+            code_indices.append(OUTSIDE_TABLE)
+
+            self.letter_codes = numpy.array(codes, dtype=numpy.uint32)
+            self.code_indices = numpy.array(code_indices, dtype=numpy.int32)
+        return self.code_indices, self.letter_codes
+
+    def lookup(self, codes):
+        code_indices, _ = self.index_arrays()
+        indices = numpy.take(code_indices, codes, mode='clip')
+
+        if len(indices) and indices.min() < NOT_A_LETTER:
+            if (indices == FOREIGN_LETTER).any():
+                return None
+
+            outside = indices == OUTSIDE_TABLE
+            for code in numpy.unique(codes[outside]).tolist():
+                if chr(code).isalpha():
+                    return None
+            indices[outside] = NOT_A_LETTER
+
+        return indices
+
+    def to_indices(self, text: str):
+        indices = self.lookup(text_code_points(text))
+        if indices is None:
+            return None
+        return indices[indices >= 0] % len(self)
+
+    def from_indices(self, indices) -> str:
+        _, letter_codes = self.index_arrays()
+        return code_point_text(letter_codes[indices])
+
+LATIN = Alphabet('latin', string.ascii_uppercase)
+RUSSIAN = Alphabet('russian', 'АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ', padding='Ф')
+FINNISH = Alphabet('finnish', string.ascii_uppercase + 'ÅÄÖ')
+
+ALPHABETS = {alphabet.name: alphabet for alphabet in (LATIN, RUSSIAN, FINNISH)}
+
+@lru_cache(maxsize=CUSTOM_ALPHABET_CACHE_SIZE)
+def custom_alphabet(letters: str) -> Alphabet:
+    return Alphabet('custom', letters)
+
+def get_alphabet(alphabet=None) -> Alphabet:
+    if alphabet is None:
+        return LATIN
+    if isinstance(alphabet, Alphabet):
+        return alphabet
+    if alphabet in ALPHABETS:
+        return ALPHABETS[alphabet]
+    return custom_alphabet(alphabet)
@@ -2,7 +2,7 @@
 The Atbash cipher is a substitution cipher that replaces each letter with its opposite counterpart in the alphabet.
 
 Encryption / Decryption:
-    - Use the standard 26-letter Latin alphabet;
+    - Use the standard 26-letter Latin alphabet, or the Russian, Finnish or a custom one;
     - Match each letter with the one in the reverse position;
     - For each letter in the text:
         - Find its reverse equivalent in the alphabet;
@@ -14,7 +14,7 @@ Encryption / Decryption:
 Шифр Атбаш - это подстановочный шифр, в котором каждая буква заменяется на противоположную по положению в алфавите.
 
 Зашифровка / Расшифровка:
-    - Используется стандартный латинский алфавит из 26 букв;
+    - Используется стандартный латинский алфавит из 26 букв, либо русский, финский или собственный;
     - Каждой букве ставится в соответствие буква с противоположного конца алфавита;
     - Для каждой буквы в тексте:
         - Определяется "зеркальная" буква;
@@ -26,7 +26,7 @@ Encryption / Decryption:
 Atbash-salaus on korvaussalaus, jossa jokainen kirjain korvataan aakkoston vastakkaisella kirjaimella.
 
 Salaus / purku:
-    - Käytetään tavallista 26-kirjaimista latinalaista aakkostoa;
+    - Käytetään tavallista 26-kirjaimista latinalaista aakkostoa tai venäläistä, suomalaista tai omaa aakkostoa;
     - Jokainen kirjain yhdistetään aakkoston käänteisessä järjestyksessä olevaan vastineeseensa;
     - Jokaiselle tekstin kirjaimelle:
         - Etsitään sen käänteinen vastine aakkostossa;
@@ -36,14 +36,30 @@ Salaus / purku:
     - Salaus on symmetrinen – samaa prosessia käytetään sekä salauksessa että purussa.
 '''
 
+from functools import partial
+
+from .alphabet import get_alphabet
+from .key_schedule import key_schedules, schedule_attributes
+from .streaming import StatelessTransform
+from .translation_table import TranslationTable, build_byte_table, translate_buffer
+
+SCHEDULE_ATTRIBUTES = ('alphabet', 'mapping', 'table', 'byte_table')
+
+def mirror_letters(character: str, mapping: dict) -> str:
+    result = []
+
+    for upper_character in character.upper():
+        result.append(mapping.get(upper_character, upper_character))
+
+    return ''.join(result)
+
 class AtbashCipher:
-    def __init__(self):
-        self.alphabet = [   'A', 'B', 'C', 'D', 'E',
-                            'F', 'G', 'H', 'I', 'J',
-                            'K', 'L', 'M', 'N', 'O',
-                            'P', 'Q', 'R', 'S', 'T',
-                            'U', 'V', 'W', 'X', 'Y', 'Z'
-                    ]
+    def __init__(self, alphabet=None):
+        self.letters = get_alphabet(alphabet)
+        self.__dict__.update(key_schedules.get((type(self), self.letters), self.create_schedule))
+
+    def create_schedule(self) -> dict:
+        self.alphabet = list(self.letters)
 
         self.mapping = {}
         for i in range(len(self.alphabet)):
@@ -51,20 +67,38 @@ class AtbashCipher:
             reverse_letter = self.alphabet[-(i + 1)]
             self.mapping[letter] = reverse_letter
 
-    def encode(self, text: str) -> str:
-        result = []
+        encode_character = partial(mirror_letters, mapping=self.mapping)
 
-        for character in text.upper():
-            if character in self.mapping:
-                result.append(self.mapping[character])
-            else:
-                result.append(character)
+        self.table = TranslationTable(encode_character, self.letters.characters)
+        self.byte_table = build_byte_table(encode_character) if self.letters.is_ascii else None
 
-        return ''.join(result)
+        return schedule_attributes(self, SCHEDULE_ATTRIBUTES)
+
+    def encode_character(self, character: str) -> str:
+        return self.table.translate_character(character)
+
+    def encode(self, text: str) -> str:
+        return self.table.translate(text)
 
     def decode(self, text: str) -> str:
         return self.encode(text)
 
+    def translate_buffer(self, buffer, encrypt: bool = True, offset: int = 0, destination=None) -> int:
+        translate_buffer(buffer, self.byte_table, destination)
+        return offset
+
+    def encode_into(self, buffer, destination=None, offset: int = 0) -> int:
+        return self.translate_buffer(buffer, True, offset, destination)
+
+    def decode_into(self, buffer, destination=None, offset: int = 0) -> int:
+        return self.translate_buffer(buffer, False, offset, destination)
+
+    def encoder(self):
+        return StatelessTransform(self.encode)
+
+    def decoder(self):
+        return StatelessTransform(self.decode)
+
 if __name__ == "__main__":
     cipher = AtbashCipher()
 
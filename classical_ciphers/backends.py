@@ -0,0 +1,80 @@
+'''
+The optional backends are modules, such as NumPy, that speed up the ciphers but are not required, and that are imported only when they are first needed.
+
+Loading:
+    - Each backend is represented by a placeholder, which the cipher modules import instead of the module itself;
+    - Importing the package therefore does not import NumPy, so a short-lived process that never processes a long text does not pay for it;
+    - The first time the placeholder is tested or one of its attributes is read, the real module is imported;
+    - The attributes that have been read are remembered, so later accesses cost the same as on the module;
+    - If the module is not installed, the placeholder is false, and the ciphers use their pure Python code;
+    - disabled() makes the placeholder behave as if the module were not installed until the block ends, for every cipher at once, since they all share the placeholder; the benchmark and the tests use it to measure and check the pure Python code.
+
+Необязательные реализации - это модули, например NumPy, которые ускоряют шифры, но не обязательны и импортируются только при первой необходимости.
+
+Загрузка:
+    - Каждая реализация представлена заместителем, который модули шифров импортируют вместо самого модуля;
+    - Поэтому импорт пакета не импортирует NumPy, и короткоживущий процесс, никогда не обрабатывающий длинный текст, не платит за него;
+    - При первой проверке заместителя или первом чтении его атрибута импортируется настоящий модуль;
+    - Прочитанные атрибуты запоминаются, поэтому последующие обращения стоят столько же, сколько к самому модулю;
+    - Если модуль не установлен, заместитель ложен, и шифры используют свой код на чистом Python;
+    - disabled() до конца блока заставляет заместитель вести себя так, как будто модуль не установлен, сразу для всех шифров, так как все они используют одного заместителя; замер производительности и тесты используют его, чтобы измерить и проверить код на чистом Python.
+
+Valinnaiset toteutukset ovat moduuleja, kuten NumPy, jotka nopeuttavat salauksia mutta eivät ole pakollisia, ja ne tuodaan vasta, kun niitä ensimmäisen kerran tarvitaan.
+
+Lataaminen:
+    - Jokaista toteutusta edustaa sijainen, jonka salausmoduulit tuovat itse moduulin sijaan;
+    - Paketin tuominen ei siksi tuo NumPya, joten lyhytikäinen prosessi, joka ei koskaan käsittele pitkää tekstiä, ei maksa siitä;
+    - Kun sijainen testataan tai sen attribuutti luetaan ensimmäisen kerran, oikea moduuli tuodaan;
+    - Luetut attribuutit muistetaan, joten myöhemmät käytöt maksavat saman verran kuin itse moduulissa;
+    - Jos moduulia ei ole asennettu, sijainen on epätosi, ja salaukset käyttävät puhdasta Python-koodiaan;
+    - disabled() saa sijaisen käyttäytymään lohkon loppuun asti kuin moduulia ei olisi asennettu, kaikille salauksille kerralla, koska ne kaikki käyttävät samaa sijaista; suorituskykymittaus ja testit käyttävät sitä puhtaan Python-koodin mittaamiseen ja tarkistamiseen.
+'''
+
+import importlib
+from contextlib import contextmanager
+
+class OptionalModule:
+
+    def __init__(self, name: str):
+        self.name = name
+        self.module = None
+        self.loaded = False
+
+    def load(self):
+        if not self.loaded:
+            try:
+                self.module = importlib.import_module(self.name)
+            except ImportError:
+                self.module = None
+            self.loaded = True
+        return self.module
+
+    def __bool__(self) -> bool:
+        return self.load() is not None
+
+    def __getattr__(self, name: str):
+        module = self.load()
+        if module is None:
+            raise ImportError(f"The optional module {self.name} is not installed!")
+
+        value = getattr(module, name)
+        setattr(self, name, value)
+        return value
+
+    @contextmanager
+    def disabled(self):
+        saved_state = dict(self.__dict__)
+        # The attributes remembered on the placeholder are dropped too, so no cipher reaches the module through them.
+        self.__dict__.clear()
+        self.__dict__.update(name=saved_state['name'], module=None, loaded=True)
+        try:
+            yield
+        finally:
+            self.__dict__.clear()
+            self.__dict__.update(saved_state)
+
+    def __repr__(self) -> str:
+        state = 'not loaded' if not self.loaded else 'not installed' if self.module is None else 'loaded'
+        return f"<optional module {self.name} ({state})>"
+
+numpy = OptionalModule('numpy')
@@ -0,0 +1,126 @@
+'''
+Batch encryption encrypts or decrypts many independent records, such as the lines of a file or the rows of a table, with one cipher across several processes.
+
+Processing:
+    - The cipher is sent to every worker process once, when the process starts, so its key schedule and tables are not rebuilt for every record;
+    - Records are grouped into large chunks, so that a single message to a worker carries many records;
+    - Only a few chunks per worker are in flight at any time, so an endless iterable can be processed with bounded memory;
+    - Results are returned as a generator, in the same order as the records;
+    - Every record is processed on its own: the keystream of Vigenère, Beaufort and Gronsfeld starts again for each record;
+    - A cipher with a batch mode, such as Rail Fence and Beaufort with encode_many and decode_many or Vigenère with encrypt_many and decrypt_many, processes each chunk of records in one call;
+    - With a single worker the records are processed in the calling process.
+
+Пакетное шифрование шифрует или расшифровывает много независимых записей, например строки файла или таблицы, одним шифром в нескольких процессах.
+
+Обработка:
+    - Шифр передаётся каждому рабочему процессу один раз, при его запуске, поэтому расписание ключа и таблицы не строятся заново для каждой записи;
+    - Записи объединяются в большие части, чтобы одно сообщение рабочему процессу содержало много записей;
+    - Одновременно обрабатывается лишь несколько частей на процесс, поэтому даже бесконечный итератор обрабатывается в ограниченной памяти;
+    - Результаты возвращаются генератором в том же порядке, что и записи;
+    - Каждая запись обрабатывается отдельно: поток ключа Виженера, Бофорта и Гронсфельда начинается заново для каждой записи;
+    - Шифр с пакетным режимом, например «Железнодорожная изгородь» и Бофорт с encode_many и decode_many или Виженер с encrypt_many и decrypt_many, обрабатывает каждую часть записей одним вызовом;
+    - При одном рабочем процессе записи обрабатываются в вызывающем процессе.
+
+Eräsalaus salaa tai purkaa monta toisistaan riippumatonta tietuetta, kuten tiedoston tai taulukon rivejä, yhdellä salauksella useassa prosessissa.
+
+Käsittely:
+    - Salaus lähetetään jokaiselle työprosessille kerran prosessin käynnistyessä, joten sen avainaikataulua ja taulukoita ei rakenneta uudelleen jokaiselle tietueelle;
+    - Tietueet ryhmitellään suuriksi osiksi, jotta yksi viesti työprosessille sisältää monta tietuetta;
+    - Kerrallaan käsittelyssä on vain muutama osa työprosessia kohden, joten loputonkin iteraattori käsitellään rajallisella muistilla;
+    - Tulokset palautetaan generaattorina samassa järjestyksessä kuin tietueet;
+    - Jokainen tietue käsitellään erikseen: Vigenèren, Beaufortin ja Gronsfeldin avainvirta alkaa alusta jokaiselle tietueelle;
+    - Salaus, jolla on erätila, kuten aitasalaus ja Beaufort encode_many- ja decode_many-metodeineen tai Vigenère encrypt_many- ja decrypt_many-metodeineen, käsittelee jokaisen tietueosan yhdellä kutsulla;
+    - Yhdellä työprosessilla tietueet käsitellään kutsuvassa prosessissa.
+'''
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_BATCH_SIZE = 4096
+CHUNKS_PER_WORKER = 4
+
+worker_state = {}
+
+def cipher_function(cipher, decrypt: bool = False):
+    names = ('decode', 'decrypt') if decrypt else ('encode', 'encrypt')
+    for name in names:
+        function = getattr(cipher, name, None)
+        if function is not None:
+            return function
+    raise TypeError(f"{type(cipher).__name__} has no {' or '.join(names)} method!")
+
+def many_function(cipher, decrypt: bool = False):
+    names = ('decode_many', 'decrypt_many') if decrypt else ('encode_many', 'encrypt_many')
+    for name in names:
+        function = getattr(cipher, name, None)
+        if function is not None:
+            return function
+    return None
+
+def records_function(cipher, decrypt: bool = False):
+    batch_function = many_function(cipher, decrypt)
+    if batch_function is not None:
+        return batch_function
+
+    function = cipher_function(cipher, decrypt)
+
+    def transform(records: list) -> list:
+        return [function(record) for record in records]
+
+    return transform
+
+def initialize_worker(cipher, decrypt: bool):
+    worker_state['function'] = records_function(cipher, decrypt)
+
+def transform_records(records: list) -> list:
+    return worker_state['function'](records)
+
+def chunk_records(records, chunk_size: int):
+    iterator = iter(records)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def encrypt_many(cipher, records, chunk_size: int = DEFAULT_BATCH_SIZE, workers: int = None, decrypt: bool = False):
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive!")
+
+    workers = workers or os.cpu_count() or 1
+    chunks = chunk_records(records, chunk_size)
+
+    if workers == 1:
+        function = records_function(cipher, decrypt)
+        for chunk in chunks:
+            yield from function(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker, initargs=(cipher, decrypt)) as executor:
+        pending = deque()
+
+        for chunk in chunks:
+            pending.append(executor.submit(transform_records, chunk))
+            if len(pending) >= workers * CHUNKS_PER_WORKER:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+def decrypt_many(cipher, records, chunk_size: int = DEFAULT_BATCH_SIZE, workers: int = None):
+    return encrypt_many(cipher, records, chunk_size, workers, decrypt=True)
+
+if __name__ == "__main__":
+
+    from .vigenere_cipher import VigenereCipher
+
+    cipher = VigenereCipher("LEMON")
+    records = [f"Record number {number}: attack at dawn" for number in range(10)]
+
+    encrypted_records = list(encrypt_many(cipher, records, chunk_size=4, workers=2))
+    decrypted_records = list(decrypt_many(cipher, encrypted_records, chunk_size=4, workers=2))
+
+    print(f"Encrypted: {encrypted_records[:3]}")
+    print(f"Decrypted: {decrypted_records[:3]}")
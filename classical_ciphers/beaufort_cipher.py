@@ -28,17 +28,23 @@ Decryption:
     - Используется та же формула с тем же ключом для восстановления исходного сообщения.
 '''
 
+from .alphabet import get_alphabet
+from .key_schedule import key_schedules, schedule_attributes
+from .streaming import KeystreamTransform
+from .translation_table import copy_into
+from .vectorized_keystream import apply_keystream, apply_keystream_many, is_vectorizable, shift_buffer
+
+SCHEDULE_ATTRIBUTES = ('alphabet', 'alphabet_size', 'letter_to_index', 'index_to_letter')
+
 class BeaufortCipher:
-    def __init__(self, key: str):
-        self.alphabet = [
-            'A', 'B', 'C', 'D', 'E',
-            'F', 'G', 'H', 'I', 'J',
-            'K', 'L', 'M', 'N', 'O',
-            'P', 'Q', 'R', 'S', 'T',
-            'U', 'V', 'W', 'X', 'Y', 'Z'
-        ]
-        self.alphabet_size = 26
+    def __init__(self, key: str, alphabet=None):
         self.key = key.upper()
+        self.letters = get_alphabet(alphabet)
+        self.__dict__.update(key_schedules.get((type(self), self.letters), self.create_schedule))
+
+    def create_schedule(self) -> dict:
+        self.alphabet = list(self.letters)
+        self.alphabet_size = len(self.alphabet)
 
         self.letter_to_index = {}
         self.index_to_letter = {}
@@ -49,12 +55,26 @@ class BeaufortCipher:
             self.index_to_letter[index] = character
             index += 1
 
-    def encode(self, text: str) -> str:
+        return schedule_attributes(self, SCHEDULE_ATTRIBUTES)
+
+    def key_indices(self) -> list:
+        indices = []
+        for character in self.key:
+            indices.append(self.letter_to_index[character])
+        return indices
+
+    def process_chunk(self, text: str, offset: int = 0) -> tuple:
+        upper_text = text.upper()
+        if is_vectorizable(upper_text, self.key):
+            result = apply_keystream(upper_text, self.key_indices(), multiplier=-1, offset=offset, alphabet=self.letters)
+            if result is not None:
+                return result
+
         result = []
         key_length = len(self.key)
-        key_index = 0
+        key_index = offset
 
-        for character in text.upper():
+        for character in upper_text:
             if character in self.letter_to_index:
                 character_index = self.letter_to_index[character]
                 key_character = self.key[key_index % key_length]
@@ -68,11 +88,42 @@ class BeaufortCipher:
             else:
                 result.append(character)
 
-        return ''.join(result)
+        return ''.join(result), key_index
+
+    def encode(self, text: str) -> str:
+        encoded_text, _ = self.process_chunk(text)
+        return encoded_text
 
     def decode(self, text: str) -> str:
         return self.encode(text)
 
+    def encode_many(self, texts) -> list:
+        upper_texts = [text.upper() for text in texts]
+        if len(upper_texts) > 1 and is_vectorizable(''.join(upper_texts), self.key):
+            results = apply_keystream_many(upper_texts, self.key_indices(), self.letters, multiplier=-1)
+            if results is not None:
+                return results
+
+        return [self.process_chunk(text)[0] for text in upper_texts]
+
+    def decode_many(self, texts) -> list:
+        return self.encode_many(texts)
+
+    def translate_buffer(self, buffer, encrypt: bool = True, offset: int = 0, destination=None) -> int:
+        return shift_buffer(copy_into(buffer, destination), self.key_indices(), multiplier=-1, offset=offset, uppercase=True, alphabet=self.letters)
+
+    def encode_into(self, buffer, destination=None, offset: int = 0) -> int:
+        return self.translate_buffer(buffer, True, offset, destination)
+
+    def decode_into(self, buffer, destination=None, offset: int = 0) -> int:
+        return self.translate_buffer(buffer, False, offset, destination)
+
+    def encoder(self):
+        return KeystreamTransform(self.process_chunk)
+
+    def decoder(self):
+        return self.encoder()
+
 if __name__ == "__main__":
     cipher = BeaufortCipher(key="KEYWORD")
 
@@ -0,0 +1,377 @@
+'''
+The benchmark measures how fast every cipher encrypts, for several input sizes, keys and backends, and compares the results with a stored baseline.
+
+Backends:
+    - python: the pure Python code, character by character for the substitution ciphers and with NumPy switched off for the others;
+    - translate: one str.translate call with a precomputed table, for Caesar, Atbash and Affine;
+    - buffer: the text as bytes, translated into a reused output buffer, for the ciphers that keep the length of the text;
+    - numpy: the vectorized code of the ciphers that have one;
+    - A backend that a cipher does not have is skipped.
+
+Measurements:
+    - The input is English text repeated to the requested size, from 1 KB to 100 MB;
+    - Every case is run several times, until a minimum time is spent, and the latency of every call is recorded;
+    - The throughput in characters per second is computed from the median latency;
+    - The peak memory of one more call is measured with tracemalloc, which also sees NumPy allocations;
+    - The results are saved as JSON, together with the Python and NumPy versions.
+
+Comparison:
+    - Each case is matched with the same cipher, key, backend and size in the baseline;
+    - A case whose throughput fell by more than the tolerance is reported as a regression, and the command exits with an error.
+
+Startup:
+    - With --startup, the benchmark runs the command-line interface in a new process for every cipher, on a short text, several times;
+    - The process runs with -X importtime, and the report gives the median time of the whole process, the time spent importing, the part of it spent in the package and whether NumPy was imported;
+    - The slowest imports are listed, so a module that makes every process start slowly is easy to find.
+
+Тест производительности измеряет скорость шифрования каждым шифром для разных размеров входных данных, ключей и реализаций и сравнивает результаты с сохранённым эталоном.
+
+Реализации:
+    - python: чистый Python, посимвольно для шифров замены и с отключённым NumPy для остальных;
+    - translate: один вызов str.translate с заранее вычисленной таблицей, для Цезаря, Атбаш и аффинного шифра;
+    - buffer: текст в виде байтов, переводимый в повторно используемый выходной буфер, для шифров, сохраняющих длину текста;
+    - numpy: векторизованный код тех шифров, у которых он есть;
+    - Реализация, которой у шифра нет, пропускается.
+
+Измерения:
+    - Входные данные - английский текст, повторённый до нужного размера, от 1 КБ до 100 МБ;
+    - Каждый случай выполняется несколько раз, пока не пройдёт минимальное время, и задержка каждого вызова записывается;
+    - Пропускная способность в символах в секунду вычисляется по медианной задержке;
+    - Пиковая память ещё одного вызова измеряется с помощью tracemalloc, который учитывает и выделения NumPy;
+    - Результаты сохраняются в JSON вместе с версиями Python и NumPy.
+
+Сравнение:
+    - Каждый случай сопоставляется с тем же шифром, ключом, реализацией и размером в эталоне;
+    - Случай, пропускная способность которого упала больше допустимого отклонения, считается регрессией, и команда завершается с ошибкой.
+
+Запуск:
+    - С параметром --startup тест несколько раз запускает интерфейс командной строки в новом процессе для каждого шифра на коротком тексте;
+    - Процесс запускается с -X importtime, и отчёт содержит медианное время всего процесса, время импорта, его долю, пришедшуюся на пакет, и то, был ли импортирован NumPy;
+    - Самые медленные импорты перечисляются, поэтому модуль, замедляющий запуск каждого процесса, легко найти.
+
+Suorituskykytesti mittaa, kuinka nopeasti kukin salaus salaa eri syötekoilla, avaimilla ja toteutuksilla, ja vertaa tuloksia tallennettuun vertailukohtaan.
+
+Toteutukset:
+    - python: puhdas Python, merkki kerrallaan korvaussalauksille ja NumPy pois päältä muille;
+    - translate: yksi str.translate-kutsu valmiiksi lasketulla taulukolla, Caesarille, Atbashille ja affiinille salaukselle;
+    - buffer: teksti tavuina käännettynä uudelleen käytettävään tulospuskuriin, tekstin pituuden säilyttäville salauksille;
+    - numpy: niiden salausten vektoroitu koodi, joilla sellainen on;
+    - Toteutus, jota salauksella ei ole, ohitetaan.
+
+Mittaukset:
+    - Syöte on englanninkielistä tekstiä toistettuna pyydettyyn kokoon, 1 kt:sta 100 Mt:iin;
+    - Jokainen tapaus suoritetaan useita kertoja, kunnes vähimmäisaika on kulunut, ja jokaisen kutsun viive tallennetaan;
+    - Läpäisykyky merkkeinä sekunnissa lasketaan mediaaniviiveestä;
+    - Vielä yhden kutsun huippumuisti mitataan tracemallocilla, joka näkee myös NumPyn varaukset;
+    - Tulokset tallennetaan JSON-muodossa yhdessä Pythonin ja NumPyn versioiden kanssa.
+
+Vertailu:
+    - Jokainen tapaus yhdistetään vertailukohdan samaan salaukseen, avaimeen, toteutukseen ja kokoon;
+    - Tapaus, jonka läpäisykyky laski enemmän kuin sallittu poikkeama, raportoidaan regressiona, ja komento päättyy virheeseen.
+
+Käynnistys:
+    - Valinnalla --startup testi suorittaa komentorivikäyttöliittymän uudessa prosessissa jokaiselle salaukselle lyhyellä tekstillä useita kertoja;
+    - Prosessi suoritetaan valinnalla -X importtime, ja raportti antaa koko prosessin mediaaniajan, tuontiin kuluneen ajan, siitä paketin osuuden ja tiedon siitä, tuotiinko NumPy;
+    - Hitaimmat tuonnit luetellaan, joten jokaisen prosessin käynnistystä hidastava moduuli on helppo löytää.
+'''
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from .backends import numpy
+from .batch import cipher_function
+from .language_model import ENGLISH_SAMPLE
+from .registry import create_cipher
+
+BACKENDS = ('python', 'translate', 'buffer', 'numpy')
+DEFAULT_SIZES = '1K,64K,1M'
+MINIMUM_TIME = 0.2
+MINIMUM_REPEATS = 3
+MAXIMUM_REPEATS = 100
+DEFAULT_TOLERANCE = 0.1
+STARTUP_RUNS = 5
+STARTUP_INPUT = b'ATTACK AT DAWN'
+STARTUP_TOP_MODULES = 10
+
+BENCHMARK_KEYS = {
+    'affine': ['5,8'],
+    'atbash': [None],
+    'beaufort': ['KEY', 'CRYPTOGRAPHY', 'THEQUICKBROWNFOXJUMPSOVERTHELAZYDOGTHEQUICKBROWNFOXJUMPSOVERTHE'],
+    'caesar': ['3'],
+    'gronsfeld': ['31415', '2718281828459045235360287471352662497757'],
+    'hill': ['5,8;17,3', '6,24,1;13,16,10;20,17,15'],
+    'playfair': ['KEY', 'MONARCHY'],
+    'polybius': [None],
+    'polybius-fixed': [None],
+    'rail-fence': ['3', '10', '100'],
+    'vigenere': ['KEY', 'CRYPTOGRAPHY', 'THEQUICKBROWNFOXJUMPSOVERTHELAZYDOGTHEQUICKBROWNFOXJUMPSOVERTHE'],
+}
+
+SIZE_UNITS = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+
+def parse_size(size: str) -> int:
+    size = size.strip().upper()
+    if size[-1:] in SIZE_UNITS:
+        return int(float(size[:-1]) * SIZE_UNITS[size[-1]])
+    return int(size)
+
+def sample_text(size: int) -> str:
+    repeats = size // len(ENGLISH_SAMPLE) + 1
+    return (ENGLISH_SAMPLE * repeats)[:size]
+
+def translate_into_buffer(cipher):
+    destinations = {}
+
+    def encode(data: bytes) -> bytearray:
+        destination = destinations.get(len(data))
+        if destination is None:
+            destination = destinations[len(data)] = bytearray(len(data))
+        cipher.translate_buffer(data, True, 0, destination)
+        return destination
+    return encode
+
+def backend_function(cipher, backend: str):
+    substitution = hasattr(cipher, 'encode_character')
+
+    if backend == 'python':
+        if substitution:
+            return lambda text: ''.join(map(cipher.encode_character, text))
+        return cipher_function(cipher)
+
+    if backend == 'translate':
+        return cipher.encode if substitution else None
+
+    if backend == 'buffer':
+        return translate_into_buffer(cipher) if hasattr(cipher, 'translate_buffer') else None
+
+    if backend == 'numpy':
+        if not numpy or substitution:
+            return None
+        return cipher_function(cipher)
+
+    raise ValueError(f"Unknown backend: {backend}!")
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    return sorted_values[min(int(fraction * len(sorted_values)), len(sorted_values) - 1)]
+
+def measure(function, text: str, minimum_time: float = MINIMUM_TIME) -> dict:
+    latencies = []
+    started = time.perf_counter()
+
+    while len(latencies) < MAXIMUM_REPEATS:
+        start = time.perf_counter()
+        function(text)
+        latencies.append(time.perf_counter() - start)
+
+        if len(latencies) >= MINIMUM_REPEATS and time.perf_counter() - started >= minimum_time:
+            break
+
+    tracemalloc.start()
+    try:
+        function(text)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    median = percentile(latencies, 0.5)
+    return {
+        'repeats': len(latencies),
+        'characters_per_second': len(text) / max(median, 1e-12),
+        'p50_ms': median * 1000,
+        'p90_ms': percentile(latencies, 0.9) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'peak_memory_bytes': peak_memory,
+    }
+
+def run_benchmarks(ciphers: list = None, backends: list = BACKENDS, sizes: list = None, minimum_time: float = MINIMUM_TIME, progress=None) -> list:
+    ciphers = ciphers or sorted(BENCHMARK_KEYS)
+    sizes = sizes or [parse_size(size) for size in DEFAULT_SIZES.split(',')]
+    results = []
+
+    for size in sizes:
+        text = sample_text(size)
+        data = text.encode('ascii')
+
+        for name in ciphers:
+            for key in BENCHMARK_KEYS[name]:
+                cipher = create_cipher(name, key)
+
+                for backend in backends:
+                    function = backend_function(cipher, backend)
+                    if function is None:
+                        continue
+
+                    if backend == 'python':
+                        with numpy.disabled():
+                            measurement = measure(function, text, minimum_time)
+                    elif backend == 'buffer':
+                        measurement = measure(function, data, minimum_time)
+                    else:
+                        measurement = measure(function, text, minimum_time)
+
+                    result = {'cipher': name, 'key': key, 'backend': backend, 'size': size}
+                    result.update(measurement)
+                    results.append(result)
+
+                    if progress is not None:
+                        progress(result)
+
+    return results
+
+def environment() -> dict:
+    return {
+        'python': platform.python_version(),
+        'numpy': None if not numpy else numpy.__version__,
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+def parse_import_times(report: str) -> dict:
+    imports = {}
+    for line in report.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        imports[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return imports
+
+def measure_startup(name: str, key: str = None, runs: int = STARTUP_RUNS) -> dict:
+    command = [sys.executable, '-X', 'importtime', '-m', __package__, 'encrypt', '--cipher', name]
+    if key is not None:
+        command += ['--key', key]
+
+    package_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    search_path = [package_directory] + [path for path in [os.environ.get('PYTHONPATH')] if path]
+    child_environment = dict(os.environ, PYTHONPATH=os.pathsep.join(search_path))
+
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(command, input=STARTUP_INPUT, capture_output=True, env=child_environment, check=True)
+        latencies.append(time.perf_counter() - start)
+        imports = parse_import_times(completed.stderr.decode('utf-8', 'replace'))
+
+    latencies.sort()
+    slowest = sorted(imports.items(), key=lambda item: item[1][0], reverse=True)[:STARTUP_TOP_MODULES]
+    return {
+        'cipher': name,
+        'key': key,
+        'runs': runs,
+        'median': latencies[len(latencies) // 2],
+        'imports': sum(self_time for self_time, _ in imports.values()) / 1e6,
+        'package_imports': sum(self_time for module, (self_time, _) in imports.items() if module.split('.')[0] == __package__) / 1e6,
+        'numpy_imported': any(module.split('.')[0] == 'numpy' for module in imports),
+        'slowest_imports': [{'module': module, 'self': self_time / 1e6, 'cumulative': cumulative / 1e6} for module, (self_time, cumulative) in slowest],
+    }
+
+def format_startup(result: dict) -> str:
+    key = '-' if result['key'] is None else result['key'][:16]
+    return (f"{result['cipher']:<14} {key:<16} {result['median'] * 1e3:8.1f} ms process "
+            f"{result['imports'] * 1e3:8.1f} ms imports {result['package_imports'] * 1e3:8.1f} ms package "
+            f"numpy {'imported' if result['numpy_imported'] else 'not imported'}")
+
+def run_startup(ciphers: list = None, runs: int = STARTUP_RUNS, progress=None) -> list:
+    results = []
+    for name in ciphers or BENCHMARK_KEYS:
+        result = measure_startup(name, BENCHMARK_KEYS[name][0], runs)
+        results.append(result)
+        if progress:
+            progress(result)
+    return results
+
+def case_key(result: dict) -> tuple:
+    return result['cipher'], result['key'], result['backend'], result['size']
+
+def compare(baseline: list, results: list, tolerance: float = DEFAULT_TOLERANCE) -> list:
+    baseline_results = {case_key(result): result for result in baseline}
+    regressions = []
+
+    for result in results:
+        reference = baseline_results.get(case_key(result))
+        if reference is None:
+            continue
+
+        ratio = result['characters_per_second'] / max(reference['characters_per_second'], 1e-12)
+        if ratio < 1 - tolerance:
+            regression = dict(result)
+            regression['baseline_characters_per_second'] = reference['characters_per_second']
+            regression['ratio'] = ratio
+            regressions.append(regression)
+
+    return regressions
+
+def format_result(result: dict) -> str:
+    key = '-' if result['key'] is None else result['key'][:16]
+    return (f"{result['cipher']:<14} {key:<16} {result['backend']:<9} {result['size']:>10} "
+            f"{result['characters_per_second']:>15,.0f} chars/s  p50 {result['p50_ms']:9.3f} ms  p99 {result['p99_ms']:9.3f} ms  "
+            f"peak {result['peak_memory_bytes'] / (1 << 20):8.2f} MB")
+
+def main(arguments: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the throughput of every cipher and detect regressions.")
+    parser.add_argument('--ciphers', help="comma-separated cipher names, all by default")
+    parser.add_argument('--backends', default=','.join(BACKENDS))
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help="comma-separated sizes such as 1K,1M,100M")
+    parser.add_argument('--minimum-time', type=float, default=MINIMUM_TIME, help="seconds to spend on every case")
+    parser.add_argument('--output', help="save the results to this JSON file")
+    parser.add_argument('--compare', help="compare the results with this baseline JSON file")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help="allowed throughput drop, 0.1 for 10%%")
+    parser.add_argument('--startup', action='store_true', help="measure the start of a command-line process instead")
+    parser.add_argument('--startup-runs', type=int, default=STARTUP_RUNS)
+    parser.add_argument('--quiet', action='store_true')
+    arguments = parser.parse_args(arguments)
+
+    ciphers = arguments.ciphers.split(',') if arguments.ciphers else None
+    for name in ciphers or []:
+        if name not in BENCHMARK_KEYS:
+            parser.error(f"Unknown cipher: {name}")
+
+    if arguments.startup:
+        progress = None if arguments.quiet else lambda result: print(format_startup(result), flush=True)
+        results = run_startup(ciphers, arguments.startup_runs, progress)
+        if not arguments.quiet:
+            print("Slowest imports of the last cipher:")
+            for module in results[-1]['slowest_imports']:
+                print(f"    {module['module']:<40} {module['self'] * 1e3:8.2f} ms {module['cumulative'] * 1e3:8.2f} ms cumulative")
+
+        if arguments.output:
+            with open(arguments.output, 'w') as file:
+                json.dump({'environment': environment(), 'startup': results}, file, indent=2)
+        return 0
+
+    backends = arguments.backends.split(',')
+    for backend in backends:
+        if backend not in BACKENDS:
+            parser.error(f"Unknown backend: {backend}")
+
+    sizes = [parse_size(size) for size in arguments.sizes.split(',')]
+    progress = None if arguments.quiet else lambda result: print(format_result(result), flush=True)
+    results = run_benchmarks(ciphers, backends, sizes, arguments.minimum_time, progress)
+
+    if arguments.output:
+        with open(arguments.output, 'w') as file:
+            json.dump({'environment': environment(), 'results': results}, file, indent=2)
+
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            baseline = json.load(file)['results']
+
+        regressions = compare(baseline, results, arguments.tolerance)
+        for regression in regressions:
+            print(f"Regression: {format_result(regression)} ({regression['ratio']:.0%} of the baseline)", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
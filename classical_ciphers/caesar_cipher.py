@@ -51,53 +51,85 @@ Purku:
     - Korvataan salattu kirjain sillä kirjaimella, joka on lasketussa sijainnissa.
 """
 
+from functools import partial
+
+from .alphabet import get_alphabet
+from .key_schedule import key_schedules, schedule_attributes
+from .streaming import StatelessTransform
+from .translation_table import TranslationTable, build_byte_table, translate_buffer
+
+SCHEDULE_ATTRIBUTES = ('alphabet', 'reverse_alphabet', 'encoding_table', 'decoding_table', 'encoding_bytes', 'decoding_bytes')
+
+def shift_letter(character: str, shift: int, alphabet: dict, reverse_alphabet: dict) -> str:
+    if not character.isalpha():
+        return character
+
+    character = character.upper()
+    if character in alphabet:
+        new_position = (alphabet[character] + shift - 1) % len(alphabet) + 1
+        return reverse_alphabet[new_position]
+    return character
+
 class CaesarCipher:
     
-    def __init__(self, shift: int):
+    def __init__(self, shift: int, alphabet=None):
 
         self.shift = shift
+        self.letters = get_alphabet(alphabet)
+        self.__dict__.update(key_schedules.get((type(self), shift, self.letters), self.create_schedule))
+
+    def create_schedule(self) -> dict:
+        self.alphabet = {}
+        self.reverse_alphabet = {}
+        for position, letter in enumerate(self.letters, start=1):
+            self.alphabet[letter] = position
+            self.reverse_alphabet[position] = letter
+
+        encode_character = partial(shift_letter, shift=self.shift, alphabet=self.alphabet, reverse_alphabet=self.reverse_alphabet)
+        decode_character = partial(shift_letter, shift=-self.shift, alphabet=self.alphabet, reverse_alphabet=self.reverse_alphabet)
 
-        self.alphabet = {
-            'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8,
-            'I': 9, 'J': 10, 'K': 11, 'L': 12, 'M': 13, 'N': 14, 'O': 15,
-            'P': 16, 'Q': 17, 'R': 18, 'S': 19, 'T': 20, 'U': 21, 'V': 22,
-            'W': 23, 'X': 24, 'Y': 25, 'Z': 26
-        }
+        self.encoding_table = TranslationTable(encode_character, self.letters.characters)
+        self.decoding_table = TranslationTable(decode_character, self.letters.characters)
+        self.encoding_bytes = build_byte_table(encode_character) if self.letters.is_ascii else None
+        self.decoding_bytes = build_byte_table(decode_character) if self.letters.is_ascii else None
 
-        self.reverse_alphabet = {
-            1: 'A', 2: 'B', 3: 'C', 4: 'D', 5: 'E', 6: 'F', 7: 'G', 8: 'H',
-            9: 'I', 10: 'J', 11: 'K', 12: 'L', 13: 'M', 14: 'N', 15: 'O',
-            16: 'P', 17: 'Q', 18: 'R', 19: 'S', 20: 'T', 21: 'U', 22: 'V',
-            23: 'W', 24: 'X', 25: 'Y', 26: 'Z'
-        }
+        return schedule_attributes(self, SCHEDULE_ATTRIBUTES)
 
     def shift_character(self, character: str, shift: int) -> str:
         character = character.upper()
         if character in self.alphabet:
             current_position = self.alphabet[character]
-            new_position = (current_position + shift - 1) % 26 + 1
+            new_position = (current_position + shift - 1) % len(self.alphabet) + 1
             return self.reverse_alphabet[new_position]
         return character
 
+    def encode_character(self, character: str) -> str:
+        return self.encoding_table.translate_character(character)
+
+    def decode_character(self, character: str) -> str:
+        return self.decoding_table.translate_character(character)
+
     def encode(self, text: str) -> str:
-        encoded_text = []
-        for character in text:
-            if character.isalpha():
-                shifted_character = self.shift_character(character, self.shift)
-                encoded_text.append(shifted_character)
-            else:
-                encoded_text.append(character)
-        return ''.join(encoded_text)
+        return self.encoding_table.translate(text)
 
     def decode(self, text: str) -> str:
-        decoded_text = []
-        for character in text:
-            if character.isalpha():
-                shifted_character = self.shift_character(character, -self.shift)
-                decoded_text.append(shifted_character)
-            else:
-                decoded_text.append(character)
-        return ''.join(decoded_text)
+        return self.decoding_table.translate(text)
+
+    def translate_buffer(self, buffer, encrypt: bool = True, offset: int = 0, destination=None) -> int:
+        translate_buffer(buffer, self.encoding_bytes if encrypt else self.decoding_bytes, destination)
+        return offset
+
+    def encode_into(self, buffer, destination=None, offset: int = 0) -> int:
+        return self.translate_buffer(buffer, True, offset, destination)
+
+    def decode_into(self, buffer, destination=None, offset: int = 0) -> int:
+        return self.translate_buffer(buffer, False, offset, destination)
+
+    def encoder(self):
+        return StatelessTransform(self.encode)
+
+    def decoder(self):
+        return StatelessTransform(self.decode)
 
 if __name__ == "__main__":
 
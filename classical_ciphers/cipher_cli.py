@@ -0,0 +1,165 @@
+'''
+The command-line interface encrypts or decrypts a stream with any of the ciphers in this repository.
+
+Usage:
+    - python -m classical_ciphers encrypt --cipher vigenere --key KEY < plain.txt > cipher.txt;
+    - python -m classical_ciphers decrypt --cipher hill --key "5,8;17,3" --input cipher.txt --output plain.txt;
+    - Keys are given as text:
+        - Caesar and Rail Fence take an integer;
+        - Affine takes two integers "a,b";
+        - Hill takes the matrix rows separated by ";" and the values by ",";
+        - Vigenère, Beaufort, Gronsfeld and Playfair take a keyword;
+        - Atbash, Polybius and polybius-fixed, the Polybius square without separators, take no key.
+    - --alphabet russian, finnish or the letters of a custom alphabet changes the alphabet of Caesar, Affine, Atbash, Vigenère, Beaufort, Gronsfeld and Hill, which is Latin by default;
+    - The input is read in large chunks of UTF-8 text and passed through the cipher's streaming encoder or decoder; input that is not valid UTF-8 is reported as a usage error;
+    - A cipher that cannot process the input, such as Playfair meeting a character outside its square or Affine a letter outside its alphabet, is reported as a usage error too;
+    - The output is written as soon as it is produced, and the throughput is reported on standard error;
+    - An --output file is written to a temporary file beside it and renamed over it only when the whole input has been processed, so a failed run leaves an existing file untouched.
+
+Интерфейс командной строки шифрует или расшифровывает поток любым из шифров этого репозитория.
+
+Использование:
+    - python -m classical_ciphers encrypt --cipher vigenere --key KEY < plain.txt > cipher.txt;
+    - python -m classical_ciphers decrypt --cipher hill --key "5,8;17,3" --input cipher.txt --output plain.txt;
+    - Ключи задаются текстом:
+        - Цезарь и «Железнодорожная изгородь» принимают целое число;
+        - Аффинный шифр принимает два целых числа "a,b";
+        - Шифр Хилла принимает строки матрицы, разделённые ";", и значения, разделённые ",";
+        - Виженер, Бофорт, Гронсфельд и Плейфер принимают ключевое слово;
+        - Атбаш, Полибий и polybius-fixed, квадрат Полибия без разделителей, не требуют ключа.
+    - --alphabet russian, finnish или буквы собственного алфавита меняет алфавит Цезаря, аффинного шифра, Атбаш, Виженера, Бофорта, Гронсфельда и Хилла, по умолчанию латинский;
+    - Входные данные читаются большими частями текста UTF-8 и передаются потоковому кодировщику или декодировщику шифра; данные, не являющиеся корректным UTF-8, сообщаются как ошибка использования;
+    - Шифр, который не может обработать входные данные, например Плейфер, встретивший символ вне своего квадрата, или аффинный шифр - букву вне своего алфавита, также сообщается как ошибка использования;
+    - Результат записывается сразу по мере получения, а скорость обработки выводится в стандартный поток ошибок;
+    - Файл --output записывается во временный файл рядом с ним и переименовывается поверх него только после обработки всех входных данных, поэтому неудачный запуск оставляет существующий файл нетронутым.
+
+Komentorivikäyttöliittymä salaa tai purkaa virran millä tahansa tämän repositorion salauksella.
+
+Käyttö:
+    - python -m classical_ciphers encrypt --cipher vigenere --key KEY < plain.txt > cipher.txt;
+    - python -m classical_ciphers decrypt --cipher hill --key "5,8;17,3" --input cipher.txt --output plain.txt;
+    - Avaimet annetaan tekstinä:
+        - Caesar ja aitasalaus ottavat kokonaisluvun;
+        - Affiini salaus ottaa kaksi kokonaislukua "a,b";
+        - Hill ottaa matriisin rivit ";"-merkillä ja arvot ","-merkillä erotettuina;
+        - Vigenère, Beaufort, Gronsfeld ja Playfair ottavat avainsanan;
+        - Atbash, Polybios ja polybius-fixed, Polybioksen neliö ilman erottimia, eivät tarvitse avainta.
+    - --alphabet russian, finnish tai oman aakkoston kirjaimet vaihtaa Caesarin, affiinin salauksen, Atbashin, Vigenèren, Beaufortin, Gronsfeldin ja Hillin aakkoston, joka on oletuksena latinalainen;
+    - Syöte luetaan suurina UTF-8-tekstin osina ja annetaan salauksen virtakooderille tai -dekooderille; syöte, joka ei ole kelvollista UTF-8:aa, ilmoitetaan käyttövirheenä;
+    - Salaus, joka ei pysty käsittelemään syötettä, kuten Playfair neliönsä ulkopuolisen merkin tai affiini salaus aakkostonsa ulkopuolisen kirjaimen kohdatessaan, ilmoitetaan myös käyttövirheenä;
+    - Tulos kirjoitetaan heti sen valmistuttua, ja käsittelynopeus tulostetaan virhevirtaan;
+    - --output-tiedosto kirjoitetaan sen viereen väliaikaiseen tiedostoon, joka nimetään sen päälle vasta, kun koko syöte on käsitelty, joten epäonnistunut ajo jättää olemassa olevan tiedoston koskemattomaksi.
+'''
+
+import argparse
+import codecs
+import os
+import stat
+import sys
+import time
+
+from .registry import CIPHERS, create_cipher
+from .streaming import DEFAULT_CHUNK_SIZE
+
+def read_chunks(stream, chunk_size: int, statistics: dict):
+    decoder = codecs.getincrementaldecoder('utf-8')()
+
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        statistics['bytes'] += len(data)
+        yield decoder.decode(data)
+
+    yield decoder.decode(b'', final=True)
+
+def run(cipher, operation: str, input_stream, output_stream, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    transform = cipher.encoder() if operation == 'encrypt' else cipher.decoder()
+    statistics = {'bytes': 0, 'seconds': 0.0}
+    start = time.perf_counter()
+
+    for chunk in read_chunks(input_stream, chunk_size, statistics):
+        result = transform.update(chunk)
+        if result:
+            output_stream.write(result.encode('utf-8'))
+
+    for result in transform.finalize_chunks(chunk_size):
+        output_stream.write(result.encode('utf-8'))
+
+    output_stream.flush()
+    statistics['seconds'] = time.perf_counter() - start
+    return statistics
+
+def open_output(path: str):
+    # Devices and pipes, such as /dev/null, are written in place: only a regular file can be replaced by a rename.
+    if os.path.exists(path) and not os.path.isfile(path):
+        return open(path, 'wb')
+
+    from tempfile import NamedTemporaryFile
+    target = os.path.realpath(path)
+    return NamedTemporaryFile('wb', dir=os.path.dirname(target), prefix=f'.{os.path.basename(target)}.', suffix='.tmp', delete=False)
+
+def output_mode(path: str) -> int:
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+def close_output(output_stream, path: str, completed: bool):
+    output_stream.close()
+    if output_stream.name == path:
+        return
+
+    if completed:
+        target = os.path.realpath(path)
+        os.chmod(output_stream.name, output_mode(target))
+        os.replace(output_stream.name, target)
+    else:
+        os.unlink(output_stream.name)
+
+def main(arguments: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Encrypt or decrypt a stream with a classical cipher.")
+    parser.add_argument('operation', choices=['encrypt', 'decrypt'])
+    parser.add_argument('--cipher', required=True, choices=sorted(CIPHERS))
+    parser.add_argument('--key')
+    parser.add_argument('--alphabet', help="latin, russian, finnish or the letters of a custom alphabet")
+    parser.add_argument('--input', help="input file, standard input by default")
+    parser.add_argument('--output', help="output file, standard output by default")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--quiet', action='store_true', help="do not report the throughput")
+    arguments = parser.parse_args(arguments)
+
+    try:
+        cipher = create_cipher(arguments.cipher, arguments.key, arguments.alphabet)
+    except ValueError as error:
+        parser.error(str(error))
+
+    input_stream = open(arguments.input, 'rb') if arguments.input else sys.stdin.buffer
+    output_stream = open_output(arguments.output) if arguments.output else sys.stdout.buffer
+    completed = False
+
+    try:
+        statistics = run(cipher, arguments.operation, input_stream, output_stream, arguments.chunk_size)
+        completed = True
+    except UnicodeDecodeError as error:
+        parser.error(f"The input is not valid UTF-8 text: {error.reason}!")
+    except KeyError as error:
+        parser.error(f"The input contains a character that the cipher cannot process: {error}!")
+    except ValueError as error:
+        parser.error(f"The input cannot be {arguments.operation}ed: {error}")
+    finally:
+        if arguments.input:
+            input_stream.close()
+        if arguments.output:
+            close_output(output_stream, arguments.output, completed)
+
+    if not arguments.quiet:
+        seconds = max(statistics['seconds'], 1e-9)
+        print(f"Processed {statistics['bytes']} bytes in {seconds:.3f} s ({statistics['bytes'] / seconds:,.0f} bytes/s)", file=sys.stderr)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,427 @@
+'''
+The cipher service encrypts and decrypts texts for clients over TCP, with any of the ciphers in this repository, and batches requests that arrive together.
+
+Protocol:
+    - Every request and every response is one line of JSON;
+    - A request contains an id, the cipher name, the key as accepted by the command line, the operation ("encrypt" or "decrypt"), the text and optionally the alphabet;
+    - A response contains the same id and either the result or an error;
+    - Requests on one connection may be sent without waiting for the responses, which can arrive in any order.
+
+Batching:
+    - Requests with the same cipher, key, alphabet and operation are queued together for a short time;
+    - The queue is processed in a single call when it is full or when the delay expires;
+    - Caesar, Atbash and Affine substitute letter by letter, so the texts of a batch are joined, translated at once and split again; if the translation changes the length, as 'ß' becoming 'SS' does, or fails, each text is translated on its own;
+    - A cipher with a batch mode, Rail Fence with encode_many, Vigenère with encrypt_many or Beaufort with encode_many, processes the whole batch in one vectorized call; if that call fails, each text is processed on its own;
+    - The other ciphers process the texts of a batch one after another, and an error in one text is returned for that request alone;
+    - Cipher instances are kept in a cache, so the key schedule is built only for the first request with a key;
+    - Small batches are processed in the event loop, large ones in a process pool, so the loop is never blocked by a long computation.
+
+Load generator:
+    - Opens several connections, each with many requests in flight, and measures the latency of every request;
+    - Reports the throughput and the latency percentiles, including p99;
+    - "python -m classical_ciphers.cipher_service bench" starts a server and the load generator in the same process on localhost.
+
+Служба шифрования зашифровывает и расшифровывает тексты для клиентов по TCP любым из шифров этого репозитория и объединяет в пакеты запросы, пришедшие одновременно.
+
+Протокол:
+    - Каждый запрос и каждый ответ - это одна строка JSON;
+    - Запрос содержит идентификатор, имя шифра, ключ в том виде, в каком его принимает командная строка, операцию ("encrypt" или "decrypt"), текст и при необходимости алфавит;
+    - Ответ содержит тот же идентификатор и либо результат, либо ошибку;
+    - Запросы в одном соединении можно отправлять, не дожидаясь ответов, которые могут приходить в любом порядке.
+
+Пакетная обработка:
+    - Запросы с одинаковыми шифром, ключом, алфавитом и операцией некоторое время собираются в общую очередь;
+    - Очередь обрабатывается одним вызовом, когда она заполнена или когда истекает задержка;
+    - Цезарь, Атбаш и аффинный шифр заменяют буквы по одной, поэтому тексты пакета объединяются, переводятся за один раз и снова разделяются; если перевод меняет длину, как 'ß', превращающаяся в 'SS', или завершается ошибкой, каждый текст переводится отдельно;
+    - Шифр с пакетным режимом: «Железнодорожная изгородь» с encode_many, Виженер с encrypt_many или Бофорт с encode_many, обрабатывает весь пакет одним векторизованным вызовом; если этот вызов завершается ошибкой, каждый текст обрабатывается отдельно;
+    - Остальные шифры обрабатывают тексты пакета один за другим, а ошибка в одном тексте возвращается только для этого запроса;
+    - Экземпляры шифров хранятся в кэше, поэтому расписание ключа строится только для первого запроса с этим ключом;
+    - Небольшие пакеты обрабатываются в цикле событий, большие - в пуле процессов, поэтому цикл никогда не блокируется долгими вычислениями.
+
+Генератор нагрузки:
+    - Открывает несколько соединений, в каждом из которых одновременно выполняется много запросов, и измеряет задержку каждого запроса;
+    - Сообщает пропускную способность и процентили задержки, включая p99;
+    - "python -m classical_ciphers.cipher_service bench" запускает сервер и генератор нагрузки в одном процессе на localhost.
+
+Salauspalvelu salaa ja purkaa tekstejä asiakkaille TCP:n kautta millä tahansa tämän repositorion salauksella ja kokoaa yhtä aikaa saapuvat pyynnöt eriksi.
+
+Protokolla:
+    - Jokainen pyyntö ja jokainen vastaus on yksi JSON-rivi;
+    - Pyyntö sisältää tunnisteen, salauksen nimen, avaimen komentorivin hyväksymässä muodossa, toiminnon ("encrypt" tai "decrypt"), tekstin ja valinnaisesti aakkoston;
+    - Vastaus sisältää saman tunnisteen ja joko tuloksen tai virheen;
+    - Saman yhteyden pyyntöjä voi lähettää odottamatta vastauksia, jotka voivat saapua missä järjestyksessä tahansa.
+
+Eräkäsittely:
+    - Pyynnöt, joilla on sama salaus, avain, aakkosto ja toiminto, kootaan hetkeksi samaan jonoon;
+    - Jono käsitellään yhdellä kutsulla, kun se on täynnä tai kun viive päättyy;
+    - Caesar, Atbash ja affiini salaus korvaavat kirjaimet yksitellen, joten erän tekstit yhdistetään, käännetään kerralla ja jaetaan uudelleen; jos käännös muuttaa pituutta, kuten 'ß' muuttuessaan 'SS':ksi, tai epäonnistuu, jokainen teksti käännetään erikseen;
+    - Salaus, jolla on erätila, aitasalaus encode_many-metodilla, Vigenère encrypt_many-metodilla tai Beaufort encode_many-metodilla, käsittelee koko erän yhdellä vektoroidulla kutsulla; jos kutsu epäonnistuu, jokainen teksti käsitellään erikseen;
+    - Muut salaukset käsittelevät erän tekstit yksi kerrallaan, ja yhden tekstin virhe palautetaan vain sille pyynnölle;
+    - Salausolioita säilytetään välimuistissa, joten avainaikataulu rakennetaan vain avaimen ensimmäiselle pyynnölle;
+    - Pienet erät käsitellään tapahtumasilmukassa ja suuret prosessipoolissa, joten pitkä laskenta ei koskaan pysäytä silmukkaa.
+
+Kuormageneraattori:
+    - Avaa useita yhteyksiä, joista jokaisessa on käynnissä monta pyyntöä, ja mittaa jokaisen pyynnön viiveen;
+    - Raportoi läpäisykyvyn ja viiveen persentiilit, myös p99:n;
+    - "python -m classical_ciphers.cipher_service bench" käynnistää palvelimen ja kuormageneraattorin samassa prosessissa localhostissa.
+'''
+
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from .batch import cipher_function, many_function
+from .registry import CIPHERS, create_cipher
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+BATCH_DELAY = 0.002
+MAXIMUM_BATCH_SIZE = 256
+INLINE_BATCH_LENGTH = 1 << 14
+CIPHER_CACHE_SIZE = 256
+SUBSTITUTION_CIPHERS = {'affine', 'atbash', 'caesar'}
+OPERATIONS = ('encrypt', 'decrypt')
+
+@lru_cache(maxsize=CIPHER_CACHE_SIZE)
+def cached_cipher(name: str, key: str, alphabet: str = None):
+    return create_cipher(name, key, alphabet)
+
+def transform_texts(function, texts: list) -> list:
+    results = []
+    for text in texts:
+        try:
+            results.append(function(text))
+        except Exception as error:
+            results.append(error)
+    return results
+
+def transform_batch(name: str, key: str, alphabet: str, operation: str, texts: list) -> list:
+    cipher = cached_cipher(name, key, alphabet)
+    function = cipher_function(cipher, operation == 'decrypt')
+
+    batch_function = many_function(cipher, operation == 'decrypt')
+    if batch_function is not None:
+        try:
+            return batch_function(texts)
+        except Exception:
+            return transform_texts(function, texts)
+
+    if name not in SUBSTITUTION_CIPHERS:
+        return transform_texts(function, texts)
+
+    try:
+        joined_text = function(''.join(texts))
+    except Exception:
+        return transform_texts(function, texts)
+
+    # Case mappings such as 'ß' to 'SS' change the length, and the joined result can no longer be split.
+    if len(joined_text) != sum(map(len, texts)):
+        return transform_texts(function, texts)
+
+    results = []
+    start = 0
+    for text in texts:
+        results.append(joined_text[start:start + len(text)])
+        start += len(text)
+    return results
+
+class RequestBatcher:
+
+    def __init__(self, service, batch_key: tuple):
+        self.service = service
+        self.batch_key = batch_key
+        self.texts = []
+        self.futures = []
+        self.timer = None
+
+    def add(self, text: str) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self.texts.append(text)
+        self.futures.append(future)
+
+        if len(self.texts) >= self.service.maximum_batch_size:
+            self.flush()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.service.batch_delay, self.flush)
+
+        return future
+
+    def flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        if self.texts:
+            texts, futures = self.texts, self.futures
+            self.texts, self.futures = [], []
+            asyncio.ensure_future(self.service.process_batch(self.batch_key, texts, futures))
+
+class CipherService:
+
+    def __init__(self, executor=None, batch_delay: float = BATCH_DELAY, maximum_batch_size: int = MAXIMUM_BATCH_SIZE,
+                 inline_batch_length: int = INLINE_BATCH_LENGTH):
+        self.executor = executor
+        self.batch_delay = batch_delay
+        self.maximum_batch_size = maximum_batch_size
+        self.inline_batch_length = inline_batch_length
+        self.batchers = {}
+        self.connections = set()
+        self.statistics = {'requests': 0, 'batches': 0, 'offloaded_batches': 0, 'errors': 0}
+
+    async def transform(self, name: str, key: str, operation: str, text: str, alphabet: str = None) -> str:
+        if name not in CIPHERS:
+            raise ValueError(f"Unknown cipher: {name}!")
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation}!")
+        if not isinstance(text, str):
+            raise ValueError("The text must be a string!")
+
+        # Building the cipher here reports a bad key for this request alone, not for its whole batch.
+        cached_cipher(name, key, alphabet)
+
+        batch_key = (name, key, alphabet, operation)
+        if batch_key not in self.batchers:
+            self.batchers[batch_key] = RequestBatcher(self, batch_key)
+        return await self.batchers[batch_key].add(text)
+
+    async def process_batch(self, batch_key: tuple, texts: list, futures: list):
+        self.statistics['batches'] += 1
+
+        try:
+            if self.executor is not None and sum(len(text) for text in texts) > self.inline_batch_length:
+                self.statistics['offloaded_batches'] += 1
+                results = await asyncio.get_running_loop().run_in_executor(self.executor, transform_batch, *batch_key, texts)
+            else:
+                results = transform_batch(*batch_key, texts)
+        except Exception as error:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def handle_request(self, line: bytes, writer: asyncio.StreamWriter):
+        request_id = None
+        try:
+            request = json.loads(line)
+            if isinstance(request, dict):
+                request_id = request.get('id')
+            result = await self.transform(request['cipher'], request.get('key'), request['operation'], request['text'], request.get('alphabet'))
+            response = {'id': request_id, 'result': result}
+        except Exception as error:
+            self.statistics['errors'] += 1
+            response = {'id': request_id, 'error': f"{type(error).__name__}: {error}"}
+
+        writer.write(json.dumps(response).encode('utf-8') + b'\n')
+        await writer.drain()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = asyncio.current_task()
+        self.connections.add(connection)
+        tasks = set()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                self.statistics['requests'] += 1
+                task = asyncio.ensure_future(self.handle_request(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            self.connections.discard(connection)
+            writer.close()
+
+    async def wait_connections_closed(self):
+        if self.connections:
+            await asyncio.gather(*self.connections, return_exceptions=True)
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, limit: int = 1 << 24):
+        return await asyncio.start_server(self.handle_connection, host, port, limit=limit)
+
+class ServiceClient:
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}
+        self.identifiers = itertools.count()
+        self.receiver = asyncio.ensure_future(self.receive())
+
+    @classmethod
+    async def connect(cls, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, limit: int = 1 << 24):
+        reader, writer = await asyncio.open_connection(host, port, limit=limit)
+        return cls(reader, writer)
+
+    async def receive(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+
+            response = json.loads(line)
+            future = self.pending.pop(response['id'], None)
+            if future is None:
+                continue
+            if 'error' in response:
+                future.set_exception(ValueError(response['error']))
+            else:
+                future.set_result(response['result'])
+
+        for future in self.pending.values():
+            future.set_exception(ConnectionError("The connection was closed!"))
+        self.pending.clear()
+
+    async def request(self, cipher: str, key: str, operation: str, text: str, alphabet: str = None) -> str:
+        request_id = next(self.identifiers)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+
+        request = {'id': request_id, 'cipher': cipher, 'key': key, 'operation': operation, 'text': text}
+        if alphabet is not None:
+            request['alphabet'] = alphabet
+        self.writer.write(json.dumps(request).encode('utf-8') + b'\n')
+        await self.writer.drain()
+        return await future
+
+    async def encrypt(self, cipher: str, key: str, text: str, alphabet: str = None) -> str:
+        return await self.request(cipher, key, 'encrypt', text, alphabet)
+
+    async def decrypt(self, cipher: str, key: str, text: str, alphabet: str = None) -> str:
+        return await self.request(cipher, key, 'decrypt', text, alphabet)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.receiver
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(fraction * len(sorted_values)), len(sorted_values) - 1)]
+
+async def generate_load(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, connections: int = 16, requests: int = 1000,
+                        concurrency: int = 32, cipher: str = 'vigenere', key: str = 'LEMON', text_size: int = 256) -> dict:
+    generator = random.Random(0)
+    text = ''.join(generator.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ ') for _ in range(text_size))
+    latencies = []
+
+    async def run_connection(client: ServiceClient, count: int):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def timed_request():
+            async with semaphore:
+                start = time.perf_counter()
+                await client.encrypt(cipher, key, text)
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(timed_request() for _ in range(count)))
+
+    clients = [await ServiceClient.connect(host, port) for _ in range(connections)]
+    counts = [requests // connections + (index < requests % connections) for index in range(connections)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_connection(client, count) for client, count in zip(clients, counts)))
+    seconds = time.perf_counter() - start
+
+    for client in clients:
+        await client.close()
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'seconds': seconds,
+        'requests_per_second': len(latencies) / max(seconds, 1e-9),
+        'characters_per_second': len(latencies) * text_size / max(seconds, 1e-9),
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p90_ms': percentile(latencies, 0.90) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': (latencies[-1] if latencies else 0.0) * 1000,
+    }
+
+def print_report(report: dict):
+    print(f"{report['requests']} requests in {report['seconds']:.3f} s: {report['requests_per_second']:,.0f} requests/s, "
+          f"{report['characters_per_second']:,.0f} characters/s")
+    print(f"Latency: p50 {report['p50_ms']:.2f} ms, p90 {report['p90_ms']:.2f} ms, p99 {report['p99_ms']:.2f} ms, max {report['max_ms']:.2f} ms")
+
+def create_executor(workers: int) -> ProcessPoolExecutor:
+    # Forked workers would inherit the open sockets and keep closed connections alive.
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+async def serve(host: str, port: int, workers: int):
+    with create_executor(workers) as executor:
+        server = await CipherService(executor).start(host, port)
+        async with server:
+            await server.serve_forever()
+
+async def bench(arguments) -> dict:
+    with create_executor(arguments.workers) as executor:
+        service = CipherService(executor)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(executor, cached_cipher, arguments.cipher, arguments.key) for _ in range(arguments.workers)))
+
+        server = await service.start(DEFAULT_HOST, 0)
+        port = server.sockets[0].getsockname()[1]
+
+        async with server:
+            report = await generate_load(DEFAULT_HOST, port, arguments.connections, arguments.requests, arguments.concurrency,
+                                         arguments.cipher, arguments.key, arguments.text_size)
+            await service.wait_connections_closed()
+
+    report['batches'] = service.statistics['batches']
+    report['offloaded_batches'] = service.statistics['offloaded_batches']
+    return report
+
+def main(arguments: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the classical ciphers over TCP, or measure the service under load.")
+    parser.add_argument('mode', choices=['serve', 'load', 'bench'])
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--connections', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=10000)
+    parser.add_argument('--concurrency', type=int, default=32, help="requests in flight per connection")
+    parser.add_argument('--cipher', default='vigenere', choices=sorted(CIPHERS))
+    parser.add_argument('--key', default='LEMON')
+    parser.add_argument('--text-size', type=int, default=256)
+    arguments = parser.parse_args(arguments)
+
+    if arguments.mode == 'serve':
+        try:
+            asyncio.run(serve(arguments.host, arguments.port, arguments.workers))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if arguments.mode == 'load':
+        report = asyncio.run(generate_load(arguments.host, arguments.port, arguments.connections, arguments.requests,
+                                           arguments.concurrency, arguments.cipher, arguments.key, arguments.text_size))
+    else:
+        report = asyncio.run(bench(arguments))
+        print(f"{report['batches']} batches, {report['offloaded_batches']} processed in the pool")
+
+    print_report(report)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
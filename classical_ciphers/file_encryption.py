@@ -0,0 +1,92 @@
+'''
+File encryption rewrites a file through a memory mapping, window by window, for the ciphers that keep the length of the text: Caesar, Atbash, Affine, Vigenère and Beaufort.
+
+Processing:
+    - Map the source file into memory;
+    - Either rewrite it in place, or create an output file of the same size and map it as well;
+    - For each fixed-size window:
+        - Translate the bytes of the window in place, or straight from the source mapping into the output mapping;
+        - Carry the keystream position over to the next window.
+    - The file is treated as ASCII text: other bytes are left unchanged and do not consume the key;
+    - The cipher and its alphabet are checked before the output file is opened, so a cipher that cannot translate bytes leaves an existing file untouched.
+
+Шифрование файлов переписывает файл через отображение в память, окно за окном, для шифров, сохраняющих длину текста: Цезаря, Атбаш, аффинного, Виженера и Бофорта.
+
+Обработка:
+    - Исходный файл отображается в память;
+    - Он либо переписывается на месте, либо создаётся выходной файл того же размера, который также отображается в память;
+    - Для каждого окна фиксированного размера:
+        - Байты окна переводятся на месте либо прямо из исходного отображения в выходное;
+        - Позиция в потоке ключа переносится в следующее окно.
+    - Файл рассматривается как текст ASCII: остальные байты не изменяются и не расходуют ключ;
+    - Шифр и его алфавит проверяются до открытия выходного файла, поэтому шифр, не умеющий переводить байты, оставляет существующий файл нетронутым.
+
+Tiedostosalaus kirjoittaa tiedoston uudelleen muistikuvauksen kautta ikkuna kerrallaan niille salauksille, jotka säilyttävät tekstin pituuden: Caesar, Atbash, affiini, Vigenère ja Beaufort.
+
+Käsittely:
+    - Lähdetiedosto kuvataan muistiin;
+    - Se joko kirjoitetaan uudelleen paikallaan tai luodaan samankokoinen tulostiedosto, joka myös kuvataan muistiin;
+    - Jokaiselle kiinteän kokoiselle ikkunalle:
+        - Ikkunan tavut käännetään paikallaan tai suoraan lähdetiedoston kuvauksesta tulostiedoston kuvaukseen;
+        - Avainvirran sijainti siirretään seuraavaan ikkunaan.
+    - Tiedostoa käsitellään ASCII-tekstinä: muut tavut jätetään ennalleen eivätkä ne kuluta avainta;
+    - Salaus ja sen aakkosto tarkistetaan ennen tulostiedoston avaamista, joten salaus, joka ei osaa kääntää tavuja, jättää olemassa olevan tiedoston koskematta.
+'''
+
+import mmap
+import os
+
+WINDOW_SIZE = 1 << 24
+
+def transform_mapping(cipher, mapping, size: int, encrypt: bool, window_size: int, source=None):
+    offset = 0
+
+    with memoryview(mapping) as view:
+        for start in range(0, size, window_size):
+            end = min(start + window_size, size)
+
+            with view[start:end] as window:
+                if source is not None:
+                    with memoryview(source)[start:end] as source_window:
+                        offset = cipher.translate_buffer(source_window, encrypt, offset, window)
+                else:
+                    offset = cipher.translate_buffer(window, encrypt, offset)
+
+    mapping.flush()
+
+def check_cipher(cipher, encrypt: bool):
+    if not hasattr(cipher, 'translate_buffer'):
+        raise TypeError(f"{type(cipher).__name__} does not keep the length of the text and cannot rewrite a file!")
+
+    # An empty buffer goes through the same checks as a file, such as the alphabet, without writing anything.
+    cipher.translate_buffer(bytearray(), encrypt)
+
+def transform_file(cipher, source_path: str, destination_path: str = None, encrypt: bool = True, window_size: int = WINDOW_SIZE) -> int:
+    check_cipher(cipher, encrypt)
+
+    if destination_path is None:
+        with open(source_path, 'r+b') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                return 0
+
+            with mmap.mmap(file.fileno(), 0) as mapping:
+                transform_mapping(cipher, mapping, size, encrypt, window_size)
+        return size
+
+    with open(source_path, 'rb') as source_file, open(destination_path, 'w+b') as destination_file:
+        size = os.fstat(source_file.fileno()).st_size
+        destination_file.truncate(size)
+        if size == 0:
+            return 0
+
+        with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as source_mapping:
+            with mmap.mmap(destination_file.fileno(), 0) as destination_mapping:
+                transform_mapping(cipher, destination_mapping, size, encrypt, window_size, source_mapping)
+    return size
+
+def encrypt_file(cipher, source_path: str, destination_path: str = None, window_size: int = WINDOW_SIZE) -> int:
+    return transform_file(cipher, source_path, destination_path, True, window_size)
+
+def decrypt_file(cipher, source_path: str, destination_path: str = None, window_size: int = WINDOW_SIZE) -> int:
+    return transform_file(cipher, source_path, destination_path, False, window_size)
@@ -66,24 +66,31 @@ Purku:
         - Korvataan salattu kirjain sillä kirjaimella, joka on lasketussa sijainnissa.
 '''
 
+from functools import partial
+
+from .alphabet import get_alphabet
+from .streaming import KeystreamTransform
+from .vectorized_keystream import apply_keystream, is_vectorizable
+
 class GronsfeldCipher:
 
-    def __init__(self, keyword: str):
+    def __init__(self, keyword: str, alphabet=None):
+        self.letters = get_alphabet(alphabet)
         self.keyword = []
         for digit in keyword:
             self.keyword.append(int(digit))
 
     def shift_character(self, character: str, shift: int, encrypt: bool) -> str:
         if character.isalpha():
-            alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+            alphabet = self.letters.uppercase
             character = character.upper()
 
             current_position = alphabet.index(character)
 
             if encrypt:
-                new_position = (current_position + shift) % 26
+                new_position = (current_position + shift) % len(alphabet)
             else:
-                new_position = (current_position - shift) % 26
+                new_position = (current_position - shift) % len(alphabet)
 
             return alphabet[new_position]
 
@@ -97,39 +104,35 @@ class GronsfeldCipher:
 
         return ''.join(formatted_text)
 
-    def encrypt(self, text: str) -> str:
+    def process_chunk(self, text: str, encrypt: bool, offset: int = 0) -> tuple:
+        if is_vectorizable(text, self.keyword):
+            shifts = self.keyword if encrypt else [-shift for shift in self.keyword]
+            result = apply_keystream(text, shifts, letters_only=True, offset=offset, alphabet=self.letters)
+            if result is not None:
+                return result
+
         text = self.format_text(text)
-        ciphertext = []
+        result = []
 
-        full_repeats = len(text) // len(self.keyword)
-        remainder = len(text) % len(self.keyword)
-        repeated_keyword = self.keyword * full_repeats
-        repeated_keyword += self.keyword[:remainder]
-        keyword_repeated = repeated_keyword
+        for i, character in enumerate(text, start=offset):
+            shift = self.keyword[i % len(self.keyword)]
+            result.append(self.shift_character(character, shift, encrypt))
 
-        for i, character in enumerate(text):
-            shift = keyword_repeated[i]
-            encrypted_character = self.shift_character(character, shift, encrypt=True)
-            ciphertext.append(encrypted_character)
+        return ''.join(result), offset + len(text)
 
-        return ''.join(ciphertext)
+    def encrypt(self, text: str) -> str:
+        ciphertext, _ = self.process_chunk(text, encrypt=True)
+        return ciphertext
 
     def decrypt(self, text: str) -> str:
-        ciphertext = self.format_text(text)
-        plaintext = []
-
-        full_repeats = len(ciphertext) // len(self.keyword)
-        remainder = len(ciphertext) % len(self.keyword)
-        repeated_keyword = self.keyword * full_repeats
-        repeated_keyword += self.keyword[:remainder]
-        keyword_repeated = repeated_keyword
+        plaintext, _ = self.process_chunk(text, encrypt=False)
+        return plaintext
 
-        for i, character in enumerate(ciphertext):
-            shift = keyword_repeated[i]
-            decrypted_char = self.shift_character(character, shift, encrypt=False)
-            plaintext.append(decrypted_char)
+    def encoder(self):
+        return KeystreamTransform(partial(self.process_chunk, encrypt=True))
 
-        return ''.join(plaintext)
+    def decoder(self):
+        return KeystreamTransform(partial(self.process_chunk, encrypt=False))
 
 if __name__ == "__main__":
 
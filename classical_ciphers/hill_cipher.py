@@ -60,43 +60,53 @@ Purku:
         - Muutetaan saadut numerot takaisin kirjaimiksi.
 '''
 
+from .alphabet import LATIN, get_alphabet
+from .backends import numpy
+from .key_schedule import key_schedules, schedule_attributes
+from .modular_arithmetic import extended_gcd, matrix_inverse, modular_inverse
+from .streaming import BlockTransform
+
+MINIMUM_VECTORIZED_LENGTH = 256
+SCHEDULE_ATTRIBUTES = ('inverse_key_matrix',)
+NUMPY_SCHEDULE_ATTRIBUTES = ('key_array', 'inverse_key_array')
+
 class HillCipher:
 
-    def __init__(self, key_matrix):
+    def __init__(self, key_matrix, alphabet=None):
         self.key_matrix = key_matrix
-        self.alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        self.modulus = 26
+        self.letters = get_alphabet(alphabet)
+        self.alphabet = self.letters.uppercase
+        self.modulus = len(self.alphabet)
+        self.block_size = len(key_matrix)
+        self.padding_number = self.alphabet.index(self.letters.padding)
+        self.schedule_key = (type(self), tuple(tuple(row) for row in key_matrix), self.letters)
+        self.__dict__.update(key_schedules.get(self.schedule_key, self.create_schedule))
+
+    def create_schedule(self) -> dict:
+        self.inverse_key_matrix = self.get_inverted_matrix(self.key_matrix)
+        return schedule_attributes(self, SCHEDULE_ATTRIBUTES)
+
+    def create_key_arrays(self) -> dict:
+        self.key_array = numpy.array(self.key_matrix, dtype=numpy.int64) % self.modulus
+        self.inverse_key_array = numpy.array(self.inverse_key_matrix, dtype=numpy.int64)
+        return schedule_attributes(self, NUMPY_SCHEDULE_ATTRIBUTES)
+
+    def is_vectorizable(self, text):
+        if len(text) < MINIMUM_VECTORIZED_LENGTH or not numpy:
+            return False
+
+        if 'key_array' not in self.__dict__:
+            self.__dict__.update(key_schedules.get(self.schedule_key + ('numpy',), self.create_key_arrays))
+        return True
 
     def get_inverted_matrix(self, matrix):
-        determinant = matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
-        determinant = determinant % self.modulus
-        inverted_determinant = self.modular_inverse(determinant, self.modulus)
-
-        if inverted_determinant is None:
-            raise ValueError("Matrix is not invertible!")
-
-        inverted_matrix = [
-            [matrix[1][1] * inverted_determinant % self.modulus, (-matrix[0][1]) * inverted_determinant % self.modulus],
-            [(-matrix[1][0]) * inverted_determinant % self.modulus, matrix[0][0] * inverted_determinant % self.modulus]
-        ]
-
-        return inverted_matrix
+        return matrix_inverse(matrix, self.modulus)
 
     def modular_inverse(self, a, m):
-        gcd, inverse, _ = self.extended_gcd(a, m)
-        if gcd != 1:
-            return None
-        else:
-            return inverse % m
+        return modular_inverse(a, m)
 
     def extended_gcd(self, a, b):
-        if a == 0:
-            return b, 0, 1
-        else:
-            gcd, x1, y1 = self.extended_gcd(b % a, a)
-            x = y1 - (b // a) * x1
-            y = x1
-        return gcd, x, y
+        return extended_gcd(a, b)
 
     def text_to_numbers(self, text):
         numbers = []
@@ -106,45 +116,88 @@ class HillCipher:
         return numbers
 
     def numbers_to_text(self, numbers):
-        text = ""
+        text = []
         for number in numbers:
-            text += self.alphabet[number]
-        return text
+            text.append(self.alphabet[number])
+        return ''.join(text)
+
+    def text_to_array(self, text):
+        if self.letters != LATIN or not text.isascii():
+            indices = self.letters.to_indices(text)
+            return None if indices is None else indices.astype(numpy.int64)
+
+        codes = numpy.frombuffer(text.upper().encode('ascii'), dtype=numpy.uint8)
+        letters = (codes >= 65) & (codes <= 90)
+        return codes[letters].astype(numpy.int64) - 65
+
+    def array_to_text(self, numbers):
+        if self.letters != LATIN:
+            return self.letters.from_indices(numbers)
+        return (numbers.astype(numpy.uint8) + 65).tobytes().decode('ascii')
+
+    def vectorized_numbers(self, text):
+        if self.is_vectorizable(text):
+            return self.text_to_array(text)
+        return None
+
+    def letters_only(self, text):
+        numbers = self.vectorized_numbers(text)
+        if numbers is not None:
+            return self.array_to_text(numbers)
+        return self.numbers_to_text(self.text_to_numbers(text))
+
+    def multiply_blocks(self, matrix, numbers):
+        result = []
+        for i in range(0, len(numbers), self.block_size):
+            block = numbers[i:i + self.block_size]
+            for row in matrix:
+                value = 0
+                for key_value, number in zip(row, block):
+                    value += key_value * number
+                result.append(value % self.modulus)
+        return result
+
+    def multiply_array_blocks(self, matrix, numbers):
+        blocks = numbers.reshape(-1, self.block_size)
+        return (blocks @ matrix.T % self.modulus).ravel()
 
     def encrypt(self, text):
+        plaintext_numbers = self.vectorized_numbers(text)
+        if plaintext_numbers is not None:
+            padding = numpy.full(-len(plaintext_numbers) % self.block_size, self.padding_number)
+            plaintext_numbers = numpy.concatenate([plaintext_numbers, padding])  # Padding with the padding letter if necessary
+            return self.array_to_text(self.multiply_array_blocks(self.key_array, plaintext_numbers))
+
         plaintext_numbers = self.text_to_numbers(text)
-        ciphertext_numbers = []
-
-        if len(plaintext_numbers) % 2 != 0:
-            plaintext_numbers.append(self.alphabet.index('X'))  # Padding with 'X' if necessary
-        
-        for i in range(0, len(plaintext_numbers), 2):
-            block = plaintext_numbers[i:i + 2]
-            encrypted_block = [
-                (self.key_matrix[0][0] * block[0] + self.key_matrix[0][1] * block[1]) % self.modulus,
-                (self.key_matrix[1][0] * block[0] + self.key_matrix[1][1] * block[1]) % self.modulus
-            ]
-            ciphertext_numbers.extend(encrypted_block)
+        padding = -len(plaintext_numbers) % self.block_size
+        plaintext_numbers.extend([self.padding_number] * padding)  # Padding with the padding letter if necessary
 
+        ciphertext_numbers = self.multiply_blocks(self.key_matrix, plaintext_numbers)
         return self.numbers_to_text(ciphertext_numbers)
 
+    def check_block_length(self, numbers):
+        if len(numbers) % self.block_size != 0:
+            raise ValueError("Ciphertext length must be a multiple of the block size!")
+
     def decrypt(self, text):
-        ciphertext_numbers = self.text_to_numbers(text)
-        plaintext_numbers = []
+        ciphertext_numbers = self.vectorized_numbers(text)
+        if ciphertext_numbers is not None:
+            self.check_block_length(ciphertext_numbers)
+            plaintext_numbers = self.multiply_array_blocks(self.inverse_key_array, ciphertext_numbers)
+            decrypted_text = self.array_to_text(plaintext_numbers)
+        else:
+            ciphertext_numbers = self.text_to_numbers(text)
+            self.check_block_length(ciphertext_numbers)
+            plaintext_numbers = self.multiply_blocks(self.inverse_key_matrix, ciphertext_numbers)
+            decrypted_text = self.numbers_to_text(plaintext_numbers)
 
-        inverse_key = self.get_inverted_matrix(self.key_matrix)
+        return decrypted_text.replace(self.letters.padding, '')
 
-        for i in range(0, len(ciphertext_numbers), 2):
-            block = ciphertext_numbers[i:i + 2]
-            decrypted_block = [
-                (inverse_key[0][0] * block[0] + inverse_key[0][1] * block[1]) % self.modulus,
-                (inverse_key[1][0] * block[0] + inverse_key[1][1] * block[1]) % self.modulus
-            ]
-            plaintext_numbers.extend(decrypted_block)
-        
-        decrypted_text = self.numbers_to_text(plaintext_numbers)
+    def encoder(self):
+        return BlockTransform(self, encrypt=True)
 
-        return decrypted_text.replace('X', '')
+    def decoder(self):
+        return BlockTransform(self, encrypt=False)
 
 if __name__ == "__main__":
 
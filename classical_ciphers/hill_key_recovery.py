@@ -0,0 +1,182 @@
+'''
+The Hill key recovery finds the key matrix of a Hill ciphertext, either from aligned plaintext and ciphertext fragments or from the ciphertext alone.
+
+Known plaintext:
+    - Split both fragments into blocks of n letters;
+    - Each ciphertext block is the key matrix multiplied by the plaintext block, so n plaintext blocks with an invertible matrix determine the key;
+    - Choose n blocks that are linearly independent modulo 26 by incremental Gaussian elimination, keeping a block only if it raises the rank, so a long crib is scanned once;
+    - Solve for the key with modular Gauss-Jordan elimination and check it against all the other blocks.
+
+Ciphertext only:
+    - Every row of the inverse key matrix produces one letter of every plaintext block from the ciphertext block alone;
+    - So the rows can be scored independently: for every possible row, count the letters it produces and score the histogram against English;
+    - Only the distinct ciphertext blocks are multiplied, each weighted by how often it occurs;
+    - The best rows that form an invertible matrix are combined, and their order is chosen by the most common English bigrams;
+    - The rows are scored in chunks, which can be spread over a process pool.
+
+Восстановление ключа Хилла находит матрицу ключа шифртекста Хилла по выровненным фрагментам открытого текста и шифртекста либо только по шифртексту.
+
+Известный открытый текст:
+    - Оба фрагмента разбиваются на блоки по n букв;
+    - Каждый блок шифртекста - это матрица ключа, умноженная на блок открытого текста, поэтому n блоков открытого текста с обратимой матрицей определяют ключ;
+    - Выбираются n блоков, линейно независимых по модулю 26, пошаговым методом Гаусса: блок сохраняется, только если он повышает ранг, поэтому длинный известный текст просматривается один раз;
+    - Ключ находится модульным методом Гаусса-Жордана и проверяется на всех остальных блоках.
+
+Только шифртекст:
+    - Каждая строка обратной матрицы ключа даёт одну букву каждого блока открытого текста только по блоку шифртекста;
+    - Поэтому строки можно оценивать независимо: для каждой возможной строки подсчитываются получаемые буквы, а гистограмма сравнивается с английским языком;
+    - Умножаются только различные блоки шифртекста, каждый с весом, равным числу его повторений;
+    - Лучшие строки, образующие обратимую матрицу, объединяются, а их порядок выбирается по самым частым английским биграммам;
+    - Строки оцениваются частями, которые можно распределить по пулу процессов.
+
+Hill-avaimen selvitys löytää Hill-salatekstin avainmatriisin joko kohdistetuista selväteksti- ja salatekstikatkelmista tai pelkästä salatekstistä.
+
+Tunnettu selväteksti:
+    - Molemmat katkelmat jaetaan n kirjaimen lohkoihin;
+    - Jokainen salatekstilohko on avainmatriisi kerrottuna selvätekstilohkolla, joten n selvätekstilohkoa kääntyvällä matriisilla määrää avaimen;
+    - Valitaan n lohkoa, jotka ovat lineaarisesti riippumattomia modulo 26, askeltavalla Gaussin eliminoinnilla: lohko säilytetään vain, jos se kasvattaa astetta, joten pitkä tunnettu teksti käydään läpi kerran;
+    - Avain ratkaistaan modulaarisella Gauss-Jordan-eliminoinnilla ja tarkistetaan kaikilla muilla lohkoilla.
+
+Pelkkä salateksti:
+    - Käänteisen avainmatriisin jokainen rivi tuottaa jokaisen selvätekstilohkon yhden kirjaimen pelkästä salatekstilohkosta;
+    - Siksi rivit voidaan pisteyttää toisistaan riippumatta: jokaiselle mahdolliselle riville lasketaan sen tuottamat kirjaimet ja histogrammia verrataan englantiin;
+    - Vain erilaiset salatekstilohkot kerrotaan, kukin painotettuna esiintymiskertojensa määrällä;
+    - Parhaat rivit, jotka muodostavat kääntyvän matriisin, yhdistetään, ja niiden järjestys valitaan englannin yleisimpien bigrammien perusteella;
+    - Rivit pisteytetään osissa, jotka voidaan jakaa prosessipoolille.
+'''
+
+import itertools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from .hill_cipher import HillCipher
+from .language_model import bigram_score, numpy, score_histograms
+from .modular_arithmetic import independent_rows, matrix_inverse
+
+MODULUS = 26
+ROW_CHUNK_ELEMENTS = 1 << 22
+CANDIDATE_ROWS = 8
+
+def letter_numbers(text: str) -> list:
+    return [ord(character) - 65 for character in text.upper() if 'A' <= character <= 'Z']
+
+def split_blocks(numbers: list, block_size: int) -> list:
+    return [numbers[i:i + block_size] for i in range(0, len(numbers) - block_size + 1, block_size)]
+
+def multiply_matrices(left: list, right: list) -> list:
+    columns = list(zip(*right))
+    return [[sum(a * b for a, b in zip(row, column)) % MODULUS for column in columns] for row in left]
+
+def transpose(matrix: list) -> list:
+    return [list(row) for row in zip(*matrix)]
+
+def independent_blocks(plaintext_blocks: list, block_size: int) -> list:
+    indices = independent_rows(plaintext_blocks, block_size, MODULUS)
+    if len(indices) < block_size:
+        raise ValueError("The plaintext does not contain enough linearly independent blocks!")
+    return indices
+
+def recover_key(plaintext: str, ciphertext: str, block_size: int = 2) -> list:
+    plaintext_blocks = split_blocks(letter_numbers(plaintext), block_size)
+    ciphertext_blocks = split_blocks(letter_numbers(ciphertext), block_size)
+    plaintext_blocks = plaintext_blocks[:len(ciphertext_blocks)]
+    ciphertext_blocks = ciphertext_blocks[:len(plaintext_blocks)]
+
+    indices = independent_blocks(plaintext_blocks, block_size)
+    plaintext_matrix = [plaintext_blocks[index] for index in indices]
+    ciphertext_matrix = [ciphertext_blocks[index] for index in indices]
+
+    # Rows are blocks, so C = P * K^T and K^T = P^-1 * C.
+    key_matrix = transpose(multiply_matrices(matrix_inverse(plaintext_matrix, MODULUS), ciphertext_matrix))
+
+    if multiply_matrices(plaintext_blocks, transpose(key_matrix)) != ciphertext_blocks:
+        raise ValueError("The fragments are not encrypted with a single Hill key!")
+
+    return key_matrix
+
+def row_from_index(index: int, block_size: int) -> list:
+    row = []
+    for _ in range(block_size):
+        index, value = divmod(index, MODULUS)
+        row.append(value)
+    return row[::-1]
+
+def score_rows(start: int, end: int, blocks, counts, method: str = 'chi-squared'):
+    block_size = len(blocks[0])
+
+    if numpy:
+        digits = numpy.arange(start, end)[:, None] // MODULUS ** numpy.arange(block_size - 1, -1, -1) % MODULUS
+        letters = digits @ numpy.asarray(blocks).T % MODULUS
+        offsets = numpy.arange(end - start)[:, None] * MODULUS
+        weights = numpy.broadcast_to(numpy.asarray(counts), letters.shape)
+        histograms = numpy.bincount((offsets + letters).ravel(), weights.ravel(), (end - start) * MODULUS)
+        return score_histograms(histograms.reshape(-1, MODULUS), method)
+
+    histograms = []
+    for index in range(start, end):
+        row = row_from_index(index, block_size)
+        histogram = [0] * MODULUS
+        for block, count in zip(blocks, counts):
+            histogram[sum(a * b for a, b in zip(row, block)) % MODULUS] += count
+        histograms.append(histogram)
+    return score_histograms(histograms, method)
+
+def row_chunks(row_count: int, block_count: int) -> list:
+    chunk_size = max(ROW_CHUNK_ELEMENTS // block_count, 1)
+    return [(start, min(start + chunk_size, row_count)) for start in range(1, row_count, chunk_size)]
+
+def rank_rows(blocks: list, counts: list, method: str = 'chi-squared', workers: int = 1) -> list:
+    block_size = len(blocks[0])
+    chunks = row_chunks(MODULUS ** block_size, len(blocks))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(score_rows, start, end, blocks, counts, method) for start, end in chunks]
+            chunk_scores = [future.result() for future in futures]
+    else:
+        chunk_scores = [score_rows(start, end, blocks, counts, method) for start, end in chunks]
+
+    scores = []
+    for (start, _), chunk in zip(chunks, chunk_scores):
+        scores.extend(enumerate(list(chunk), start))
+    scores.sort(key=lambda score: score[1])
+    return [row_from_index(index, block_size) for index, _ in scores]
+
+def decrypt_numbers(inverse_key_matrix: list, ciphertext_blocks: list) -> str:
+    plaintext_blocks = multiply_matrices(ciphertext_blocks, transpose(inverse_key_matrix))
+    return ''.join(chr(number + 65) for block in plaintext_blocks for number in block)
+
+def crack_hill(ciphertext: str, block_size: int = 2, method: str = 'chi-squared', workers: int = 1) -> list:
+    ciphertext_blocks = split_blocks(letter_numbers(ciphertext), block_size)
+    if not ciphertext_blocks:
+        raise ValueError("The ciphertext contains no complete block!")
+
+    block_counts = Counter(tuple(block) for block in ciphertext_blocks)
+    blocks = list(block_counts)
+    counts = [block_counts[block] for block in blocks]
+    rows = rank_rows(blocks, counts, method, workers)
+
+    indices = independent_rows(rows[:block_size + CANDIDATE_ROWS], block_size, MODULUS)
+    if len(indices) < block_size:
+        raise ValueError("No invertible combination of the best rows was found!")
+    selection = [rows[index] for index in indices]
+
+    best_inverse = max(
+        (list(order) for order in itertools.permutations(selection)),
+        key=lambda inverse: bigram_score(decrypt_numbers(inverse, ciphertext_blocks))
+    )
+    return matrix_inverse(best_inverse, MODULUS)
+
+if __name__ == "__main__":
+
+    key_matrix = [  [5, 8],
+                    [17, 3]
+            ]
+
+    plaintext = "THE HILL CIPHER IS A POLYGRAPHIC SUBSTITUTION CIPHER BASED ON LINEAR ALGEBRA. " \
+                "EACH LETTER IS REPRESENTED BY A NUMBER MODULO TWENTY SIX, AND EACH BLOCK OF LETTERS " \
+                "IS MULTIPLIED BY AN INVERTIBLE MATRIX TO PRODUCE THE CIPHERTEXT."
+    ciphertext = HillCipher(key_matrix).encrypt(plaintext)
+
+    print(f"Known plaintext: {recover_key(plaintext, ciphertext)}")
+    print(f"Ciphertext only: {crack_hill(ciphertext)}")
@@ -0,0 +1,326 @@
+'''
+The instrumentation shows where the time of the ciphers goes: in building the key schedule or in processing the text.
+
+Counters:
+    - Instrumentation is off by default, and then the cipher classes are not changed at all, so it costs nothing;
+    - When it is enabled, the setup and processing methods of every cipher class, and the functions that build tables and invert matrices, are replaced by wrappers;
+    - Every wrapper counts the calls, the characters of its first argument and the time spent inside it;
+    - The time of the outermost call is also added to its phase, setup or processing, so nested calls are not counted twice;
+    - The hit rates of the caches are read from the functions that keep one and from the key schedule cache;
+    - stats() returns a snapshot of all the counters, reset() clears them, and disable() restores the original methods.
+
+Profiling:
+    - The profile() context manager enables the counters around a workload;
+    - It can also run the workload under cProfile and tracemalloc;
+    - On exit the report holds the counters of the workload, the profiler statistics and the peak memory.
+
+Инструментирование показывает, на что уходит время шифров: на построение расписания ключа или на обработку текста.
+
+Счётчики:
+    - По умолчанию инструментирование выключено, и тогда классы шифров никак не изменяются, поэтому оно ничего не стоит;
+    - Когда оно включено, методы подготовки и обработки каждого класса шифра, а также функции построения таблиц и обращения матриц заменяются обёртками;
+    - Каждая обёртка считает вызовы, символы первого аргумента и время, проведённое внутри;
+    - Время внешнего вызова также добавляется к его этапу, подготовке или обработке, поэтому вложенные вызовы не учитываются дважды;
+    - Доля попаданий кэшей считывается из функций, которые их хранят, и из кэша расписаний ключей;
+    - stats() возвращает снимок всех счётчиков, reset() обнуляет их, а disable() восстанавливает исходные методы.
+
+Профилирование:
+    - Контекстный менеджер profile() включает счётчики на время нагрузки;
+    - Он также может выполнять нагрузку под cProfile и tracemalloc;
+    - При выходе отчёт содержит счётчики нагрузки, статистику профилировщика и пиковую память.
+
+Instrumentointi näyttää, mihin salausten aika kuluu: avainaikataulun rakentamiseen vai tekstin käsittelyyn.
+
+Laskurit:
+    - Instrumentointi on oletuksena pois päältä, jolloin salausluokkia ei muuteta lainkaan, joten se ei maksa mitään;
+    - Kun se otetaan käyttöön, jokaisen salausluokan valmistelu- ja käsittelymetodit sekä taulukoita rakentavat ja matriiseja kääntävät funktiot korvataan kääreillä;
+    - Jokainen kääre laskee kutsut, ensimmäisen argumenttinsa merkit ja sisällä kuluneen ajan;
+    - Uloimman kutsun aika lisätään myös sen vaiheeseen, valmisteluun tai käsittelyyn, joten sisäkkäisiä kutsuja ei lasketa kahdesti;
+    - Välimuistien osumaosuudet luetaan funktioista, jotka pitävät välimuistia, ja avainaikataulujen välimuistista;
+    - stats() palauttaa tilannekuvan kaikista laskureista, reset() nollaa ne ja disable() palauttaa alkuperäiset metodit.
+
+Profilointi:
+    - Kontekstinhallinta profile() ottaa laskurit käyttöön kuorman ajaksi;
+    - Se voi myös suorittaa kuorman cProfilen ja tracemallocin alaisena;
+    - Poistuttaessa raportti sisältää kuorman laskurit, profiloijan tilastot ja huippumuistin.
+'''
+
+import cProfile
+import functools
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from . import affine_cipher
+from . import atbash_cipher
+from . import beaufort_cipher
+from . import caesar_cipher
+from . import gronsfeld_cipher
+from . import hill_cipher
+from . import key_schedule
+from . import modular_arithmetic
+from . import playfair_cipher
+from . import polybius_square_cipher
+from . import rail_fence_cipher
+from . import translation_table
+from . import vigenere_cipher
+
+SETUP = 'setup'
+PROCESSING = 'processing'
+
+CIPHER_CLASSES = (
+    affine_cipher.AffineCipher,
+    caesar_cipher.CaesarCipher,
+    vigenere_cipher.VigenereCipher,
+    atbash_cipher.AtbashCipher,
+    beaufort_cipher.BeaufortCipher,
+    gronsfeld_cipher.GronsfeldCipher,
+    hill_cipher.HillCipher,
+    playfair_cipher.PlayfairCipher,
+    polybius_square_cipher.PolybiusCipher,
+    rail_fence_cipher.RailFenceCipher,
+    translation_table.TranslationTable,
+)
+
+METHOD_PHASES = {
+    '__init__': SETUP,
+    'create_schedule': SETUP,
+    'create_matrix': SETUP,
+    'create_lookup_arrays': SETUP,
+    'create_key_arrays': SETUP,
+    'create_grid': SETUP,
+    'get_inverted_matrix': SETUP,
+    'keyword_shifts': SETUP,
+    'key_indices': SETUP,
+    'encode': PROCESSING,
+    'decode': PROCESSING,
+    'encrypt': PROCESSING,
+    'decrypt': PROCESSING,
+    'process_chunk': PROCESSING,
+    'translate_buffer': PROCESSING,
+    'encode_character': PROCESSING,
+    'decode_character': PROCESSING,
+    '__missing__': PROCESSING,
+}
+
+FUNCTION_PHASES = {
+    'build_byte_table': SETUP,
+    'build_digraph_tables': SETUP,
+    'matrix_inverse': SETUP,
+}
+
+CIPHER_MODULES = (
+    affine_cipher, atbash_cipher, beaufort_cipher, caesar_cipher, gronsfeld_cipher, hill_cipher, modular_arithmetic,
+    playfair_cipher, polybius_square_cipher, rail_fence_cipher, translation_table, vigenere_cipher,
+)
+
+CACHED_FUNCTIONS = {
+    'modular_arithmetic.inverse_table': modular_arithmetic.inverse_table,
+    'rail_fence_cipher.zigzag_permutation': rail_fence_cipher.zigzag_permutation,
+    'rail_fence_cipher.inverse_zigzag_permutation': rail_fence_cipher.inverse_zigzag_permutation,
+    'rail_fence_cipher.zigzag_gatherers': rail_fence_cipher.zigzag_gatherers,
+}
+
+lock = threading.Lock()
+call_depth = threading.local()
+counters = {}
+phase_seconds = {SETUP: 0.0, PROCESSING: 0.0}
+originals = []
+
+def is_enabled() -> bool:
+    return bool(originals)
+
+def character_count(arguments: tuple, position: int) -> int:
+    if len(arguments) <= position:
+        return 0
+    argument = arguments[position]
+    if isinstance(argument, (str, bytes, bytearray)):
+        return len(argument)
+    if isinstance(argument, memoryview):
+        return argument.nbytes
+    return 0
+
+def record(name: str, phase: str, characters: int, seconds: float, outermost: bool):
+    with lock:
+        counter = counters.get(name)
+        if counter is None:
+            counter = counters[name] = {'phase': phase, 'calls': 0, 'characters': 0, 'seconds': 0.0}
+        counter['calls'] += 1
+        counter['characters'] += characters
+        counter['seconds'] += seconds
+        if outermost:
+            phase_seconds[phase] += seconds
+
+def instrument(function, name: str, phase: str, is_method: bool):
+    @functools.wraps(function)
+    def wrapper(*arguments, **keyword_arguments):
+        depth = getattr(call_depth, 'value', 0)
+        call_depth.value = depth + 1
+        start = time.perf_counter()
+        try:
+            return function(*arguments, **keyword_arguments)
+        finally:
+            call_depth.value = depth
+            record(name, phase, character_count(arguments, int(is_method)), time.perf_counter() - start, depth == 0)
+    return wrapper
+
+def enable():
+    if originals:
+        return
+
+    for cipher_class in CIPHER_CLASSES:
+        for method_name, phase in METHOD_PHASES.items():
+            if method_name in vars(cipher_class):
+                method = vars(cipher_class)[method_name]
+                originals.append((cipher_class, method_name, method))
+                setattr(cipher_class, method_name, instrument(method, f"{cipher_class.__name__}.{method_name}", phase, True))
+
+    for function_name, phase in FUNCTION_PHASES.items():
+        wrappers = {}
+        for module in CIPHER_MODULES:
+            function = vars(module).get(function_name)
+            if function is None:
+                continue
+            if function not in wrappers:
+                wrappers[function] = instrument(function, function_name, phase, False)
+            originals.append((module, function_name, function))
+            setattr(module, function_name, wrappers[function])
+
+def disable():
+    while originals:
+        owner, name, original = originals.pop()
+        setattr(owner, name, original)
+
+def reset():
+    with lock:
+        counters.clear()
+        for phase in phase_seconds:
+            phase_seconds[phase] = 0.0
+
+def cache_statistics() -> dict:
+    statistics = {}
+    for name, function in CACHED_FUNCTIONS.items():
+        info = function.cache_info()
+        lookups = info.hits + info.misses
+        statistics[name] = {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'maximum_size': info.maxsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+        }
+    statistics['key_schedule.key_schedules'] = key_schedule.key_schedules.statistics()
+    return statistics
+
+def stats() -> dict:
+    with lock:
+        calls = {name: dict(counter) for name, counter in counters.items()}
+        phases = dict(phase_seconds)
+
+    return {'enabled': is_enabled(), 'calls': calls, 'phases': phases, 'caches': cache_statistics()}
+
+def difference(before: dict, after: dict) -> dict:
+    calls = {}
+    for name, counter in after['calls'].items():
+        previous = before['calls'].get(name, {'calls': 0, 'characters': 0, 'seconds': 0.0})
+        if counter['calls'] != previous['calls']:
+            calls[name] = {
+                'phase': counter['phase'],
+                'calls': counter['calls'] - previous['calls'],
+                'characters': counter['characters'] - previous['characters'],
+                'seconds': counter['seconds'] - previous['seconds'],
+            }
+
+    caches = {}
+    for name, cache in after['caches'].items():
+        hits = cache['hits'] - before['caches'][name]['hits']
+        misses = cache['misses'] - before['caches'][name]['misses']
+        caches[name] = dict(cache, hits=hits, misses=misses, hit_rate=hits / (hits + misses) if hits + misses else 0.0)
+
+    phases = {phase: after['phases'][phase] - before['phases'][phase] for phase in after['phases']}
+    return {'enabled': after['enabled'], 'calls': calls, 'phases': phases, 'caches': caches}
+
+class ProfileReport:
+
+    def __init__(self):
+        self.stats = None
+        self.profile = None
+        self.peak_memory = None
+        self.memory_snapshot = None
+        self.seconds = 0.0
+
+    def profile_text(self, limit: int = 20, sort: str = 'cumulative') -> str:
+        if self.profile is None:
+            return ''
+        output = io.StringIO()
+        pstats.Stats(self.profile, stream=output).sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+
+    def summary(self) -> str:
+        lines = [f"Total: {self.seconds * 1000:.3f} ms"]
+
+        if self.stats is not None:
+            for phase, seconds in self.stats['phases'].items():
+                lines.append(f"{phase}: {seconds * 1000:.3f} ms")
+            for name, counter in sorted(self.stats['calls'].items(), key=lambda item: -item[1]['seconds']):
+                lines.append(f"    {name} ({counter['phase']}): {counter['calls']} calls, {counter['characters']} characters, {counter['seconds'] * 1000:.3f} ms")
+            for name, cache in self.stats['caches'].items():
+                if cache['hits'] or cache['misses']:
+                    lines.append(f"    {name}: {cache['hits']} hits, {cache['misses']} misses ({cache['hit_rate']:.0%})")
+
+        if self.peak_memory is not None:
+            lines.append(f"Peak memory: {self.peak_memory / (1 << 20):.2f} MB")
+
+        return '\n'.join(lines)
+
+@contextmanager
+def profile(counters: bool = True, cprofile: bool = False, memory: bool = False):
+    report = ProfileReport()
+    was_enabled = is_enabled()
+    profiler = cProfile.Profile() if cprofile else None
+    memory_was_tracing = tracemalloc.is_tracing()
+
+    if counters:
+        enable()
+    before = stats()
+
+    if memory:
+        if not memory_was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+    if profiler is not None:
+        profiler.enable()
+
+    start = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report.seconds = time.perf_counter() - start
+
+        if profiler is not None:
+            profiler.disable()
+            report.profile = profiler
+
+        if memory:
+            _, report.peak_memory = tracemalloc.get_traced_memory()
+            report.memory_snapshot = tracemalloc.take_snapshot()
+            if not memory_was_tracing:
+                tracemalloc.stop()
+
+        if counters:
+            report.stats = difference(before, stats())
+            if not was_enabled:
+                disable()
+
+if __name__ == "__main__":
+
+    with profile(cprofile=True, memory=True) as report:
+        for keyword in ("PLAYFAIR", "EXAMPLE", "MONARCHY"):
+            playfair_cipher.PlayfairCipher(keyword).encrypt("HIDE THE GOLD IN THE TREE STUMP" * 100)
+        hill_cipher.HillCipher([[5, 8], [17, 3]]).encrypt("SHORT EXAMPLE" * 100)
+        rail_fence_cipher.RailFenceCipher(3).encode("WE ARE DISCOVERED" * 100)
+
+    print(report.summary())
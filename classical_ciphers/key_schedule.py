@@ -0,0 +1,154 @@
+'''
+The key schedule cache keeps the precomputed tables of recently used keys, so that creating a cipher with a key that was seen before costs almost nothing.
+
+Caching:
+    - A key schedule is everything a cipher computes from its key before it can process text: translation tables, digraph tables, inverse matrices and letter dictionaries;
+    - Schedules are stored under the cipher class and the key, in one cache shared by all ciphers of the process;
+    - When a cipher is created, its schedule is taken from the cache, or built and stored on the first use of the key;
+    - A schedule is shared by every cipher with the same key, so it is built from the key alone: its translation tables call module functions bound to the key values, never the methods of the instance that happened to build it;
+    - The key of a cipher is fixed when the cipher is created: assigning another shift or coefficient to an existing cipher does not rebuild its schedule, so a new key needs a new cipher;
+    - The least recently used schedules are evicted when the number of entries or their estimated memory exceeds the limits;
+    - The cache counts hits, misses and evictions, and both limits can be changed at run time.
+
+Memory estimate:
+    - The size of a schedule is the size of its objects, counting dictionaries, lists and strings recursively and NumPy arrays by their buffers;
+    - A translation table, which remembers characters as they appear and builds its NumPy table on first use, is counted at the largest size it can reach;
+    - A schedule larger than the memory limit is used but not stored.
+
+Кэш расписаний ключей хранит заранее вычисленные таблицы недавно использованных ключей, поэтому создание шифра с уже встречавшимся ключом почти ничего не стоит.
+
+Кэширование:
+    - Расписание ключа - это всё, что шифр вычисляет по ключу до обработки текста: таблицы перевода, таблицы биграмм, обратные матрицы и словари букв;
+    - Расписания хранятся по классу шифра и ключу в одном кэше, общем для всех шифров процесса;
+    - При создании шифра его расписание берётся из кэша либо строится и сохраняется при первом использовании ключа;
+    - Расписание общее для всех шифров с тем же ключом, поэтому оно строится только по ключу: его таблицы перевода вызывают функции модуля, привязанные к значениям ключа, а не методы экземпляра, который случайно его построил;
+    - Ключ шифра фиксируется при создании шифра: присваивание другого сдвига или коэффициента существующему шифру не перестраивает его расписание, поэтому для нового ключа нужен новый шифр;
+    - Дольше всего не использовавшиеся расписания вытесняются, когда число записей или их оценочный объём памяти превышает пределы;
+    - Кэш считает попадания, промахи и вытеснения, а оба предела можно изменить во время работы.
+
+Оценка памяти:
+    - Размер расписания - это размер его объектов, где словари, списки и строки учитываются рекурсивно, а массивы NumPy - по их буферам;
+    - Таблица перевода, которая запоминает символы по мере их появления и строит свою таблицу NumPy при первом использовании, учитывается по наибольшему размеру, которого она может достичь;
+    - Расписание больше предела памяти используется, но не сохраняется.
+
+Avainaikataulujen välimuisti säilyttää äskettäin käytettyjen avainten valmiiksi lasketut taulukot, joten jo nähdyn avaimen salauksen luominen ei maksa juuri mitään.
+
+Välimuisti:
+    - Avainaikataulu on kaikki, mitä salaus laskee avaimestaan ennen tekstin käsittelyä: käännöstaulukot, digrammitaulukot, käänteismatriisit ja kirjainsanakirjat;
+    - Aikataulut tallennetaan salausluokan ja avaimen mukaan yhteen välimuistiin, jonka kaikki prosessin salaukset jakavat;
+    - Salausta luotaessa sen aikataulu otetaan välimuistista tai rakennetaan ja tallennetaan avaimen ensimmäisellä käytöllä;
+    - Aikataulu on yhteinen kaikille saman avaimen salauksille, joten se rakennetaan pelkästä avaimesta: sen käännöstaulukot kutsuvat avaimen arvoihin sidottuja moduulin funktioita, eivät sen instanssin metodeja, joka sattui rakentamaan sen;
+    - Salauksen avain kiinnitetään salausta luotaessa: toisen siirron tai kertoimen asettaminen olemassa olevalle salaukselle ei rakenna sen aikataulua uudelleen, joten uusi avain tarvitsee uuden salauksen;
+    - Pisimpään käyttämättömät aikataulut poistetaan, kun merkintöjen määrä tai niiden arvioitu muisti ylittää rajat;
+    - Välimuisti laskee osumat, ohitukset ja poistot, ja molempia rajoja voi muuttaa ajon aikana.
+
+Muistiarvio:
+    - Aikataulun koko on sen olioiden koko, jossa sanakirjat, listat ja merkkijonot lasketaan rekursiivisesti ja NumPy-taulukot puskuriensa mukaan;
+    - Käännöstaulukko, joka muistaa merkit niiden ilmaantuessa ja rakentaa NumPy-taulukkonsa ensimmäisellä käytöllä, lasketaan suurimman koon mukaan, jonka se voi saavuttaa;
+    - Muistirajaa suurempaa aikataulua käytetään, mutta sitä ei tallenneta.
+'''
+
+import sys
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAXIMUM_ENTRIES = 4096
+DEFAULT_MAXIMUM_BYTES = 64 << 20
+
+def estimate_size(value, seen: set = None) -> int:
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return sys.getsizeof(value) + (0 if getattr(value, 'base', None) is not None else nbytes)
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key, seen) + estimate_size(item, seen)
+
+        # Tables that keep growing after they are cached report the room they may still take.
+        reserved_size = getattr(value, 'reserved_size', None)
+        if reserved_size is not None:
+            size += reserved_size()
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, seen)
+    return size
+
+class KeyScheduleCache:
+
+    def __init__(self, maximum_entries: int = DEFAULT_MAXIMUM_ENTRIES, maximum_bytes: int = DEFAULT_MAXIMUM_BYTES):
+        self.maximum_entries = maximum_entries
+        self.maximum_bytes = maximum_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.RLock()
+
+    def get(self, key: tuple, build) -> dict:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        schedule = build()
+        size = estimate_size(schedule)
+
+        with self.lock:
+            if size <= self.maximum_bytes and self.maximum_entries > 0 and key not in self.entries:
+                self.entries[key] = (schedule, size)
+                self.total_bytes += size
+                self.evict()
+
+        return schedule
+
+    def evict(self):
+        while self.entries and (len(self.entries) > self.maximum_entries or self.total_bytes > self.maximum_bytes):
+            _, (_, size) = self.entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def configure(self, maximum_entries: int = None, maximum_bytes: int = None):
+        with self.lock:
+            if maximum_entries is not None:
+                self.maximum_entries = maximum_entries
+            if maximum_bytes is not None:
+                self.maximum_bytes = maximum_bytes
+            self.evict()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def statistics(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'bytes': self.total_bytes,
+                'maximum_entries': self.maximum_entries,
+                'maximum_bytes': self.maximum_bytes,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+key_schedules = KeyScheduleCache()
+
+def schedule_attributes(instance, names: tuple) -> dict:
+    return {name: getattr(instance, name) for name in names}
@@ -0,0 +1,188 @@
+'''
+The language model describes how English letters are distributed, so that candidate decryptions can be scored without reading them.
+
+Scoring:
+    - Count how often every letter of the alphabet occurs in the text;
+    - Compare the counts with the expected English frequencies:
+        - The chi-squared statistic sums the squared difference between the observed and the expected count, divided by the expected count;
+        - The negative log-likelihood sums the count of every letter multiplied by the negative logarithm of its probability.
+    - In both cases a lower score means a text that looks more like English;
+    - Many histograms can be scored at once, one per row;
+    - Letter counts do not depend on the order of the letters, so the most common English bigrams are used when the order matters.
+
+N-grams:
+    - A table of log-probabilities of every sequence of n letters is built once from a corpus, an English sample by default;
+    - Sequences that never occur in the corpus get a small floor probability instead of zero;
+    - The sequence of letters i1...in is stored at index i1 * size^(n-1) + ... + in, so a whole text is scored with a single lookup.
+
+Языковая модель описывает распределение английских букв, чтобы оценивать варианты расшифровки, не читая их.
+
+Оценка:
+    - Подсчитывается, сколько раз каждая буква алфавита встречается в тексте;
+    - Частоты сравниваются с ожидаемыми частотами английского языка:
+        - Статистика хи-квадрат суммирует квадрат разности между наблюдаемым и ожидаемым числом, делённый на ожидаемое число;
+        - Отрицательное логарифмическое правдоподобие суммирует число вхождений каждой буквы, умноженное на отрицательный логарифм её вероятности.
+    - В обоих случаях меньшая оценка означает текст, более похожий на английский;
+    - Можно оценить сразу много гистограмм, по одной в каждой строке;
+    - Число букв не зависит от их порядка, поэтому, когда порядок важен, используются самые частые английские биграммы.
+
+N-граммы:
+    - Таблица логарифмов вероятностей всех последовательностей из n букв строится один раз по корпусу, по умолчанию по образцу английского текста;
+    - Последовательности, которых нет в корпусе, получают небольшую минимальную вероятность вместо нуля;
+    - Последовательность букв i1...in хранится по индексу i1 * size^(n-1) + ... + in, поэтому весь текст оценивается одним обращением к таблице.
+
+Kielimalli kuvaa englannin kirjainten jakauman, jotta purkuehdokkaat voidaan pisteyttää lukematta niitä.
+
+Pisteytys:
+    - Lasketaan, kuinka usein kukin aakkoston kirjain esiintyy tekstissä;
+    - Lukumääriä verrataan englannin odotettuihin frekvensseihin:
+        - Khiin neliö -testisuure summaa havaitun ja odotetun lukumäärän erotuksen neliön jaettuna odotetulla lukumäärällä;
+        - Negatiivinen log-uskottavuus summaa jokaisen kirjaimen lukumäärän kerrottuna sen todennäköisyyden negatiivisella logaritmilla.
+    - Molemmissa tapauksissa pienempi pistemäärä tarkoittaa englantia enemmän muistuttavaa tekstiä;
+    - Useita histogrammeja voidaan pisteyttää kerralla, yksi kullakin rivillä;
+    - Kirjainten lukumäärät eivät riipu kirjainten järjestyksestä, joten kun järjestyksellä on väliä, käytetään englannin yleisimpiä bigrammeja.
+
+N-grammit:
+    - Jokaisen n kirjaimen jonon log-todennäköisyyksien taulukko rakennetaan kerran korpuksesta, oletuksena englanninkielisestä näytteestä;
+    - Jonot, joita korpuksessa ei esiinny, saavat nollan sijaan pienen vähimmäistodennäköisyyden;
+    - Kirjainjono i1...in tallennetaan indeksiin i1 * size^(n-1) + ... + in, joten koko teksti pisteytetään yhdellä haulla.
+'''
+
+import math
+import string
+from functools import lru_cache
+
+from .backends import numpy
+
+ENGLISH_LETTER_FREQUENCIES = [
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094,
+    0.06966, 0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929,
+    0.00095, 0.05987, 0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150,
+    0.01974, 0.00074
+]
+
+ENGLISH_COMMON_BIGRAMS = {
+    'TH': 0.0356, 'HE': 0.0307, 'IN': 0.0243, 'ER': 0.0205, 'AN': 0.0199, 'RE': 0.0185,
+    'ON': 0.0176, 'AT': 0.0149, 'EN': 0.0145, 'ND': 0.0135, 'TI': 0.0134, 'ES': 0.0134,
+    'OR': 0.0128, 'TE': 0.0120, 'OF': 0.0117, 'ED': 0.0117, 'IS': 0.0113, 'IT': 0.0112,
+    'AL': 0.0109, 'AR': 0.0107, 'ST': 0.0105, 'TO': 0.0104, 'NT': 0.0104, 'NG': 0.0095,
+    'SE': 0.0093, 'HA': 0.0093, 'AS': 0.0087, 'OU': 0.0087, 'IO': 0.0083, 'LE': 0.0083
+}
+
+ENGLISH_SAMPLE = (
+    "When in the course of human events it becomes necessary for one people to dissolve the political bands "
+    "which have connected them with another, and to assume among the powers of the earth the separate and equal "
+    "station to which the laws of nature and of nature's God entitle them, a decent respect to the opinions of "
+    "mankind requires that they should declare the causes which impel them to the separation. We hold these "
+    "truths to be self-evident, that all men are created equal, that they are endowed by their creator with "
+    "certain unalienable rights, that among these are life, liberty and the pursuit of happiness. That to secure "
+    "these rights, governments are instituted among men, deriving their just powers from the consent of the "
+    "governed. That whenever any form of government becomes destructive of these ends, it is the right of the "
+    "people to alter or to abolish it, and to institute new government, laying its foundation on such principles "
+    "and organizing its powers in such form, as to them shall seem most likely to effect their safety and "
+    "happiness. Prudence, indeed, will dictate that governments long established should not be changed for light "
+    "and transient causes; and accordingly all experience hath shewn that mankind are more disposed to suffer, "
+    "while evils are sufferable, than to right themselves by abolishing the forms to which they are accustomed. "
+    "But when a long train of abuses and usurpations, pursuing invariably the same object evinces a design to "
+    "reduce them under absolute despotism, it is their right, it is their duty, to throw off such government, and "
+    "to provide new guards for their future security. Such has been the patient sufferance of these colonies; and "
+    "such is now the necessity which constrains them to alter their former systems of government. "
+    "It was the best of times, it was the worst of times, it was the age of wisdom, it was the age of "
+    "foolishness, it was the epoch of belief, it was the epoch of incredulity, it was the season of light, it was "
+    "the season of darkness, it was the spring of hope, it was the winter of despair, we had everything before us, "
+    "we had nothing before us, we were all going direct to heaven, we were all going direct the other way. In "
+    "short, the period was so far like the present period, that some of its noisiest authorities insisted on its "
+    "being received, for good or for evil, in the superlative degree of comparison only. "
+    "It is a truth universally acknowledged, that a single man in possession of a good fortune, must be in want "
+    "of a wife. However little known the feelings or views of such a man may be on his first entering a "
+    "neighbourhood, this truth is so well fixed in the minds of the surrounding families, that he is considered "
+    "the rightful property of some one or other of their daughters. My dear Mr. Bennet, said his lady to him one "
+    "day, have you heard that Netherfield Park is let at last? Mr. Bennet replied that he had not. But it is, "
+    "returned she; for Mrs. Long has just been here, and she told me all about it. Mr. Bennet made no answer. Do "
+    "you not want to know who has taken it? cried his wife impatiently. You want to tell me, and I have no "
+    "objection to hearing it. This was invitation enough. "
+    "Call me Ishmael. Some years ago, never mind how long precisely, having little or no money in my purse, and "
+    "nothing particular to interest me on shore, I thought I would sail about a little and see the watery part of "
+    "the world. It is a way I have of driving off the spleen and regulating the circulation. Whenever I find "
+    "myself growing grim about the mouth; whenever it is a damp, drizzly November in my soul; whenever I find "
+    "myself involuntarily pausing before coffin warehouses, and bringing up the rear of every funeral I meet; and "
+    "especially whenever my hypos get such an upper hand of me, that it requires a strong moral principle to "
+    "prevent me from deliberately stepping into the street, and methodically knocking people's hats off, then, I "
+    "account it high time to get to sea as soon as I can."
+)
+
+def letter_histogram(text: str) -> list:
+    if numpy and text.isascii():
+        codes = numpy.frombuffer(text.encode('ascii'), dtype=numpy.uint8) | 32
+        letters = codes[(codes >= 97) & (codes <= 122)]
+        return numpy.bincount(letters - 97, minlength=26).tolist()
+
+    histogram = [0] * 26
+    for character in text.upper():
+        if 'A' <= character <= 'Z':
+            histogram[ord(character) - 65] += 1
+    return histogram
+
+def score_histograms(histograms, method: str = 'chi-squared', frequencies: list = ENGLISH_LETTER_FREQUENCIES):
+    if method not in ('chi-squared', 'log-likelihood'):
+        raise ValueError(f"Unknown scoring method: {method}!")
+
+    if numpy:
+        histograms = numpy.asarray(histograms, dtype=numpy.float64)
+        probabilities = numpy.asarray(frequencies, dtype=numpy.float64)
+
+        if method == 'log-likelihood':
+            return -(histograms @ numpy.log(probabilities))
+
+        expected = numpy.maximum(histograms.sum(axis=-1, keepdims=True) * probabilities, 1e-12)
+        return (((histograms - expected) ** 2) / expected).sum(axis=-1)
+
+    scores = []
+    for histogram in histograms:
+        total = sum(histogram)
+        score = 0.0
+        for count, probability in zip(histogram, frequencies):
+            if method == 'log-likelihood':
+                score -= count * math.log(probability)
+            elif total:
+                expected = total * probability
+                score += (count - expected) ** 2 / expected
+        scores.append(score)
+    return scores
+
+def bigram_score(text: str, bigrams: dict = ENGLISH_COMMON_BIGRAMS) -> float:
+    score = 0.0
+    for position in range(len(text) - 1):
+        score += bigrams.get(text[position:position + 2], 0.0)
+    return score
+
+@lru_cache(maxsize=8)
+def ngram_log_probabilities(n: int = 3, corpus: str = ENGLISH_SAMPLE, alphabet: str = string.ascii_uppercase):
+    indices = {}
+    for index, character in enumerate(alphabet):
+        indices[character] = index
+
+    letters = [indices[character] for character in corpus.upper() if character in indices]
+    size = len(alphabet)
+    table_size = size ** n
+
+    if len(letters) < n:
+        raise ValueError(f"The corpus must contain at least {n} letters of the alphabet!")
+
+    if numpy:
+        letters = numpy.asarray(letters, dtype=numpy.int64)
+        codes = numpy.zeros(len(letters) - n + 1, dtype=numpy.int64)
+        for offset in range(n):
+            codes = codes * size + letters[offset:len(letters) - n + 1 + offset]
+        counts = numpy.bincount(codes, minlength=table_size).astype(numpy.float64)
+        return numpy.log(numpy.maximum(counts, 0.01) / len(codes))
+
+    counts = [0] * table_size
+    for position in range(len(letters) - n + 1):
+        code = 0
+        for letter in letters[position:position + n]:
+            code = code * size + letter
+        counts[code] += 1
+
+    total = len(letters) - n + 1
+    return [math.log(max(count, 0.01) / total) for count in counts]
@@ -0,0 +1,253 @@
+'''
+Modular arithmetic shared by the ciphers that work with residues modulo the size of the alphabet.
+
+Operations:
+    - The greatest common divisor and the extended Euclidean algorithm, computed iteratively;
+    - The multiplicative inverse, looked up in a table that is built once per modulus;
+    - The determinant of a square matrix modulo m;
+    - The inverse of a square matrix modulo m, found by Gauss-Jordan elimination:
+        - Each column is reduced with Euclidean row operations until a single pivot remains;
+        - The pivot must be coprime with m, otherwise the matrix is not invertible;
+        - The pivot row is multiplied by the inverse of the pivot and the column is cleared in every other row.
+    - Independent rows, chosen by incremental Gaussian elimination:
+        - The rows are reduced one at a time against an echelon basis kept modulo every prime factor of m;
+        - A row is kept only if it raises the rank modulo every prime factor, so the kept rows always extend to an invertible matrix modulo m;
+        - The search stops as soon as enough rows are kept, so it is linear in the number of rows;
+        - When m has two prime factors, as 26 = 2 · 13 does, an early row can block the others; if the greedy pass falls short, the selection is completed with the augmenting paths of matroid intersection, so rows forming an invertible matrix are found whenever they exist.
+
+Модульная арифметика, общая для шифров, работающих с остатками по модулю размера алфавита.
+
+Операции:
+    - Наибольший общий делитель и расширенный алгоритм Евклида, вычисляемые итеративно;
+    - Мультипликативный обратный элемент, который берётся из таблицы, построенной один раз для каждого модуля;
+    - Определитель квадратной матрицы по модулю m;
+    - Обратная квадратная матрица по модулю m, найденная методом Гаусса-Жордана:
+        - Каждый столбец сводится строковыми операциями Евклида, пока не останется один опорный элемент;
+        - Опорный элемент должен быть взаимно прост с m, иначе матрица необратима;
+        - Опорная строка умножается на обратный к опорному элементу, а столбец обнуляется во всех остальных строках.
+    - Независимые строки, выбираемые пошаговым методом Гаусса:
+        - Строки по одной приводятся по ступенчатому базису, который хранится по модулю каждого простого делителя m;
+        - Строка сохраняется, только если она повышает ранг по модулю каждого простого делителя, поэтому сохранённые строки всегда дополняются до матрицы, обратимой по модулю m;
+        - Поиск останавливается, как только набрано достаточно строк, поэтому он линеен по числу строк;
+        - Когда у m два простых делителя, как у 26 = 2 · 13, ранняя строка может заблокировать другие; если жадного прохода не хватает, выбор дополняется увеличивающими путями пересечения матроидов, поэтому строки, образующие обратимую матрицу, находятся всегда, когда они существуют.
+
+Modulaariaritmetiikka, jota käyttävät salaukset, jotka laskevat jäännöksillä aakkoston koon suhteen.
+
+Operaatiot:
+    - Suurin yhteinen tekijä ja laajennettu Eukleideen algoritmi iteratiivisesti laskettuina;
+    - Käänteisalkio kertolaskun suhteen, joka haetaan kerran kutakin modulia varten rakennetusta taulukosta;
+    - Neliömatriisin determinantti modulo m;
+    - Neliömatriisin käänteismatriisi modulo m Gauss-Jordanin menetelmällä:
+        - Jokainen sarake redusoidaan Eukleideen rivioperaatioilla, kunnes jäljellä on yksi tukialkio;
+        - Tukialkion on oltava suhteellinen alkuluku m:n kanssa, muuten matriisi ei ole kääntyvä;
+        - Tukirivi kerrotaan tukialkion käänteisalkiolla ja sarake nollataan kaikilta muilta riveiltä.
+    - Riippumattomat rivit, jotka valitaan askeltavalla Gaussin eliminoinnilla:
+        - Rivit redusoidaan yksi kerrallaan porrasmuotoista kantaa vastaan, jota pidetään modulo m:n jokainen alkutekijä;
+        - Rivi säilytetään vain, jos se kasvattaa astetta modulo jokainen alkutekijä, joten säilytetyt rivit voidaan aina täydentää modulo m kääntyväksi matriisiksi;
+        - Haku pysähtyy heti, kun rivejä on tarpeeksi, joten se on lineaarinen rivien määrän suhteen;
+        - Kun m:llä on kaksi alkutekijää, kuten 26 = 2 · 13, aikainen rivi voi estää muut; jos ahne läpikäynti jää vajaaksi, valintaa täydennetään matroidien leikkauksen täydentävillä poluilla, joten kääntyvän matriisin muodostavat rivit löytyvät aina, kun niitä on.
+'''
+
+from collections import deque
+from functools import lru_cache
+
+def greatest_common_divisor(a: int, b: int) -> int:
+    while b:
+        a, b = b, a % b
+    return abs(a)
+
+def extended_gcd(a: int, b: int) -> tuple:
+    previous_x, x = 1, 0
+    previous_y, y = 0, 1
+
+    while b:
+        quotient = a // b
+        a, b = b, a - quotient * b
+        previous_x, x = x, previous_x - quotient * x
+        previous_y, y = y, previous_y - quotient * y
+
+    return a, previous_x, previous_y
+
+@lru_cache(maxsize=None)
+def inverse_table(modulus: int) -> tuple:
+    table = []
+    for number in range(modulus):
+        gcd, inverse, _ = extended_gcd(number, modulus)
+        if gcd == 1:
+            table.append(inverse % modulus)
+        else:
+            table.append(None)
+    return tuple(table)
+
+def modular_inverse(a: int, modulus: int):
+    return inverse_table(modulus)[a % modulus]
+
+def reduce_column(matrix: list, column: int, modulus: int) -> int:
+    sign = 1
+    size = len(matrix)
+
+    while True:
+        pivot_row = None
+        for row in range(column, size):
+            if matrix[row][column] and (pivot_row is None or matrix[row][column] < matrix[pivot_row][column]):
+                pivot_row = row
+
+        if pivot_row is None:
+            return sign
+
+        if pivot_row != column:
+            matrix[column], matrix[pivot_row] = matrix[pivot_row], matrix[column]
+            sign = -sign
+
+        pivot = matrix[column][column]
+        finished = True
+
+        for row in range(column + 1, size):
+            if matrix[row][column]:
+                quotient = matrix[row][column] // pivot
+                matrix[row] = [(value - quotient * pivot_value) % modulus for value, pivot_value in zip(matrix[row], matrix[column])]
+                if matrix[row][column]:
+                    finished = False
+
+        if finished:
+            return sign
+
+def determinant(matrix: list, modulus: int) -> int:
+    matrix = [[value % modulus for value in row] for row in matrix]
+    result = 1
+
+    for column in range(len(matrix)):
+        result *= reduce_column(matrix, column, modulus)
+        result = result * matrix[column][column] % modulus
+
+    return result % modulus
+
+def matrix_inverse(matrix: list, modulus: int) -> list:
+    size = len(matrix)
+
+    if any(len(row) != size for row in matrix):
+        raise ValueError("Matrix must be square!")
+
+    augmented = []
+    for index, row in enumerate(matrix):
+        identity_row = [0] * size
+        identity_row[index] = 1
+        augmented.append([value % modulus for value in row] + identity_row)
+
+    for column in range(size):
+        reduce_column(augmented, column, modulus)
+
+        inverted_pivot = modular_inverse(augmented[column][column], modulus)
+        if inverted_pivot is None:
+            raise ValueError("Matrix is not invertible!")
+
+        augmented[column] = [value * inverted_pivot % modulus for value in augmented[column]]
+
+        for row in range(size):
+            factor = augmented[row][column]
+            if row != column and factor:
+                augmented[row] = [(value - factor * pivot_value) % modulus for value, pivot_value in zip(augmented[row], augmented[column])]
+
+    return [row[size:] for row in augmented]
+
+@lru_cache(maxsize=None)
+def prime_factors(modulus: int) -> tuple:
+    factors = []
+    factor = 2
+
+    while factor * factor <= modulus:
+        if modulus % factor == 0:
+            factors.append(factor)
+            while modulus % factor == 0:
+                modulus //= factor
+        factor += 1
+
+    if modulus > 1:
+        factors.append(modulus)
+    return tuple(factors)
+
+def reduce_row(basis: dict, row: list, prime: int) -> list:
+    row = [value % prime for value in row]
+    for column, basis_row in basis.items():
+        factor = row[column]
+        if factor:
+            row = [(value - factor * basis_value) % prime for value, basis_value in zip(row, basis_row)]
+    return row
+
+def extend_basis(basis: dict, reduced_row: list, prime: int):
+    pivot_column = next(column for column, value in enumerate(reduced_row) if value)
+    inverted_pivot = modular_inverse(reduced_row[pivot_column], prime)
+    basis[pivot_column] = [value * inverted_pivot % prime for value in reduced_row]
+
+def span_basis(rows, prime: int) -> dict:
+    basis = {}
+    for row in rows:
+        reduced_row = reduce_row(basis, row, prime)
+        if any(reduced_row):
+            extend_basis(basis, reduced_row, prime)
+    return basis
+
+def is_spanned(basis: dict, row: list, prime: int) -> bool:
+    return not any(reduce_row(basis, row, prime))
+
+def augment_rows(rows: list, indices: list, primes: tuple):
+    first, second = primes
+    selected = set(indices)
+    outside = [index for index in range(len(rows)) if index not in selected]
+
+    first_basis = span_basis((rows[index] for index in indices), first)
+    second_basis = span_basis((rows[index] for index in indices), second)
+    first_exchanges = {removed: span_basis((rows[index] for index in indices if index != removed), first) for removed in indices}
+    second_exchanges = {removed: span_basis((rows[index] for index in indices if index != removed), second) for removed in indices}
+
+    targets = {index for index in outside if not is_spanned(second_basis, rows[index], second)}
+    previous = {index: None for index in outside if not is_spanned(first_basis, rows[index], first)}
+    queue = deque(previous)
+
+    while queue:
+        node = queue.popleft()
+
+        if node in targets:
+            path = set()
+            while node is not None:
+                path.add(node)
+                node = previous[node]
+            return sorted(selected ^ path)
+
+        if node in selected:
+            neighbours = [index for index in outside if index not in previous and not is_spanned(first_exchanges[node], rows[index], first)]
+        else:
+            neighbours = [index for index in indices if index not in previous and not is_spanned(second_exchanges[index], rows[node], second)]
+
+        for neighbour in neighbours:
+            previous[neighbour] = node
+            queue.append(neighbour)
+
+    return None
+
+def independent_rows(rows, count: int, modulus: int) -> list:
+    rows = list(rows)
+    primes = prime_factors(modulus)
+    bases = {prime: {} for prime in primes}
+    indices = []
+
+    for index, row in enumerate(rows):
+        reduced_rows = {prime: reduce_row(basis, row, prime) for prime, basis in bases.items()}
+        if not all(any(reduced_row) for reduced_row in reduced_rows.values()):
+            continue
+
+        for prime, reduced_row in reduced_rows.items():
+            extend_basis(bases[prime], reduced_row, prime)
+
+        indices.append(index)
+        if len(indices) == count:
+            return indices
+
+    # A greedy choice can block the others when m has two prime factors, so the selection is completed with augmenting paths.
+    while len(primes) == 2 and len(indices) < count:
+        augmented = augment_rows(rows, indices, primes)
+        if augmented is None:
+            break
+        indices = augmented
+
+    return indices
@@ -0,0 +1,98 @@
+'''
+The monoalphabetic cracker recovers the key of a Caesar or an Affine ciphertext by scoring every possible key against English letter frequencies.
+
+Key recovery:
+    - Count the letters of the ciphertext once;
+    - For every candidate key, precompute where each plaintext letter is sent by the encryption;
+    - The plaintext histogram of a candidate is the ciphertext histogram read in that order, so no text has to be decrypted;
+    - Score all candidate histograms at once with the chi-squared statistic or the negative log-likelihood;
+    - Return the keys ranked from the most to the least likely.
+    - The Caesar cipher has 26 keys, the Affine cipher has 312 valid pairs (a, b).
+
+Взломщик моноалфавитных шифров восстанавливает ключ шифра Цезаря или аффинного шифра, оценивая каждый возможный ключ по частотам английских букв.
+
+Восстановление ключа:
+    - Буквы шифртекста подсчитываются один раз;
+    - Для каждого ключа-кандидата заранее вычисляется, в какую букву шифрование переводит каждую букву открытого текста;
+    - Гистограмма открытого текста для кандидата - это гистограмма шифртекста, прочитанная в этом порядке, поэтому расшифровывать текст не нужно;
+    - Все гистограммы кандидатов оцениваются сразу статистикой хи-квадрат или отрицательным логарифмическим правдоподобием;
+    - Ключи возвращаются в порядке от наиболее к наименее вероятному.
+    - У шифра Цезаря 26 ключей, у аффинного шифра 312 допустимых пар (a, b).
+
+Monoalfabeettinen murtaja selvittää Caesar- tai affiinin salatekstin avaimen pisteyttämällä jokaisen mahdollisen avaimen englannin kirjainfrekvenssejä vasten.
+
+Avaimen selvittäminen:
+    - Salatekstin kirjaimet lasketaan kerran;
+    - Jokaiselle avainehdokkaalle lasketaan etukäteen, mihin kirjaimeen salaus vie kunkin selvätekstin kirjaimen;
+    - Ehdokkaan selvätekstin histogrammi on salatekstin histogrammi tässä järjestyksessä luettuna, joten tekstiä ei tarvitse purkaa;
+    - Kaikki ehdokashistogrammit pisteytetään kerralla khiin neliö -testisuureella tai negatiivisella log-uskottavuudella;
+    - Avaimet palautetaan todennäköisimmästä epätodennäköisimpään.
+    - Caesar-salauksella on 26 avainta, affiinilla salauksella 312 kelvollista paria (a, b).
+'''
+
+import string
+from functools import lru_cache
+
+from .affine_cipher import AffineCipher
+from .caesar_cipher import CaesarCipher
+from .language_model import letter_histogram, numpy, score_histograms
+from .modular_arithmetic import greatest_common_divisor
+
+def encryption_map(encrypt) -> list:
+    encrypted_alphabet = encrypt(string.ascii_uppercase)
+    return [ord(character) - 65 for character in encrypted_alphabet]
+
+def candidate_array(maps: list):
+    if numpy:
+        return numpy.asarray(maps, dtype=numpy.intp)
+    return maps
+
+@lru_cache(maxsize=None)
+def caesar_candidates() -> tuple:
+    keys = list(range(26))
+    maps = [encryption_map(CaesarCipher(shift).encode) for shift in keys]
+    return keys, candidate_array(maps)
+
+@lru_cache(maxsize=None)
+def affine_candidates() -> tuple:
+    keys = []
+    for a in range(1, 26):
+        if greatest_common_divisor(a, 26) == 1:
+            for b in range(26):
+                keys.append((a, b))
+    maps = [encryption_map(AffineCipher(a, b).encode) for a, b in keys]
+    return keys, candidate_array(maps)
+
+def rank_candidates(histogram: list, keys: list, maps: list, method: str) -> list:
+    if numpy:
+        scores = score_histograms(numpy.asarray(histogram)[maps], method)
+        order = numpy.argsort(scores, kind='stable').tolist()
+        scores = scores.tolist()
+        return [(keys[index], scores[index]) for index in order]
+
+    candidate_histograms = []
+    for encryption in maps:
+        candidate_histograms.append([histogram[index] for index in encryption])
+    scores = score_histograms(candidate_histograms, method)
+
+    return sorted(zip(keys, scores), key=lambda candidate: candidate[1])
+
+def crack_caesar(ciphertext: str, method: str = 'chi-squared') -> list:
+    keys, maps = caesar_candidates()
+    return rank_candidates(letter_histogram(ciphertext), keys, maps, method)
+
+def crack_affine(ciphertext: str, method: str = 'chi-squared') -> list:
+    keys, maps = affine_candidates()
+    return rank_candidates(letter_histogram(ciphertext), keys, maps, method)
+
+if __name__ == "__main__":
+
+    plain_text = "IT WAS THE BEST OF TIMES, IT WAS THE WORST OF TIMES, IT WAS THE AGE OF WISDOM, IT WAS THE AGE OF FOOLISHNESS."
+
+    encoded_text = CaesarCipher(shift=11).encode(plain_text)
+    shift, score = crack_caesar(encoded_text)[0]
+    print(f"Caesar shift: {shift} (score {score:.2f})")
+
+    encoded_text = AffineCipher(5, 8).encode(plain_text)
+    (a, b), score = crack_affine(encoded_text)[0]
+    print(f"Affine key: a={a}, b={b} (score {score:.2f})")
@@ -0,0 +1,409 @@
+'''
+The packed container stores a ciphertext in a compact binary form: the letters are packed at under five bits each, and everything else is kept aside.
+
+Symbols:
+    - The ciphertext of every cipher is written over a small alphabet: 26 Latin letters, 25 letters without J for Playfair, or the 25 digit pairs 11-55 for Polybius;
+    - The text is split into runs of symbols and runs of other characters, such as spaces, punctuation and digits;
+    - Each symbol is replaced by its index in the alphabet, so lowercase and uppercase letters share an index.
+
+Packing:
+    - The indices are grouped by 13, and every group is written as one 64-bit number in base 26 or 25, because 26 to the power of 13 is less than 2 to the power of 62;
+    - This gives 64 / 13, about 4.9 bits per symbol, instead of 8 bits per letter or 24 bits per Polybius pair with its separator;
+    - With NumPy all groups are packed and unpacked at once with array arithmetic, otherwise one group at a time.
+
+Side channel:
+    - The lengths of all runs, the positions of the lowercase letters and the text of the other runs are kept in a side channel;
+    - The side channel is compressed with zlib, so the spaces between words and an uppercase ciphertext cost almost nothing.
+
+Format:
+    - The header records the format version, the cipher, the alphabet and the length of the text in characters;
+    - It is followed by frames, each holding the packed symbols and the side channel of one part of the text, and by an end marker;
+    - The container is written and read as a stream, one frame at a time, so a file of any size takes bounded memory;
+    - When the output cannot be rewound, the length in the header is left unknown.
+
+Упакованный контейнер хранит шифртекст в компактном двоичном виде: буквы упаковываются менее чем в пять бит каждая, а всё остальное хранится отдельно.
+
+Символы:
+    - Шифртекст любого шифра записывается в небольшом алфавите: 26 латинских букв, 25 букв без J для Плейфера или 25 пар цифр 11-55 для Полибия;
+    - Текст делится на серии символов и серии других знаков, например пробелов, знаков препинания и цифр;
+    - Каждый символ заменяется своим номером в алфавите, поэтому строчные и заглавные буквы имеют общий номер.
+
+Упаковка:
+    - Номера группируются по 13, и каждая группа записывается одним 64-битным числом по основанию 26 или 25, так как 26 в степени 13 меньше 2 в степени 62;
+    - Это даёт 64 / 13, около 4,9 бита на символ вместо 8 бит на букву или 24 бит на пару Полибия с разделителем;
+    - С NumPy все группы упаковываются и распаковываются сразу арифметикой массивов, иначе по одной группе.
+
+Побочный канал:
+    - Длины всех серий, позиции строчных букв и текст остальных серий хранятся в побочном канале;
+    - Побочный канал сжимается zlib, поэтому пробелы между словами и шифртекст из заглавных букв почти ничего не стоят.
+
+Формат:
+    - Заголовок содержит версию формата, шифр, алфавит и длину текста в символах;
+    - За ним следуют кадры, каждый с упакованными символами и побочным каналом одной части текста, и маркер конца;
+    - Контейнер записывается и читается потоком, по одному кадру, поэтому файл любого размера занимает ограниченную память;
+    - Если вывод нельзя перемотать, длина в заголовке остаётся неизвестной.
+
+Pakattu säiliö tallentaa salatekstin tiiviissä binäärimuodossa: kirjaimet pakataan alle viiteen bittiin kukin, ja kaikki muu säilytetään erikseen.
+
+Symbolit:
+    - Jokaisen salauksen salateksti kirjoitetaan pienellä aakkostolla: 26 latinalaista kirjainta, 25 kirjainta ilman J:tä Playfairille tai 25 numeroparia 11-55 Polybiokselle;
+    - Teksti jaetaan symbolien jaksoihin ja muiden merkkien, kuten välilyöntien, välimerkkien ja numeroiden, jaksoihin;
+    - Jokainen symboli korvataan sen indeksillä aakkostossa, joten pienet ja isot kirjaimet jakavat indeksin.
+
+Pakkaus:
+    - Indeksit ryhmitellään 13:n ryhmiin, ja jokainen ryhmä kirjoitetaan yhtenä 64-bittisenä lukuna kannassa 26 tai 25, koska 26 potenssiin 13 on pienempi kuin 2 potenssiin 62;
+    - Tämä antaa 64 / 13, noin 4,9 bittiä symbolia kohden 8 bitin kirjainta tai 24 bitin erottimellista Polybios-paria kohden sijaan;
+    - NumPyn kanssa kaikki ryhmät pakataan ja puretaan kerralla taulukkolaskennalla, muuten ryhmä kerrallaan.
+
+Sivukanava:
+    - Kaikkien jaksojen pituudet, pienten kirjainten sijainnit ja muiden jaksojen teksti säilytetään sivukanavassa;
+    - Sivukanava pakataan zlibillä, joten sanojen väliset välilyönnit ja isoin kirjaimin kirjoitettu salateksti eivät maksa juuri mitään.
+
+Muoto:
+    - Otsake sisältää muodon version, salauksen, aakkoston ja tekstin pituuden merkkeinä;
+    - Sen jälkeen tulevat kehykset, joista kukin sisältää yhden tekstin osan pakatut symbolit ja sivukanavan, sekä loppumerkki;
+    - Säiliö kirjoitetaan ja luetaan virtana kehys kerrallaan, joten minkä tahansa kokoinen tiedosto vie rajallisesti muistia;
+    - Jos tulostetta ei voi kelata taaksepäin, otsakkeen pituus jätetään tuntemattomaksi.
+'''
+
+import argparse
+import io
+import re
+import string
+import sys
+import zlib
+from array import array
+
+from .backends import numpy
+
+MAGIC = b'CCPK'
+VERSION = 1
+SYMBOLS_PER_WORD = 13
+WORD_SIZE = 8
+FRAME_SIZE = 1 << 20
+UNKNOWN_LENGTH = (1 << 64) - 1
+COMPRESSION_LEVEL = 6
+DATA_FRAME = 1
+END_FRAME = 0
+
+class PackingAlphabet:
+
+    def __init__(self, name: str, symbols: list, pattern: str, digit_pairs: bool = False):
+        self.name = name
+        self.size = len(symbols)
+        self.digit_pairs = digit_pairs
+        self.width = 2 if digit_pairs else 1
+        self.runs = re.compile(f'({pattern})')
+
+        index_table = bytearray(256)
+        symbol_table = bytearray(256)
+        for index, symbol in enumerate(symbols):
+            code = int(symbol, 16) if digit_pairs else ord(symbol)
+            index_table[code] = index
+            symbol_table[index] = code
+        self.index_table = bytes(index_table)
+        self.symbol_table = bytes(symbol_table)
+
+        self.powers = [self.size ** exponent for exponent in range(SYMBOLS_PER_WORD)]
+
+    def to_indices(self, symbols: str) -> bytes:
+        if self.digit_pairs:
+            return bytes.fromhex(symbols).translate(self.index_table)
+        return symbols.upper().encode('ascii').translate(self.index_table)
+
+    def from_indices(self, indices: bytes) -> str:
+        codes = indices.translate(self.symbol_table)
+        if self.digit_pairs:
+            return codes.hex()
+        return codes.decode('ascii')
+
+ALPHABETS = {
+    'latin': PackingAlphabet('latin', string.ascii_uppercase, '[A-Za-z]+'),
+    'latin-25': PackingAlphabet('latin-25', 'ABCDEFGHIKLMNOPQRSTUVWXYZ', '[A-IK-Za-ik-z]+'),
+    'polybius': PackingAlphabet('polybius', [f"{row}{column}" for row in range(1, 6) for column in range(1, 6)], '(?:[1-5][1-5])+', digit_pairs=True),
+}
+
+CIPHER_ALPHABETS = {
+    'playfair': 'latin-25',
+    'polybius': 'polybius',
+    'polybius-fixed': 'polybius',
+}
+
+def encode_varint(value: int) -> bytes:
+    result = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            result.append(byte | 0x80)
+        else:
+            result.append(byte)
+            return bytes(result)
+
+def read_varint(stream) -> int:
+    value = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            raise ValueError("The container ends in the middle of a number!")
+        value |= (byte[0] & 0x7F) << shift
+        shift += 7
+        if byte[0] < 0x80:
+            return value
+
+def read_exactly(stream, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("The container is truncated!")
+    return data
+
+def encode_string(value: str) -> bytes:
+    data = value.encode('utf-8')
+    return encode_varint(len(data)) + data
+
+def read_string(stream) -> str:
+    return read_exactly(stream, read_varint(stream)).decode('utf-8')
+
+def little_endian(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+def from_little_endian(data: bytes) -> array:
+    values = array('I')
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+def pack_indices(indices: bytes, alphabet: PackingAlphabet) -> bytes:
+    padded_indices = indices + bytes(-len(indices) % SYMBOLS_PER_WORD)
+
+    if numpy:
+        digits = numpy.frombuffer(padded_indices, dtype=numpy.uint8).reshape(-1, SYMBOLS_PER_WORD)
+        powers = numpy.array(alphabet.powers, dtype=numpy.uint64)
+        words = (digits.astype(numpy.uint64) * powers).sum(axis=1, dtype=numpy.uint64)
+        return words.astype('<u8').tobytes()
+
+    words = bytearray()
+    for start in range(0, len(padded_indices), SYMBOLS_PER_WORD):
+        value = 0
+        for digit in reversed(padded_indices[start:start + SYMBOLS_PER_WORD]):
+            value = value * alphabet.size + digit
+        words += value.to_bytes(WORD_SIZE, 'little')
+    return bytes(words)
+
+def unpack_indices(words: bytes, count: int, alphabet: PackingAlphabet) -> bytes:
+    if numpy:
+        values = numpy.frombuffer(words, dtype='<u8').astype(numpy.uint64)
+        powers = numpy.array(alphabet.powers, dtype=numpy.uint64)
+        digits = (values[:, None] // powers) % numpy.uint64(alphabet.size)
+        return digits.astype(numpy.uint8).tobytes()[:count]
+
+    indices = bytearray()
+    for start in range(0, len(words), WORD_SIZE):
+        value = int.from_bytes(words[start:start + WORD_SIZE], 'little')
+        for _ in range(SYMBOLS_PER_WORD):
+            value, digit = divmod(value, alphabet.size)
+            indices.append(digit)
+    return bytes(indices[:count])
+
+def encode_frame(text: str, alphabet: PackingAlphabet) -> bytes:
+    parts = alphabet.runs.split(text)
+    symbols = ''.join(parts[1::2])
+    others = ''.join(parts[0::2])
+
+    lowercase_runs = array('I')
+    if not alphabet.digit_pairs:
+        for match in re.finditer('[a-z]+', symbols):
+            lowercase_runs.extend(match.span())
+
+    side_channel = (encode_varint(len(parts)) + encode_varint(len(lowercase_runs))
+                    + little_endian(array('I', map(len, parts))) + little_endian(lowercase_runs)
+                    + others.encode('utf-8'))
+    compressed_side_channel = zlib.compress(side_channel, COMPRESSION_LEVEL)
+
+    count = len(symbols) // alphabet.width
+    return (bytes([DATA_FRAME]) + encode_varint(count) + encode_varint(len(compressed_side_channel))
+            + pack_indices(alphabet.to_indices(symbols), alphabet) + compressed_side_channel)
+
+def decode_frame(stream, alphabet: PackingAlphabet) -> str:
+    count = read_varint(stream)
+    side_channel_size = read_varint(stream)
+    words = read_exactly(stream, -(-count // SYMBOLS_PER_WORD) * WORD_SIZE)
+    side_channel = io.BytesIO(zlib.decompress(read_exactly(stream, side_channel_size)))
+
+    part_count = read_varint(side_channel)
+    lowercase_count = read_varint(side_channel)
+    lengths = from_little_endian(read_exactly(side_channel, 4 * part_count))
+    lowercase_runs = from_little_endian(read_exactly(side_channel, 4 * lowercase_count))
+    others = side_channel.read().decode('utf-8')
+
+    symbols = alphabet.from_indices(unpack_indices(words, count, alphabet))
+    if lowercase_runs:
+        pieces = []
+        position = 0
+        for index in range(0, len(lowercase_runs), 2):
+            start, end = lowercase_runs[index], lowercase_runs[index + 1]
+            pieces.append(symbols[position:start])
+            pieces.append(symbols[start:end].lower())
+            position = end
+        pieces.append(symbols[position:])
+        symbols = ''.join(pieces)
+
+    pieces = []
+    symbol_position = 0
+    other_position = 0
+    for index, length in enumerate(lengths):
+        if index % 2:
+            pieces.append(symbols[symbol_position:symbol_position + length])
+            symbol_position += length
+        else:
+            pieces.append(others[other_position:other_position + length])
+            other_position += length
+    return ''.join(pieces)
+
+class ContainerWriter:
+
+    def __init__(self, stream, cipher: str, alphabet: str = None, frame_size: int = FRAME_SIZE):
+        if frame_size < 1:
+            raise ValueError("Frame size must be positive!")
+
+        self.stream = stream
+        self.cipher = cipher
+        self.alphabet = ALPHABETS[alphabet or CIPHER_ALPHABETS.get(cipher, 'latin')]
+        self.frame_size = frame_size
+        self.pending = []
+        self.pending_length = 0
+        self.length = 0
+        self.closed = False
+
+        try:
+            self.length_position = stream.tell() + len(MAGIC) + 1 + len(encode_string(cipher)) + len(encode_string(self.alphabet.name))
+        except (AttributeError, OSError):
+            self.length_position = None
+
+        stream.write(MAGIC + bytes([VERSION]) + encode_string(cipher) + encode_string(self.alphabet.name)
+                     + UNKNOWN_LENGTH.to_bytes(WORD_SIZE, 'little'))
+
+    def write(self, text: str):
+        self.pending.append(text)
+        self.pending_length += len(text)
+        self.length += len(text)
+
+        if self.pending_length >= self.frame_size:
+            text = ''.join(self.pending)
+            split = len(text) - len(text) % self.frame_size
+            for start in range(0, split, self.frame_size):
+                self.stream.write(encode_frame(text[start:start + self.frame_size], self.alphabet))
+            self.pending = [text[split:]]
+            self.pending_length = len(text) - split
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+
+        if self.pending_length:
+            self.stream.write(encode_frame(''.join(self.pending), self.alphabet))
+        self.pending = []
+        self.stream.write(bytes([END_FRAME]))
+
+        if self.length_position is not None and self.stream.seekable():
+            end = self.stream.tell()
+            self.stream.seek(self.length_position)
+            self.stream.write(self.length.to_bytes(WORD_SIZE, 'little'))
+            self.stream.seek(end)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+class ContainerReader:
+
+    def __init__(self, stream):
+        self.stream = stream
+        if read_exactly(stream, len(MAGIC)) != MAGIC:
+            raise ValueError("Not a packed ciphertext container!")
+
+        version = read_exactly(stream, 1)[0]
+        if version != VERSION:
+            raise ValueError(f"Unsupported container version: {version}!")
+
+        self.cipher = read_string(stream)
+        alphabet = read_string(stream)
+        if alphabet not in ALPHABETS:
+            raise ValueError(f"Unknown alphabet: {alphabet}!")
+        self.alphabet = ALPHABETS[alphabet]
+
+        length = int.from_bytes(read_exactly(stream, WORD_SIZE), 'little')
+        self.length = None if length == UNKNOWN_LENGTH else length
+
+    def __iter__(self):
+        length = 0
+        while True:
+            frame_type = read_exactly(self.stream, 1)[0]
+            if frame_type == END_FRAME:
+                break
+            if frame_type != DATA_FRAME:
+                raise ValueError(f"Unknown frame type: {frame_type}!")
+
+            text = decode_frame(self.stream, self.alphabet)
+            length += len(text)
+            yield text
+
+        if self.length is not None and length != self.length:
+            raise ValueError(f"The container holds {length} characters, but its header records {self.length}!")
+
+    def read(self) -> str:
+        return ''.join(self)
+
+def pack(text: str, cipher: str, alphabet: str = None) -> bytes:
+    stream = io.BytesIO()
+    with ContainerWriter(stream, cipher, alphabet) as writer:
+        writer.write(text)
+    return stream.getvalue()
+
+def unpack(data: bytes) -> str:
+    return ContainerReader(io.BytesIO(data)).read()
+
+def pack_file(source_path: str, destination_path: str, cipher: str, alphabet: str = None, frame_size: int = FRAME_SIZE) -> int:
+    with open(source_path, 'r', encoding='utf-8', newline='') as source, open(destination_path, 'wb') as destination:
+        with ContainerWriter(destination, cipher, alphabet, frame_size) as writer:
+            while True:
+                text = source.read(frame_size)
+                if not text:
+                    break
+                writer.write(text)
+        return writer.length
+
+def unpack_file(source_path: str, destination_path: str) -> int:
+    length = 0
+    with open(source_path, 'rb') as source, open(destination_path, 'w', encoding='utf-8', newline='') as destination:
+        for text in ContainerReader(source):
+            destination.write(text)
+            length += len(text)
+    return length
+
+def main(arguments: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Pack a ciphertext into a compact binary container, or unpack it.")
+    parser.add_argument('operation', choices=['pack', 'unpack'])
+    parser.add_argument('source')
+    parser.add_argument('destination')
+    parser.add_argument('--cipher', default='caesar', help="the cipher that produced the ciphertext")
+    parser.add_argument('--alphabet', choices=sorted(ALPHABETS))
+    arguments = parser.parse_args(arguments)
+
+    if arguments.operation == 'pack':
+        length = pack_file(arguments.source, arguments.destination, arguments.cipher, arguments.alphabet)
+    else:
+        length = unpack_file(arguments.source, arguments.destination)
+
+    print(f"{length} characters", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+'''
+A cipher pipeline encrypts a text with several ciphers in turn, for example Caesar, then Atbash, then Affine, or Vigenère, then Rail Fence, and decrypts it by undoing them in the reverse order.
+
+Fusion:
+    - Consecutive substitution stages (Caesar, Atbash and Affine) are folded into one translation table, built from the ciphers' own per-character functions, so any number of them costs a single pass over the text;
+    - Consecutive Rail Fence stages are merged into one permutation of the text; the permutations of short texts are composed once for each length and kept in a cache, while a long text is permuted without a cache, through the index arrays of its code points with NumPy, or stage by stage without it;
+    - The other ciphers stay separate stages, and a single substitution or transposition is used as it is;
+    - The fused stages give exactly the same result as the ciphers applied one after another, including characters outside the alphabet.
+
+Streaming:
+    - The encoder and the decoder of a pipeline chain the stream transforms of its stages, so each chunk goes through every stage while it is still small, and no stage holds the whole text;
+    - Merged Rail Fence stages keep the spooled transforms of their ciphers when streaming, since a permutation of the whole text needs the whole text.
+
+Конвейер шифров шифрует текст несколькими шифрами по очереди, например Цезарем, затем Атбаш, затем аффинным шифром, или Виженером, затем «Железнодорожной изгородью», и расшифровывает его, отменяя их в обратном порядке.
+
+Слияние:
+    - Идущие подряд шифры замены (Цезарь, Атбаш и аффинный) сворачиваются в одну таблицу перевода, построенную из собственных посимвольных функций шифров, поэтому любое их число стоит одного прохода по тексту;
+    - Идущие подряд шифры «Железнодорожная изгородь» объединяются в одну перестановку текста; перестановки коротких текстов составляются один раз для каждой длины и хранятся в кэше, а длинный текст переставляется без кэша: через массивы индексов своих кодовых точек с NumPy или по ступеням без него;
+    - Остальные шифры остаются отдельными ступенями, а одиночная замена или перестановка используется как есть;
+    - Слитые ступени дают в точности тот же результат, что и шифры, применённые один за другим, включая символы вне алфавита.
+
+Потоковая обработка:
+    - Кодировщик и декодировщик конвейера связывают в цепочку потоковые преобразования его ступеней, поэтому каждая часть проходит через все ступени, пока она ещё мала, и ни одна ступень не держит весь текст;
+    - Объединённые ступени «Железнодорожной изгороди» при потоковой обработке сохраняют преобразования своих шифров с временными файлами, так как перестановке всего текста нужен весь текст.
+
+Salausputki salaa tekstin usealla salauksella vuorotellen, esimerkiksi Caesarilla, sitten Atbashilla, sitten affiinilla salauksella, tai Vigenèrellä, sitten aitasalauksella, ja purkaa sen kumoamalla ne käänteisessä järjestyksessä.
+
+Yhdistäminen:
+    - Peräkkäiset korvausvaiheet (Caesar, Atbash ja affiini) taitetaan yhdeksi käännöstaulukoksi, joka rakennetaan salausten omista merkkikohtaisista funktioista, joten mikä tahansa määrä niitä maksaa yhden kierroksen tekstin yli;
+    - Peräkkäiset aitasalausvaiheet yhdistetään yhdeksi tekstin permutaatioksi; lyhyiden tekstien permutaatiot muodostetaan kerran kullekin pituudelle ja säilytetään välimuistissa, kun taas pitkä teksti permutoidaan ilman välimuistia: koodipisteidensä indeksitaulukoiden kautta NumPylla tai ilman sitä vaihe kerrallaan;
+    - Muut salaukset jäävät erillisiksi vaiheiksi, ja yksittäistä korvausta tai siirtoa käytetään sellaisenaan;
+    - Yhdistetyt vaiheet antavat täsmälleen saman tuloksen kuin peräkkäin käytetyt salaukset, myös aakkoston ulkopuolisille merkeille.
+
+Virtakäsittely:
+    - Putken kooderi ja dekooderi ketjuttavat vaiheidensa virtamuunnokset, joten jokainen osa kulkee kaikkien vaiheiden läpi vielä pienenä, eikä mikään vaihe pidä koko tekstiä;
+    - Yhdistetyt aitasalausvaiheet käyttävät virtakäsittelyssä salaustensa väliaikaistiedostoihin tallentavia muunnoksia, koska koko tekstin permutaatio tarvitsee koko tekstin.
+'''
+
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+
+from .affine_cipher import AffineCipher
+from .atbash_cipher import AtbashCipher
+from .backends import numpy
+from .batch import cipher_function
+from .caesar_cipher import CaesarCipher
+from .rail_fence_cipher import CACHED_PERMUTATION_LENGTH, PERMUTATION_CACHE_SIZE, RailFenceCipher, permute_code_points
+from .rail_fence_cipher import zigzag_index_array, zigzag_permutation
+from .streaming import ChainTransform, StatelessTransform
+from .translation_table import TranslationTable
+
+SUBSTITUTION_CIPHERS = (AffineCipher, AtbashCipher, CaesarCipher)
+TRANSPOSITION_CIPHERS = (RailFenceCipher,)
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def fused_permutation(rails: tuple, length: int) -> tuple:
+    order = range(length)
+    for rail_count in rails:
+        order = [order[position] for position in zigzag_permutation(rail_count, length)]
+    return tuple(order)
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def fused_gatherers(rails: tuple, length: int) -> tuple:
+    permutation = fused_permutation(rails, length)
+
+    inverse = [0] * length
+    for index, position in enumerate(permutation):
+        inverse[position] = index
+
+    return itemgetter(*permutation), itemgetter(*inverse)
+
+def fused_index_array(rails: tuple, length: int):
+    order = numpy.arange(length, dtype=numpy.intp)
+    for rail_count in rails:
+        order = order[zigzag_index_array(rail_count, length)]
+    return order
+
+class SubstitutionStage:
+
+    def __init__(self, ciphers: list):
+        self.ciphers = tuple(ciphers)
+
+        characters = ''.join(dict.fromkeys(''.join(cipher.letters.characters for cipher in self.ciphers)))
+        self.encoding_table = TranslationTable(self.encode_character, characters)
+        self.decoding_table = TranslationTable(self.decode_character, characters)
+
+    def encode_character(self, character: str) -> str:
+        for cipher in self.ciphers:
+            character = cipher.encode(character)
+        return character
+
+    def decode_character(self, character: str) -> str:
+        for cipher in reversed(self.ciphers):
+            character = cipher.decode(character)
+        return character
+
+    def encode(self, text: str) -> str:
+        return self.encoding_table.translate(text)
+
+    def decode(self, text: str) -> str:
+        return self.decoding_table.translate(text)
+
+    def encoder(self):
+        return StatelessTransform(self.encode)
+
+    def decoder(self):
+        return StatelessTransform(self.decode)
+
+class TranspositionStage:
+
+    def __init__(self, ciphers: list):
+        self.ciphers = tuple(ciphers)
+        self.rails = tuple(cipher.rails for cipher in self.ciphers)
+
+    def permute_long(self, text: str, encrypt: bool) -> str:
+        if numpy:
+            return permute_code_points(text, fused_index_array(self.rails, len(text)), encrypt)
+
+        for cipher in (self.ciphers if encrypt else reversed(self.ciphers)):
+            text = cipher.permute(text, encrypt)
+        return text
+
+    def encode(self, text: str) -> str:
+        text = text.replace(" ", "")
+        if len(text) < 2:
+            return text
+        if len(text) > CACHED_PERMUTATION_LENGTH:
+            return self.permute_long(text, True)
+
+        encoding_gatherer, _ = fused_gatherers(self.rails, len(text))
+        return ''.join(encoding_gatherer(text))
+
+    def decode(self, text: str) -> str:
+        if len(text) < 2:
+            return text
+        if len(text) > CACHED_PERMUTATION_LENGTH:
+            return self.permute_long(text, False)
+
+        _, decoding_gatherer = fused_gatherers(self.rails, len(text))
+        return ''.join(decoding_gatherer(text))
+
+    def encoder(self):
+        return ChainTransform([cipher.encoder() for cipher in self.ciphers])
+
+    def decoder(self):
+        return ChainTransform([cipher.decoder() for cipher in reversed(self.ciphers)])
+
+def stage_kind(cipher):
+    if isinstance(cipher, SUBSTITUTION_CIPHERS):
+        return SubstitutionStage
+    if isinstance(cipher, TRANSPOSITION_CIPHERS):
+        return TranspositionStage
+    return None
+
+def fuse_stages(ciphers: list) -> list:
+    stages = []
+    for kind, group in groupby(ciphers, stage_kind):
+        group = list(group)
+        if kind is None or len(group) == 1:
+            stages.extend(group)
+        else:
+            stages.append(kind(group))
+    return stages
+
+class CipherPipeline:
+
+    def __init__(self, ciphers: list):
+        self.ciphers = tuple(ciphers)
+        if not self.ciphers:
+            raise ValueError("A pipeline needs at least one cipher!")
+
+        self.stages = fuse_stages(self.ciphers)
+        self.encoding_functions = [cipher_function(stage) for stage in self.stages]
+        self.decoding_functions = [cipher_function(stage, decrypt=True) for stage in reversed(self.stages)]
+
+    def encode(self, text: str) -> str:
+        for function in self.encoding_functions:
+            text = function(text)
+        return text
+
+    def decode(self, text: str) -> str:
+        for function in self.decoding_functions:
+            text = function(text)
+        return text
+
+    def encoder(self):
+        return ChainTransform([stage.encoder() for stage in self.stages])
+
+    def decoder(self):
+        return ChainTransform([stage.decoder() for stage in reversed(self.stages)])
+
+if __name__ == "__main__":
+
+    from .vigenere_cipher import VigenereCipher
+
+    pipeline = CipherPipeline([CaesarCipher(3), AtbashCipher(), AffineCipher(5, 8), VigenereCipher("LEMON"), RailFenceCipher(3), RailFenceCipher(4)])
+
+    plain_text = "HELLO, WORLD!"
+    encoded_text = pipeline.encode(plain_text)
+
+    print(f"Stages:       {[type(stage).__name__ for stage in pipeline.stages]}")
+    print(f"Plain text:   {plain_text}")
+    print(f"Encoded text: {encoded_text}")
+
+    decoded_text = pipeline.decode(encoded_text)
+    print(f"Decoded text: {decoded_text}")
@@ -0,0 +1,249 @@
+'''
+The Playfair annealing solver recovers the key square of a Playfair ciphertext without knowing the plaintext, using simulated annealing.
+
+Search:
+    - A candidate key is a permutation of the 25 letters of the square;
+    - The Playfair rules depend only on the positions of the letters in the square, so the digraph table of positions is built once;
+    - For every candidate, its digraph decryption table is built from the table of positions, and all ciphertext digraphs are decrypted with a single lookup;
+    - The fitness of a candidate is the sum of the log-probabilities of the n-grams of its plaintext, read from a table built once;
+    - Change the current square slightly: swap two letters, two rows or two columns, or flip or reverse the square;
+    - Always accept a better square, and accept a worse one with a probability that falls with the temperature;
+    - The temperature is lowered step by step, so the search settles on a good square.
+
+Parallel restarts:
+    - Every restart starts from a random square and runs in its own process;
+    - A restart is divided into epochs of temperatures, and each epoch is a separate task, so the solver can report the best key so far and stop when the time budget is spent;
+    - The best key of all restarts is returned as a 25-letter keyword that can be passed directly to the Playfair cipher.
+
+Решатель Плейфера методом отжига восстанавливает ключевой квадрат шифртекста Плейфера, не зная открытого текста, с помощью имитации отжига.
+
+Поиск:
+    - Ключ-кандидат - это перестановка 25 букв квадрата;
+    - Правила Плейфера зависят только от позиций букв в квадрате, поэтому таблица биграмм для позиций строится один раз;
+    - Для каждого кандидата его таблица расшифровки биграмм строится из таблицы позиций, и все биграммы шифртекста расшифровываются одним обращением к таблице;
+    - Оценка кандидата - это сумма логарифмов вероятностей n-грамм его открытого текста из таблицы, построенной один раз;
+    - Текущий квадрат немного изменяется: меняются местами две буквы, две строки или два столбца, либо квадрат отражается или переворачивается;
+    - Лучший квадрат принимается всегда, а худший - с вероятностью, которая уменьшается вместе с температурой;
+    - Температура понижается шаг за шагом, поэтому поиск останавливается на хорошем квадрате.
+
+Параллельные перезапуски:
+    - Каждый перезапуск начинается со случайного квадрата и выполняется в отдельном процессе;
+    - Перезапуск делится на эпохи температур, и каждая эпоха - отдельная задача, поэтому решатель может сообщать лучший найденный ключ и останавливаться, когда истекает отведённое время;
+    - Лучший ключ всех перезапусков возвращается как ключевое слово из 25 букв, которое можно сразу передать шифру Плейфера.
+
+Playfair-hehkutusratkaisija selvittää Playfair-salatekstin avainneliön tuntematta selvätekstiä simuloidun hehkutuksen avulla.
+
+Haku:
+    - Avainehdokas on neliön 25 kirjaimen permutaatio;
+    - Playfairin säännöt riippuvat vain kirjainten sijainneista neliössä, joten sijaintien digrammitaulukko rakennetaan kerran;
+    - Jokaiselle ehdokkaalle sen digrammien purkutaulukko rakennetaan sijaintitaulukosta, ja kaikki salatekstin digrammit puretaan yhdellä haulla;
+    - Ehdokkaan hyvyys on sen selvätekstin n-grammien log-todennäköisyyksien summa kerran rakennetusta taulukosta;
+    - Nykyistä neliötä muutetaan hieman: vaihdetaan kaksi kirjainta, kaksi riviä tai kaksi saraketta, tai neliö peilataan tai käännetään;
+    - Parempi neliö hyväksytään aina ja huonompi todennäköisyydellä, joka pienenee lämpötilan mukana;
+    - Lämpötilaa lasketaan askel kerrallaan, joten haku asettuu hyvään neliöön.
+
+Rinnakkaiset uudelleenkäynnistykset:
+    - Jokainen uudelleenkäynnistys alkaa satunnaisesta neliöstä ja suoritetaan omassa prosessissaan;
+    - Uudelleenkäynnistys jaetaan lämpötilojen jaksoihin, ja jokainen jakso on erillinen tehtävä, joten ratkaisija voi raportoida parhaan tähänastisen avaimen ja pysähtyä, kun aikabudjetti on käytetty;
+    - Kaikkien uudelleenkäynnistysten paras avain palautetaan 25 kirjaimen avainsanana, jonka voi antaa suoraan Playfair-salaukselle.
+'''
+
+import math
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+
+from .language_model import ENGLISH_SAMPLE, ngram_log_probabilities, numpy
+from .playfair_cipher import build_digraph_tables
+
+ALPHABET = "ABCDEFGHIKLMNOPQRSTUVWXYZ"
+NGRAM_SIZE = 3
+INITIAL_TEMPERATURE = 0.05
+TEMPERATURE_STEPS = 40
+ITERATIONS_PER_STEP = 3000
+STEPS_PER_EPOCH = 5
+
+worker_state = {}
+
+def ciphertext_digraphs(ciphertext: str) -> list:
+    letters = [ALPHABET.index(character) for character in ciphertext.upper().replace('J', 'I') if character in ALPHABET]
+    if not letters or len(letters) % 2 != 0:
+        raise ValueError("The ciphertext must contain an even, non-zero number of letters!")
+    return [letters[i] * 25 + letters[i + 1] for i in range(0, len(letters), 2)]
+
+@lru_cache(maxsize=None)
+def position_table():
+    matrix = []
+    for i in range(0, 25, 5):
+        matrix.append(list(ALPHABET[i:i + 5]))
+
+    _, table = build_digraph_tables(matrix, ALPHABET)
+    positions = [(ALPHABET.index(pair[0]), ALPHABET.index(pair[1])) for pair in table]
+
+    if numpy:
+        return numpy.asarray(positions, dtype=numpy.intp)
+    return positions
+
+def decryption_table(square: list):
+    positions = position_table()
+
+    if numpy:
+        square = numpy.asarray(square)
+        square_positions = numpy.empty(25, dtype=numpy.intp)
+        square_positions[square] = numpy.arange(25)
+        pairs = (square_positions[:, None] * 25 + square_positions).ravel()
+        return square[positions[pairs]]
+
+    square_positions = [0] * 25
+    for position, letter in enumerate(square):
+        square_positions[letter] = position
+
+    table = []
+    for first in square_positions:
+        for second in square_positions:
+            first_position, second_position = positions[first * 25 + second]
+            table.append((square[first_position], square[second_position]))
+    return table
+
+def fitness(square: list, digraphs, log_probabilities, ngram_size: int) -> float:
+    table = decryption_table(square)
+
+    if numpy:
+        letters = table[digraphs].ravel()
+        count = len(letters) - ngram_size + 1
+        codes = letters[:count].copy()
+        for offset in range(1, ngram_size):
+            codes = codes * 25 + letters[offset:count + offset]
+        return float(log_probabilities[codes].sum())
+
+    letters = [letter for digraph in digraphs for letter in table[digraph]]
+    score = 0.0
+    for position in range(len(letters) - ngram_size + 1):
+        code = 0
+        for letter in letters[position:position + ngram_size]:
+            code = code * 25 + letter
+        score += log_probabilities[code]
+    return score
+
+def modify_square(square: list, generator: random.Random) -> list:
+    square = list(square)
+    move = generator.random()
+
+    if move < 0.9:
+        first, second = generator.sample(range(25), 2)
+        square[first], square[second] = square[second], square[first]
+    elif move < 0.94:
+        first, second = generator.sample(range(5), 2)
+        for column in range(5):
+            square[first * 5 + column], square[second * 5 + column] = square[second * 5 + column], square[first * 5 + column]
+    elif move < 0.98:
+        first, second = generator.sample(range(5), 2)
+        for row in range(5):
+            square[row * 5 + first], square[row * 5 + second] = square[row * 5 + second], square[row * 5 + first]
+    elif move < 0.99:
+        square = [square[row * 5 + column] for row in range(4, -1, -1) for column in range(5)]
+    else:
+        square = square[::-1]
+
+    return square
+
+def initialize_worker(digraphs: list, ngram_size: int, corpus: str):
+    if numpy:
+        digraphs = numpy.asarray(digraphs, dtype=numpy.intp)
+
+    worker_state['digraphs'] = digraphs
+    worker_state['ngram_size'] = ngram_size
+    worker_state['log_probabilities'] = ngram_log_probabilities(ngram_size, corpus.upper().replace('J', 'I'), ALPHABET)
+
+def anneal_epoch(square: list, first_step: int, last_step: int, seed: int, deadline: float = None) -> tuple:
+    digraphs = worker_state['digraphs']
+    ngram_size = worker_state['ngram_size']
+    log_probabilities = worker_state['log_probabilities']
+    generator = random.Random(seed)
+
+    # The temperature is relative to the number of n-grams, so it does not depend on the ciphertext length.
+    scale = INITIAL_TEMPERATURE * len(digraphs) * 2
+
+    score = fitness(square, digraphs, log_probabilities, ngram_size)
+    best_square, best_score = square, score
+
+    for step in range(first_step, last_step):
+        temperature = scale * (1 - step / TEMPERATURE_STEPS)
+
+        for _ in range(ITERATIONS_PER_STEP):
+            candidate = modify_square(square, generator)
+            candidate_score = fitness(candidate, digraphs, log_probabilities, ngram_size)
+            difference = candidate_score - score
+
+            if difference >= 0 or (temperature > 0 and generator.random() < math.exp(difference / temperature)):
+                square, score = candidate, candidate_score
+                if score > best_score:
+                    best_square, best_score = square, score
+
+        if deadline is not None and time.time() >= deadline:
+            break
+
+    return square, best_square, best_score
+
+def square_to_key(square: list) -> str:
+    return ''.join(ALPHABET[index] for index in square)
+
+def crack_playfair(ciphertext: str, restarts: int = None, workers: int = None, time_budget: float = None, progress=None,
+                   ngram_size: int = NGRAM_SIZE, corpus: str = ENGLISH_SAMPLE, seed: int = None) -> tuple:
+    digraphs = ciphertext_digraphs(ciphertext)
+    workers = workers or os.cpu_count() or 1
+    restarts = restarts or workers
+    generator = random.Random(seed)
+    deadline = None if time_budget is None else time.time() + time_budget
+
+    best_key, best_score = None, -math.inf
+    completed_epochs = 0
+    total_epochs = restarts * math.ceil(TEMPERATURE_STEPS / STEPS_PER_EPOCH)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker, initargs=(digraphs, ngram_size, corpus)) as executor:
+        pending = {}
+
+        def submit(square: list, first_step: int):
+            last_step = min(first_step + STEPS_PER_EPOCH, TEMPERATURE_STEPS)
+            future = executor.submit(anneal_epoch, square, first_step, last_step, generator.getrandbits(64), deadline)
+            pending[future] = last_step
+
+        for _ in range(restarts):
+            square = list(range(25))
+            generator.shuffle(square)
+            submit(square, 0)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                last_step = pending.pop(future)
+                square, epoch_square, epoch_score = future.result()
+                completed_epochs += 1
+
+                if epoch_score > best_score:
+                    best_key, best_score = square_to_key(epoch_square), epoch_score
+
+                if progress is not None:
+                    progress(best_key, best_score, completed_epochs / total_epochs)
+
+                if last_step < TEMPERATURE_STEPS and (deadline is None or time.time() < deadline):
+                    submit(square, last_step)
+
+    return best_key, best_score
+
+if __name__ == "__main__":
+
+    from .playfair_cipher import PlayfairCipher
+
+    plaintext = ENGLISH_SAMPLE[:1200]
+    ciphertext = PlayfairCipher("MONARCHY").encrypt(plaintext)
+
+    def report(key, score, fraction):
+        print(f"{fraction:6.1%} {key} {score:.1f}")
+
+    key, score = crack_playfair(ciphertext, time_budget=60, progress=report, seed=1)
+    print(f"Key square: {key}")
+    print(f"Decrypted text: {PlayfairCipher(key).decrypt(ciphertext)[:80]}")
@@ -66,14 +66,60 @@ Purku:
         - Korvataan kirjaimet niiden lasketuissa sijainneissa olevilla kirjaimilla.
 '''
 
+from .backends import numpy
+from .key_schedule import key_schedules, schedule_attributes
+from .streaming import PlayfairDecryptTransform, PlayfairEncryptTransform
+
+MINIMUM_VECTORIZED_LENGTH = 256
+SCHEDULE_ATTRIBUTES = ('matrix', 'letter_indices', 'encryption_table', 'decryption_table')
+NUMPY_SCHEDULE_ATTRIBUTES = ('code_indices', 'encryption_array', 'decryption_array')
+
+def build_digraph_tables(matrix: list, alphabet: str) -> tuple:
+    positions = {}
+    for row_index, row in enumerate(matrix):
+        for column_index, character in enumerate(row):
+            positions[character] = (row_index, column_index)
+
+    encryption_table = []
+    decryption_table = []
+
+    for first in alphabet:
+        for second in alphabet:
+            encryption_table.append(transform_pair(matrix, positions, first, second, 1))
+            decryption_table.append(transform_pair(matrix, positions, first, second, -1))
+
+    return encryption_table, decryption_table
+
+def transform_pair(matrix: list, positions: dict, first: str, second: str, step: int) -> str:
+    row_1, column_1 = positions[first]
+    row_2, column_2 = positions[second]
+
+    if row_1 == row_2:
+        return matrix[row_1][(column_1 + step) % 5] + matrix[row_2][(column_2 + step) % 5]
+
+    if column_1 == column_2:
+        return matrix[(row_1 + step) % 5][column_1] + matrix[(row_2 + step) % 5][column_2]
+
+    return matrix[row_1][column_2] + matrix[row_2][column_1]
+
 class PlayfairCipher:
 
     def __init__(self, keyword: str):
 
         self.keyword = keyword.upper().replace('J', 'I')
         self.alphabet = "ABCDEFGHIKLMNOPQRSTUVWXYZ"
+        self.__dict__.update(key_schedules.get((type(self), self.keyword), self.create_schedule))
+
+    def create_schedule(self) -> dict:
         self.matrix = self.create_matrix()
 
+        self.letter_indices = {}
+        for index, character in enumerate(self.alphabet):
+            self.letter_indices[character] = index
+
+        self.encryption_table, self.decryption_table = build_digraph_tables(self.matrix, self.alphabet)
+        return schedule_attributes(self, SCHEDULE_ATTRIBUTES)
+
     def create_matrix(self):
         seen = set()
         matrix = []
@@ -81,7 +127,8 @@ class PlayfairCipher:
         for character in self.keyword:
             character = character.upper()
 
-            if character not in seen:
+            # Spaces, digits and other characters of the keyword have no cell in the square.
+            if character in self.alphabet and character not in seen:
                 seen.add(character)
                 matrix.append(character)
 
@@ -97,95 +144,139 @@ class PlayfairCipher:
 
         return rows
 
+    def create_lookup_arrays(self) -> dict:
+        self.code_indices = numpy.full(256, -1, dtype=numpy.int16)
+        for character, index in self.letter_indices.items():
+            self.code_indices[ord(character)] = index
+
+        self.encryption_array = numpy.frombuffer(''.join(self.encryption_table).encode('ascii'), dtype=numpy.uint8).reshape(625, 2)
+        self.decryption_array = numpy.frombuffer(''.join(self.decryption_table).encode('ascii'), dtype=numpy.uint8).reshape(625, 2)
+        return schedule_attributes(self, NUMPY_SCHEDULE_ATTRIBUTES)
+
     def find_position(self, character: str):
         for row_index, row in enumerate(self.matrix):
             if character in row:
                 return row_index, row.index(character)
         raise ValueError(f"Character {character} not found in matrix!")
 
-    def format_text(self, text: str):
+    def letter_index(self, character: str) -> int:
+        if character in self.letter_indices:
+            return self.letter_indices[character]
+        raise ValueError(f"Character {character} not found in matrix!")
+
+    def is_vectorizable(self, text: str) -> bool:
+        if len(text) < MINIMUM_VECTORIZED_LENGTH or not text.isascii() or not numpy:
+            return False
+
+        if 'code_indices' not in self.__dict__:
+            self.__dict__.update(key_schedules.get((type(self), self.keyword, 'numpy'), self.create_lookup_arrays))
+        return True
+
+    def letters_only(self, text: str) -> str:
         text = text.upper().replace('J', 'I')
-        formatted_text = []
 
-        text = ''.join([c for c in text if c.isalpha()])
+        if self.is_vectorizable(text):
+            codes = numpy.frombuffer(text.encode('ascii'), dtype=numpy.uint8)
+            return codes[self.code_indices[codes] >= 0].tobytes().decode('ascii')
+
+        return ''.join([c for c in text if c.isalpha()])
+
+    def pair_letters(self, letters: str, final: bool = True) -> tuple:
+        if self.is_vectorizable(letters):
+            return self.pair_letter_array(letters, final)
+
+        pairs = []
 
         i = 0
-        while i < len(text):
-            if i + 1 < len(text):
-                if text[i] == text[i + 1]:
-                    formatted_text.append(text[i] + 'X')
+        while i < len(letters):
+            if i + 1 < len(letters):
+                if letters[i] == letters[i + 1]:
+                    pairs.append(letters[i] + 'X')
                     i += 1
                 else:
-                    formatted_text.append(text[i] + text[i + 1])
+                    pairs.append(letters[i] + letters[i + 1])
                     i += 2
-            else:
-                formatted_text.append(text[i] + 'X')
+            elif final:
+                pairs.append(letters[i] + 'X')
                 i += 1
-        return formatted_text
+            else:
+                return ''.join(pairs), letters[i]
 
-    def encrypt(self, text: str) -> str:
-        formatted_text = self.format_text(text)
-        ciphertext = []
+        return ''.join(pairs), ''
+
+    def pair_letter_array(self, letters: str, final: bool) -> tuple:
+        codes = numpy.frombuffer(letters.encode('ascii'), dtype=numpy.uint8)
 
-        for pair in formatted_text:
-            row_1, column_1 = self.find_position(pair[0])
-            row_2, column_2 = self.find_position(pair[1])
+        doubled_positions = numpy.flatnonzero(codes[:-1] == codes[1:])
+        insert_positions = []
+        pair_start = 0
 
-            if row_1 == row_2:
-                next_column_1 = (column_1 + 1) % 5
-                next_column_2 = (column_2 + 1) % 5
-                new_char_1 = self.matrix[row_1][next_column_1]
-                new_char_2 = self.matrix[row_2][next_column_2]
-                ciphertext.append(new_char_1 + new_char_2)
+        for position in doubled_positions.tolist():
+            if (position - pair_start) % 2 == 0:
+                insert_positions.append(position + 1)
+                pair_start = position + 1
 
-            elif column_1 == column_2:
-                next_row_1 = (row_1 + 1) % 5
-                next_row_2 = (row_2 + 1) % 5
-                new_char_1 = self.matrix[next_row_1][column_1]
-                new_char_2 = self.matrix[next_row_2][column_2]
-                ciphertext.append(new_char_1 + new_char_2)
+        codes = numpy.insert(codes, insert_positions, ord('X'))
+        remainder = ''
 
+        if len(codes) % 2 != 0:
+            if final:
+                codes = numpy.append(codes, numpy.uint8(ord('X')))
             else:
-                new_char_1 = self.matrix[row_1][column_2]
-                new_char_2 = self.matrix[row_2][column_1]
-                ciphertext.append(new_char_1 + new_char_2)
+                remainder = chr(codes[-1])
+                codes = codes[:-1]
+
+        return codes.tobytes().decode('ascii'), remainder
+
+    def format_text(self, text: str):
+        pairs, _ = self.pair_letters(self.letters_only(text))
+
+        formatted_text = []
+        for i in range(0, len(pairs), 2):
+            formatted_text.append(pairs[i:i + 2])
+        return formatted_text
+
+    def encrypt_pairs(self, pairs: str) -> str:
+        if self.is_vectorizable(pairs):
+            indices = self.code_indices[numpy.frombuffer(pairs.encode('ascii'), dtype=numpy.uint8)].reshape(-1, 2)
+            digraphs = indices[:, 0] * 25 + indices[:, 1]
+            return self.encryption_array[digraphs].tobytes().decode('ascii')
+
+        ciphertext = []
+
+        for i in range(0, len(pairs), 2):
+            digraph = self.letter_index(pairs[i]) * 25 + self.letter_index(pairs[i + 1])
+            ciphertext.append(self.encryption_table[digraph])
 
         return ''.join(ciphertext)
 
+    def encrypt(self, text: str) -> str:
+        pairs, _ = self.pair_letters(self.letters_only(text))
+        return self.encrypt_pairs(pairs)
+
     def decrypt(self, text: str) -> str:
-        formatted_text = []
-        plaintext = []
+        if self.is_vectorizable(text) and len(text) % 2 == 0:
+            indices = self.code_indices[numpy.frombuffer(text.encode('ascii'), dtype=numpy.uint8)]
+            if numpy.all(indices >= 0):
+                pairs = indices.reshape(-1, 2)
+                digraphs = pairs[:, 0] * 25 + pairs[:, 1]
+                return self.decryption_array[digraphs].tobytes().decode('ascii').replace('X', '')
 
-        i = 0
-        while i < len(text):
-            formatted_text.append(text[i:i+2])
-            i += 2
-
-        for pair in formatted_text:
-            row_1, column_1 = self.find_position(pair[0])
-            row_2, column_2 = self.find_position(pair[1])
-
-            if row_1 == row_2:
-                next_column_1 = (column_1 - 1) % 5
-                next_column_2 = (column_2 - 1) % 5
-                new_char_1 = self.matrix[row_1][next_column_1]
-                new_char_2 = self.matrix[row_2][next_column_2]
-                plaintext.append(new_char_1 + new_char_2)
-
-            elif column_1 == column_2:
-                next_row_1 = (row_1 - 1) % 5
-                next_row_2 = (row_2 - 1) % 5
-                new_char_1 = self.matrix[next_row_1][column_1]
-                new_char_2 = self.matrix[next_row_2][column_2]
-                plaintext.append(new_char_1 + new_char_2)
+        plaintext = []
 
-            else:
-                new_char_1 = self.matrix[row_1][column_2]
-                new_char_2 = self.matrix[row_2][column_1]
-                plaintext.append(new_char_1 + new_char_2)
+        for i in range(0, len(text), 2):
+            pair = text[i:i + 2]
+            digraph = self.letter_index(pair[0]) * 25 + self.letter_index(pair[1])
+            plaintext.append(self.decryption_table[digraph])
 
         return ''.join(plaintext).replace('X', '')
 
+    def encoder(self):
+        return PlayfairEncryptTransform(self)
+
+    def decoder(self):
+        return PlayfairDecryptTransform(self)
+
 if __name__ == "__main__":
 
     keyword = "KEYWORD"
@@ -0,0 +1,191 @@
+'''
+The polyalphabetic analysis recovers the keyword of a Vigenère or a Beaufort ciphertext without knowing the plaintext.
+
+Key length:
+    - Convert the letters of the ciphertext into an array of indices;
+    - For every candidate period, split the letters into columns by their position modulo the period;
+    - The index of coincidence of each column is close to that of English only when the period is a multiple of the key length;
+    - Kasiski examination: repeated trigrams are usually encrypted by the same part of the key, so the distances between repeats tend to be multiples of the key length;
+    - Among the periods whose index of coincidence is close to the best one, the period with the most Kasiski repeats is taken as the key length, and the shortest one on a tie.
+
+Key letters:
+    - Each column is a Caesar-like cipher with a single key letter;
+    - The plaintext histogram of a column for every key letter is a permutation of the column histogram;
+    - All 26 letters of all columns are scored at once, and the best letter of each column forms the keyword;
+    - When the period found is a multiple of the key length, the keyword repeats itself and is shortened to a single repetition.
+
+Полиалфавитный анализ восстанавливает ключевое слово шифртекста Виженера или Бофорта, не зная открытого текста.
+
+Длина ключа:
+    - Буквы шифртекста преобразуются в массив индексов;
+    - Для каждого периода-кандидата буквы делятся на столбцы по остатку позиции от деления на период;
+    - Индекс совпадений каждого столбца близок к английскому, только если период кратен длине ключа;
+    - Метод Казиски: повторяющиеся триграммы обычно шифруются одной и той же частью ключа, поэтому расстояния между повторами, как правило, кратны длине ключа;
+    - Среди периодов, индекс совпадений которых близок к лучшему, за длину ключа принимается период с наибольшим числом повторов Казиски, а при равенстве - самый короткий.
+
+Буквы ключа:
+    - Каждый столбец - это шифр, подобный шифру Цезаря, с одной буквой ключа;
+    - Гистограмма открытого текста столбца для каждой буквы ключа - это перестановка гистограммы столбца;
+    - Все 26 букв всех столбцов оцениваются сразу, и лучшая буква каждого столбца образует ключевое слово;
+    - Если найденный период кратен длине ключа, ключевое слово повторяет само себя и сокращается до одного повтора.
+
+Polyalfabeettinen analyysi selvittää Vigenère- tai Beaufort-salatekstin avainsanan tuntematta selvätekstiä.
+
+Avaimen pituus:
+    - Salatekstin kirjaimet muutetaan indeksien taulukoksi;
+    - Jokaiselle jaksoehdokkaalle kirjaimet jaetaan sarakkeisiin niiden sijainnin jakojäännöksen mukaan;
+    - Sarakkeiden yhteensattumisindeksi on lähellä englannin arvoa vain, kun jakso on avaimen pituuden monikerta;
+    - Kasiskin menetelmä: toistuvat kolmen kirjaimen jonot salataan yleensä samalla avaimen osalla, joten toistojen väliset etäisyydet ovat yleensä avaimen pituuden monikertoja;
+    - Jaksoista, joiden yhteensattumisindeksi on lähellä parasta, avaimen pituudeksi valitaan se, jolla on eniten Kasiskin toistoja, ja tasatilanteessa lyhin.
+
+Avaimen kirjaimet:
+    - Jokainen sarake on Caesarin kaltainen salaus yhdellä avainkirjaimella;
+    - Sarakkeen selvätekstin histogrammi kullekin avainkirjaimelle on sarakkeen histogrammin permutaatio;
+    - Kaikkien sarakkeiden kaikki 26 kirjainta pisteytetään kerralla, ja kunkin sarakkeen paras kirjain muodostaa avainsanan;
+    - Jos löydetty jakso on avaimen pituuden monikerta, avainsana toistaa itseään ja lyhennetään yhteen toistoon.
+'''
+
+import string
+from functools import lru_cache
+
+from .beaufort_cipher import BeaufortCipher
+from .language_model import numpy, score_histograms
+from .monoalphabetic_cracker import encryption_map
+from .vigenere_cipher import VigenereCipher
+
+MAXIMUM_PERIOD = 20
+PERIOD_TOLERANCE = 0.9
+
+@lru_cache(maxsize=None)
+def column_candidates(cipher_name: str) -> list:
+    if cipher_name == 'vigenere':
+        maps = [encryption_map(VigenereCipher(letter).encrypt) for letter in string.ascii_uppercase]
+    else:
+        maps = [encryption_map(BeaufortCipher(letter).encode) for letter in string.ascii_uppercase]
+    if numpy:
+        return numpy.asarray(maps, dtype=numpy.intp)
+    return maps
+
+def letter_indices(text: str):
+    if numpy and text.isascii():
+        codes = numpy.frombuffer(text.encode('ascii'), dtype=numpy.uint8) | 32
+        return codes[(codes >= 97) & (codes <= 122)].astype(numpy.intp) - 97
+
+    indices = []
+    for character in text.upper():
+        if 'A' <= character <= 'Z':
+            indices.append(ord(character) - 65)
+    if numpy:
+        return numpy.asarray(indices, dtype=numpy.intp)
+    return indices
+
+def column_histograms(indices, period: int):
+    if numpy:
+        columns = numpy.arange(len(indices)) % period
+        return numpy.bincount(columns * 26 + indices, minlength=period * 26).reshape(period, 26)
+
+    histograms = [[0] * 26 for _ in range(period)]
+    for position, index in enumerate(indices):
+        histograms[position % period][index] += 1
+    return histograms
+
+def index_of_coincidence(histograms) -> float:
+    total = 0.0
+    for histogram in histograms:
+        length = sum(histogram)
+        if length > 1:
+            total += sum(count * (count - 1) for count in histogram) / (length * (length - 1))
+    return total / len(histograms)
+
+def coincidence_by_period(indices, maximum_period: int = MAXIMUM_PERIOD) -> dict:
+    coincidences = {}
+    for period in range(1, max(min(maximum_period, len(indices) // 2), 1) + 1):
+        histograms = column_histograms(indices, period)
+        if numpy:
+            lengths = histograms.sum(axis=1)
+            pairs = numpy.maximum(lengths * (lengths - 1), 1)
+            coincidences[period] = float(((histograms * (histograms - 1)).sum(axis=1) / pairs).mean())
+        else:
+            coincidences[period] = index_of_coincidence(histograms)
+    return coincidences
+
+def kasiski_distances(indices):
+    if len(indices) < 3:
+        return []
+
+    if numpy:
+        trigrams = indices[:-2] * 676 + indices[1:-1] * 26 + indices[2:]
+        order = numpy.argsort(trigrams, kind='stable')
+        sorted_trigrams = trigrams[order]
+        repeats = sorted_trigrams[1:] == sorted_trigrams[:-1]
+        return (order[1:] - order[:-1])[repeats]
+
+    last_positions = {}
+    distances = []
+    for position in range(len(indices) - 2):
+        trigram = tuple(indices[position:position + 3])
+        if trigram in last_positions:
+            distances.append(position - last_positions[trigram])
+        last_positions[trigram] = position
+    return distances
+
+def kasiski_by_period(indices, maximum_period: int = MAXIMUM_PERIOD) -> dict:
+    distances = kasiski_distances(indices)
+    scores = {}
+
+    for period in range(1, maximum_period + 1):
+        if len(distances) == 0:
+            scores[period] = 0.0
+        elif numpy:
+            scores[period] = float((distances % period == 0).mean())
+        else:
+            scores[period] = sum(1 for distance in distances if distance % period == 0) / len(distances)
+
+    return scores
+
+def estimate_period(indices, maximum_period: int = MAXIMUM_PERIOD) -> int:
+    coincidences = coincidence_by_period(indices, maximum_period)
+    kasiski_scores = kasiski_by_period(indices, maximum_period)
+    best_coincidence = max(coincidences.values())
+
+    candidates = []
+    for period, coincidence in coincidences.items():
+        if coincidence >= PERIOD_TOLERANCE * best_coincidence:
+            candidates.append(period)
+
+    return max(candidates, key=lambda period: (kasiski_scores[period], -period))
+
+def solve_columns(indices, period: int, cipher_name: str, method: str = 'chi-squared') -> str:
+    maps = column_candidates(cipher_name)
+    histograms = column_histograms(indices, period)
+
+    if numpy:
+        scores = score_histograms(histograms[:, maps], method)
+        return ''.join(string.ascii_uppercase[letter] for letter in scores.argmin(axis=1).tolist())
+
+    keyword = []
+    for histogram in histograms:
+        candidates = [[histogram[index] for index in encryption] for encryption in maps]
+        scores = score_histograms(candidates, method)
+        keyword.append(string.ascii_uppercase[scores.index(min(scores))])
+    return ''.join(keyword)
+
+def shortest_repeating_unit(keyword: str) -> str:
+    for length in range(1, len(keyword)):
+        if len(keyword) % length == 0 and keyword[:length] * (len(keyword) // length) == keyword:
+            return keyword[:length]
+    return keyword
+
+def crack(ciphertext: str, cipher_name: str, maximum_period: int = MAXIMUM_PERIOD, method: str = 'chi-squared') -> str:
+    indices = letter_indices(ciphertext)
+    if len(indices) == 0:
+        raise ValueError("The ciphertext contains no letters!")
+
+    period = estimate_period(indices, maximum_period)
+    return shortest_repeating_unit(solve_columns(indices, period, cipher_name, method))
+
+def crack_vigenere(ciphertext: str, maximum_period: int = MAXIMUM_PERIOD, method: str = 'chi-squared') -> str:
+    return crack(ciphertext, 'vigenere', maximum_period, method)
+
+def crack_beaufort(ciphertext: str, maximum_period: int = MAXIMUM_PERIOD, method: str = 'chi-squared') -> str:
+    return crack(ciphertext, 'beaufort', maximum_period, method)
@@ -0,0 +1,193 @@
+'''
+The Polybius cipher is a substitution cipher that encrypts each letter as a pair of digits based on its position in a fixed 5×5 grid.
+
+Encryption:
+    - Use a 5×5 grid filled with the letters of the alphabet;
+    - Number the rows and columns from 1 to 5;
+    - For each letter in the plaintext:
+        - Locate the letter in the grid;
+        - Replace it with its row and column numbers.
+    - The result is a series of digit pairs;
+    - Non-letter characters are skipped or processed separately.
+
+Decryption:
+    - Split the ciphertext into pairs of digits;
+    - For each pair:
+        - The first digit is the row number, the second is the column number;
+        - Find the letter located at that position in the 5×5 grid.
+    - Combine the letters to recover the original message.
+
+Output formats:
+    - By default every letter becomes a two-digit token and the tokens, including other characters, are separated by spaces;
+    - In the fixed-width mode the letters are written as digit pairs without separators and other characters are dropped;
+    - Encoding applies a precomputed table from each character to its token with one call to str.translate;
+    - Decoding accepts both formats: after the spaces are removed, a text made only of digit pairs is read as hexadecimal bytes, so each pair becomes the byte 16 × row + column;
+    - These bytes are mapped to letters through a 256-entry table with bytes.translate in one step, and pairs outside the grid are dropped;
+    - Any other text is decoded by a regular expression that replaces each pair of digits with its letter.
+
+Шифр Полибия - это подстановочный шифр, в котором каждая буква заменяется парой цифр, указывающих её координаты в постоянной таблице 5×5.
+
+Зашифровка:
+    - Используется таблица 5×5, заполненная буквами алфавита;
+    - Строки и столбцы нумеруются от 1 до 5;
+    - Для каждой буквы открытого текста:
+        - Определяется её место в таблице;
+        - Буква заменяется на пару цифр: номер строки и номер столбца.
+    - В результате получается последовательность пар чисел;
+    - Неалфавитные символы пропускаются или обрабатываются отдельно.
+
+Расшифровка:
+    - Шифртекст делится на пары цифр;
+    - Для каждой пары:
+        - Первая цифра - номер строки, вторая - номер столбца;
+        - Определяется буква, находящаяся в данной позиции таблицы 5×5.
+    - Из этих букв собирается исходное сообщение.
+
+Форматы вывода:
+    - По умолчанию каждая буква становится двухзначным токеном, а токены, включая другие символы, разделяются пробелами;
+    - В режиме фиксированной ширины буквы записываются парами цифр без разделителей, а другие символы отбрасываются;
+    - Зашифровка применяет заранее вычисленную таблицу из символа в его токен одним вызовом str.translate;
+    - Расшифровка принимает оба формата: после удаления пробелов текст только из пар цифр читается как шестнадцатеричные байты, поэтому каждая пара становится байтом 16 × строка + столбец;
+    - Эти байты за один шаг отображаются в буквы через таблицу из 256 элементов методом bytes.translate, а пары вне таблицы отбрасываются;
+    - Любой другой текст расшифровывается регулярным выражением, заменяющим каждую пару цифр её буквой.
+
+Polybiuksen neliö on korvaussalaus, jossa jokainen kirjain salataan numeroparina sen sijainnin perusteella kiinteässä 5×5-ruudukossa.
+
+Salaus:
+    - Käytetään 5×5-ruudukkoa, joka on täytetty aakkoston kirjaimilla;
+    - Numeroidaan rivit ja sarakkeet luvuilla 1–5;
+    - Jokaiselle selvätekstin kirjaimelle:
+        - Etsitään kirjaimen sijainti ruudukossa;
+        - Korvataan kirjain sen rivi- ja sarakenumeroilla.
+    - Tuloksena on numerosarjoista koostuva parijono;
+    - Muut kuin kirjaimet ohitetaan tai käsitellään erikseen.
+
+Purku:
+    - Jaetaan salateksti numeropareihin;
+    - Jokaiselle parille:
+        - Ensimmäinen numero on rivinumero ja toinen sarakenumero;
+        - Etsitään kirjain, joka sijaitsee kyseisessä kohdassa 5×5-ruudukossa.
+    - Yhdistetään kirjaimet alkuperäisen viestin palauttamiseksi.
+
+Tulosmuodot:
+    - Oletuksena jokaisesta kirjaimesta tulee kaksinumeroinen merkki, ja merkit, myös muut merkit, erotetaan välilyönneillä;
+    - Kiinteän leveyden tilassa kirjaimet kirjoitetaan numeropareina ilman erottimia ja muut merkit jätetään pois;
+    - Salaus soveltaa valmiiksi laskettua taulukkoa merkistä sen koodiin yhdellä str.translate-kutsulla;
+    - Purku hyväksyy molemmat muodot: välilyöntien poiston jälkeen pelkistä numeropareista koostuva teksti luetaan heksadesimaalitavuina, joten jokaisesta parista tulee tavu 16 × rivi + sarake;
+    - Nämä tavut kuvataan kirjaimiksi 256 alkion taulukon kautta bytes.translate-metodilla yhdellä askeleella, ja ruudukon ulkopuoliset parit jätetään pois;
+    - Muu teksti puretaan säännöllisellä lausekkeella, joka korvaa jokaisen numeroparin sen kirjaimella.
+'''
+
+import re
+
+from .key_schedule import key_schedules, schedule_attributes
+from .streaming import PolybiusDecodeTransform, PolybiusEncodeTransform
+from .translation_table import TranslationTable
+
+PAIR_PATTERN = re.compile(r'\d\d')
+SCHEDULE_ATTRIBUTES = ('alphabet', 'grid', 'reverse_grid', 'pair_letters', 'pair_bytes', 'invalid_pairs', 'token_table', 'fixed_width_table')
+
+class PolybiusCipher:
+    def __init__(self, fixed_width: bool = False):
+        self.size = 5
+        self.fixed_width = fixed_width
+        self.separator = '' if fixed_width else ' '
+        self.__dict__.update(key_schedules.get((type(self),), self.create_schedule))
+
+    def create_schedule(self) -> dict:
+        self.alphabet = [
+            'A', 'B', 'C', 'D', 'E',
+            'F', 'G', 'H', 'I',
+            'K', 'L', 'M', 'N', 'O',
+            'P', 'Q', 'R', 'S', 'T',
+            'U', 'V', 'W', 'X', 'Y', 'Z'
+        ]
+
+        self.grid = self.create_grid()
+        self.reverse_grid = {}
+        for letter in self.grid:
+            coordinates = self.grid[letter]
+            self.reverse_grid[coordinates] = letter
+
+        self.pair_letters = {}
+        for (row, column), letter in self.reverse_grid.items():
+            self.pair_letters[f"{row}{column}"] = letter
+
+        pair_bytes = bytearray(256)
+        for (row, column), letter in self.reverse_grid.items():
+            pair_bytes[16 * row + column] = ord(letter)
+        self.pair_bytes = bytes(pair_bytes)
+        self.invalid_pairs = bytes(code for code in range(256) if pair_bytes[code] == 0)
+
+        self.token_table = TranslationTable(self.encode_token)
+        self.fixed_width_table = TranslationTable(self.encode_fixed_width)
+
+        return schedule_attributes(self, SCHEDULE_ATTRIBUTES)
+
+    def create_grid(self) -> dict:
+        grid = {}
+        row, column = 1, 1
+
+        for letter in self.alphabet:
+            grid[letter] = (row, column)
+            column += 1
+            if column > self.size:
+                column = 1
+                row += 1
+
+        return grid
+
+    def encode_character(self, character: str) -> str:
+        character = character.upper()
+        if character == 'J':
+            character = 'I'
+
+        if character in self.grid:
+            row, column = self.grid[character]
+            return f"{row}{column}"
+        return character
+
+    def encode_token(self, character: str) -> str:
+        return self.encode_character(character) + ' '
+
+    def encode_fixed_width(self, character: str) -> str:
+        encoded_character = self.encode_character(character)
+        return encoded_character if encoded_character != character.upper() else ''
+
+    def encode(self, text: str) -> str:
+        if self.fixed_width:
+            return text.upper().translate(self.fixed_width_table)
+        return text.upper().translate(self.token_table)[:-1]
+
+    def decode_pair(self, match) -> str:
+        pair = match.group()
+        letter = self.pair_letters.get(pair)
+        if letter is None:
+            letter = self.reverse_grid.get((int(pair[0]), int(pair[1])), '')
+        return letter
+
+    def decode(self, code: str) -> str:
+        code = code.replace(" ", "")
+
+        if code.isascii() and code.isdigit() and len(code) % 2 == 0:
+            return bytes.fromhex(code).translate(self.pair_bytes, self.invalid_pairs).decode('ascii')
+
+        return PAIR_PATTERN.sub(self.decode_pair, code)
+
+    def encoder(self):
+        return PolybiusEncodeTransform(self)
+
+    def decoder(self):
+        return PolybiusDecodeTransform(self)
+
+if __name__ == "__main__":
+    cipher = PolybiusCipher()
+
+    plain_text = "HELLO, WORLD!"
+    encoded_text = cipher.encode(plain_text)
+
+    print(f"Plain text:    {plain_text}")
+    print(f"Encoded text:  {encoded_text}")
+
+    decoded_text = cipher.decode(encoded_text)
+    print(f"Decoded text:  {decoded_text}")
\ No newline at end of file
@@ -0,0 +1,203 @@
+'''
+The Rail Fence cipher is a transposition cipher that rearranges the characters of the plaintext by writing them in a zigzag pattern across multiple "rails".
+
+Encryption:
+    - Choose the number of rails;
+    - Write the plaintext in a zigzag pattern across the rails;
+    - After finishing, read the characters row by row to get the ciphertext;
+    - No substitution occurs - only the positions of the characters are changed.
+
+Decryption:
+    - Reconstruct the zigzag pattern based on the number of rails and the length of the message;
+    - Fill in the characters row by row;
+    - Read the characters in a zigzag order to recover the original plaintext.
+
+Long texts:
+    - The permutations of short texts are kept in a cache, so messages of a recurring length are rearranged without computing the zigzag again;
+    - A text longer than CACHED_PERMUTATION_LENGTH is rearranged without a cache: with NumPy through an index array of its code points, otherwise rail by rail with string slices, so no memory stays held after the call.
+
+Batches:
+    - encode_many and decode_many process a list of messages at once and return the results in the same order;
+    - The messages are grouped by length, and each group is stacked into one array of code points, which the cached zigzag permutation of that length rearranges in a single indexing operation;
+    - Without NumPy, or for a few short messages, each message is processed on its own with the same cached permutation.
+
+Железнодорожный шифр - это шифр перестановки, в котором символы текста записываются по зигзагообразной линии на нескольких уровнях, а затем считываются построчно.
+
+Зашифровка:
+    - Выбирается количество «рельсов»;
+    - Текст записывается по диагонали вниз и вверх, чередуя рельсы, образуя зигзаг;
+    - После записи весь текст считывается по строкам - сначала верхний рельс, затем следующий, и так далее;
+    - Символы не заменяются - меняется только их порядок.
+
+Расшифровка:
+    - Воссоздаётся зигзагообразный шаблон на основе длины сообщения и числа рельсов;
+    - Символы вставляются по строкам в соответствующие позиции;
+    - Текст восстанавливается, считывая символы по зигзагообразному маршруту.
+
+Длинные тексты:
+    - Перестановки коротких текстов хранятся в кэше, поэтому сообщения повторяющейся длины переставляются без повторного вычисления зигзага;
+    - Текст длиннее CACHED_PERMUTATION_LENGTH переставляется без кэша: с NumPy через массив индексов его кодовых точек, иначе по рельсам срезами строк, поэтому после вызова память не остаётся занятой.
+
+Пакеты:
+    - encode_many и decode_many обрабатывают сразу список сообщений и возвращают результаты в том же порядке;
+    - Сообщения группируются по длине, и каждая группа складывается в один массив кодовых точек, который кэшированная зигзагообразная перестановка этой длины переставляет одной операцией индексирования;
+    - Без NumPy или для нескольких коротких сообщений каждое сообщение обрабатывается отдельно той же кэшированной перестановкой.
+'''
+
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
+
+from .backends import numpy
+from .streaming import RailFenceDecodeTransform, RailFenceEncodeTransform
+from .translation_table import MINIMUM_VECTORIZED_LENGTH, code_point_text, text_code_points
+from .zigzag import gather_rails, gather_text_rails, list_buffer, rail_lengths, scatter_rails, zigzag_slices
+
+PERMUTATION_CACHE_SIZE = 1024
+INDEX_ARRAY_CACHE_SIZE = 64
+CACHED_PERMUTATION_LENGTH = 1 << 10
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def zigzag_permutation(rails: int, length: int) -> tuple:
+    return tuple(chain.from_iterable(gather_rails(range(length), zigzag_slices(rails, length))))
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def inverse_zigzag_permutation(rails: int, length: int) -> tuple:
+    inverse = [0] * length
+    for index, position in enumerate(zigzag_permutation(rails, length)):
+        inverse[position] = index
+    return tuple(inverse)
+
+@lru_cache(maxsize=PERMUTATION_CACHE_SIZE)
+def zigzag_gatherers(rails: int, length: int) -> tuple:
+    return itemgetter(*zigzag_permutation(rails, length)), itemgetter(*inverse_zigzag_permutation(rails, length))
+
+def zigzag_index_array(rails: int, length: int):
+    rail_indices = gather_rails(numpy.arange(length, dtype=numpy.intp), zigzag_slices(rails, length), partial(numpy.empty, dtype=numpy.intp))
+    return numpy.concatenate(rail_indices)
+
+def inverse_index_array(permutation):
+    inverse = numpy.empty(len(permutation), dtype=numpy.intp)
+    inverse[permutation] = numpy.arange(len(permutation), dtype=numpy.intp)
+    return inverse
+
+@lru_cache(maxsize=INDEX_ARRAY_CACHE_SIZE)
+def cached_zigzag_index_arrays(rails: int, length: int) -> tuple:
+    permutation = zigzag_index_array(rails, length)
+    return permutation, inverse_index_array(permutation)
+
+def zigzag_index_arrays(rails: int, length: int) -> tuple:
+    if length <= CACHED_PERMUTATION_LENGTH:
+        return cached_zigzag_index_arrays(rails, length)
+
+    permutation = zigzag_index_array(rails, length)
+    return permutation, inverse_index_array(permutation)
+
+def permute_code_points(text: str, permutation, encrypt: bool) -> str:
+    codes = text_code_points(text)
+    if encrypt:
+        return code_point_text(codes[permutation])
+
+    permuted_codes = numpy.empty_like(codes)
+    permuted_codes[permutation] = codes
+    return code_point_text(permuted_codes)
+
+def zigzag_encode(text: str, rails: int) -> str:
+    return ''.join(gather_text_rails(text, zigzag_slices(rails, len(text))))
+
+def zigzag_decode(text: str, rails: int) -> str:
+    slices = zigzag_slices(rails, len(text))
+
+    rail_texts = []
+    start = 0
+    for length in rail_lengths(slices, len(text)):
+        rail_texts.append(text[start:start + length])
+        start += length
+
+    return ''.join(scatter_rails(rail_texts, slices, list_buffer(len(text))))
+
+class RailFenceCipher:
+    def __init__(self, rails: int):
+        if rails < 1:
+            raise ValueError("The number of rails must be positive!")
+        self.rails = rails
+
+    def permute(self, text: str, encrypt: bool) -> str:
+        if len(text) < 2 or self.rails == 1:
+            return text
+
+        if len(text) > CACHED_PERMUTATION_LENGTH:
+            if numpy:
+                return permute_code_points(text, zigzag_index_array(self.rails, len(text)), encrypt)
+            return zigzag_encode(text, self.rails) if encrypt else zigzag_decode(text, self.rails)
+
+        encoding_gatherer, decoding_gatherer = zigzag_gatherers(self.rails, len(text))
+        return ''.join(encoding_gatherer(text) if encrypt else decoding_gatherer(text))
+
+    def encode(self, text: str) -> str:
+        return self.permute(text.replace(" ", ""), True)
+
+    def decode(self, text: str) -> str:
+        return self.permute(text, False)
+
+    def permute_group(self, messages: list, length: int, encrypt: bool) -> list:
+        text = ''.join(messages)
+        # NumPy strips trailing NUL characters from the strings of a fixed-width array.
+        if length < 2 or '\0' in text:
+            return [self.permute(message, encrypt) for message in messages]
+
+        encoding_indices, decoding_indices = zigzag_index_arrays(self.rails, length)
+        codes = text_code_points(text).reshape(len(messages), length)
+        permuted_codes = numpy.take(codes, encoding_indices if encrypt else decoding_indices, axis=1)
+        return permuted_codes.view(f'<U{length}').ravel().tolist()
+
+    def permute_many(self, messages: list, encrypt: bool) -> list:
+        if len(messages) < 2 or not numpy:
+            return [self.permute(message, encrypt) for message in messages]
+
+        lengths = numpy.fromiter(map(len, messages), dtype=numpy.intp, count=len(messages))
+        if lengths.sum() < MINIMUM_VECTORIZED_LENGTH:
+            return [self.permute(message, encrypt) for message in messages]
+
+        if (lengths == lengths[0]).all():
+            return self.permute_group(messages, int(lengths[0]), encrypt)
+
+        order = numpy.argsort(lengths, kind='stable')
+        sorted_lengths = lengths[order]
+        boundaries = (numpy.flatnonzero(numpy.diff(sorted_lengths)) + 1).tolist()
+
+        sorted_results = []
+        for start, end in zip([0] + boundaries, boundaries + [len(messages)]):
+            group = list(map(messages.__getitem__, order[start:end].tolist()))
+            sorted_results.extend(self.permute_group(group, int(sorted_lengths[start]), encrypt))
+
+        results = numpy.empty(len(messages), dtype=object)
+        results[order] = sorted_results
+        return results.tolist()
+
+    def encode_many(self, messages) -> list:
+        messages = list(messages)
+        if ' ' in ''.join(messages):
+            messages = [message.replace(" ", "") for message in messages]
+        return self.permute_many(messages, True)
+
+    def decode_many(self, messages) -> list:
+        return self.permute_many(list(messages), False)
+
+    def encoder(self):
+        return RailFenceEncodeTransform(self.rails)
+
+    def decoder(self):
+        return RailFenceDecodeTransform(self.rails)
+
+if __name__ == "__main__":
+    cipher = RailFenceCipher(rails=3)
+
+    plain_text = "HELLO, WORLD!"
+    encoded_text = cipher.encode(plain_text)
+
+    print(f"Plain text:    {plain_text}")
+    print(f"Encoded text:  {encoded_text}")
+
+    decoded_text = cipher.decode(encoded_text)
+    print(f"Decoded text:  {decoded_text}")
\ No newline at end of file
@@ -0,0 +1,85 @@
+'''
+The cipher registry maps the name of every cipher to the module and class that implement it, and creates ciphers from a name and a key given as text.
+
+Registry:
+    - Each entry holds the module name, the class name, the function that parses the key and the fixed options of the class;
+    - The module of a cipher is imported only when the cipher is first requested, so looking up a name or listing the ciphers imports nothing;
+    - The command-line interface, the service and the benchmark all create their ciphers through the registry;
+    - The ciphers that work modulo the size of the alphabet also take an alphabet, given by name or by its letters.
+
+Реестр шифров сопоставляет имени каждого шифра модуль и класс, которые его реализуют, и создаёт шифры по имени и ключу, заданному текстом.
+
+Реестр:
+    - Каждая запись содержит имя модуля, имя класса, функцию разбора ключа и постоянные параметры класса;
+    - Модуль шифра импортируется только при первом запросе шифра, поэтому поиск имени или перечисление шифров ничего не импортирует;
+    - Интерфейс командной строки, сервис и замер производительности создают шифры через реестр;
+    - Шифры, работающие по модулю размера алфавита, принимают также алфавит, заданный именем или своими буквами.
+
+Salausrekisteri liittää jokaisen salauksen nimeen sen toteuttavan moduulin ja luokan ja luo salauksia nimestä ja tekstinä annetusta avaimesta.
+
+Rekisteri:
+    - Jokainen merkintä sisältää moduulin nimen, luokan nimen, avaimen jäsentävän funktion ja luokan kiinteät asetukset;
+    - Salauksen moduuli tuodaan vasta, kun salausta pyydetään ensimmäisen kerran, joten nimen haku tai salausten luettelointi ei tuo mitään;
+    - Komentorivikäyttöliittymä, palvelu ja suorituskykymittaus luovat salauksensa rekisterin kautta;
+    - Aakkoston koon modulolla toimivat salaukset ottavat myös aakkoston, joka annetaan nimellä tai kirjaimillaan.
+'''
+
+import importlib
+
+def parse_affine_key(key: str) -> tuple:
+    a, b = key.split(',')
+    return int(a), int(b)
+
+def parse_hill_key(key: str) -> tuple:
+    matrix = []
+    for row in key.split(';'):
+        matrix.append([int(value) for value in row.split(',')])
+    return (matrix,)
+
+def parse_integer_key(key: str) -> tuple:
+    return (int(key),)
+
+def parse_keyword(key: str) -> tuple:
+    return (key,)
+
+CIPHERS = {
+    'affine': ('affine_cipher', 'AffineCipher', parse_affine_key, {}),
+    'atbash': ('atbash_cipher', 'AtbashCipher', None, {}),
+    'beaufort': ('beaufort_cipher', 'BeaufortCipher', parse_keyword, {}),
+    'caesar': ('caesar_cipher', 'CaesarCipher', parse_integer_key, {}),
+    'gronsfeld': ('gronsfeld_cipher', 'GronsfeldCipher', parse_keyword, {}),
+    'hill': ('hill_cipher', 'HillCipher', parse_hill_key, {}),
+    'playfair': ('playfair_cipher', 'PlayfairCipher', parse_keyword, {}),
+    'polybius': ('polybius_square_cipher', 'PolybiusCipher', None, {}),
+    'polybius-fixed': ('polybius_square_cipher', 'PolybiusCipher', None, {'fixed_width': True}),
+    'rail-fence': ('rail_fence_cipher', 'RailFenceCipher', parse_integer_key, {}),
+    'vigenere': ('vigenere_cipher', 'VigenereCipher', parse_keyword, {}),
+}
+
+ALPHABET_CIPHERS = frozenset({'affine', 'atbash', 'beaufort', 'caesar', 'gronsfeld', 'hill', 'vigenere'})
+
+def cipher_class(name: str) -> type:
+    if name not in CIPHERS:
+        raise ValueError(f"Unknown cipher: {name}!")
+
+    module_name, class_name, _, _ = CIPHERS[name]
+    module = importlib.import_module(f'.{module_name}', __package__)
+    return getattr(module, class_name)
+
+def create_cipher(name: str, key: str = None, alphabet=None):
+    cipher_type = cipher_class(name)
+    _, _, parse_key, options = CIPHERS[name]
+
+    if alphabet is not None:
+        if name not in ALPHABET_CIPHERS:
+            raise ValueError(f"The {name} cipher does not take an alphabet!")
+        options = dict(options, alphabet=alphabet)
+
+    if parse_key is None:
+        if key is not None:
+            raise ValueError(f"The {name} cipher does not take a key!")
+        return cipher_type(**options)
+
+    if key is None:
+        raise ValueError(f"The {name} cipher requires a key!")
+    return cipher_type(*parse_key(key), **options)
@@ -0,0 +1,276 @@
+'''
+Streaming transforms encrypt or decrypt a text that arrives in chunks, so a message of any size can be processed without holding all of it in memory.
+
+Processing:
+    - Create an encoder or a decoder from a cipher;
+    - Pass each chunk to update and write out the text it returns;
+    - Call finalize at the end to flush what is still buffered;
+    - The transform keeps the state that crosses chunk boundaries:
+        - The keystream position of the polyalphabetic ciphers;
+        - The incomplete blocks of the Hill cipher and the unpaired letters of the Playfair cipher;
+        - The digit that may still pair with the next chunk in the Polybius square;
+        - The rails of the Rail Fence cipher, which are spooled to temporary files once they grow large.
+    - A chain of transforms passes each chunk through every cipher of a pipeline in turn, and what one transform flushes at the end still goes through the ones after it.
+
+Потоковые преобразования шифруют или расшифровывают текст, поступающий частями, поэтому сообщение любого размера можно обработать, не держа его целиком в памяти.
+
+Обработка:
+    - Из шифра создаётся кодировщик или декодировщик;
+    - Каждая часть передаётся в update, а возвращённый текст сразу записывается;
+    - В конце вызывается finalize, чтобы выдать то, что ещё находится в буфере;
+    - Преобразование хранит состояние, переходящее через границы частей:
+        - Позицию в потоке ключа у полиалфавитных шифров;
+        - Неполные блоки шифра Хилла и непарные буквы шифра Плейфера;
+        - Цифру квадрата Полибия, которая может образовать пару со следующей частью;
+        - Рельсы шифра «Железнодорожная изгородь», которые сбрасываются во временные файлы, когда становятся большими.
+    - Цепочка преобразований пропускает каждую часть по очереди через все шифры конвейера, а то, что одно преобразование выдаёт в конце, ещё проходит через следующие за ним.
+
+Virtamuunnokset salaavat tai purkavat osina saapuvan tekstin, joten minkä kokoisen viestin tahansa voi käsitellä pitämättä sitä kokonaan muistissa.
+
+Käsittely:
+    - Salauksesta luodaan kooderi tai dekooderi;
+    - Jokainen osa annetaan update-metodille ja palautettu teksti kirjoitetaan heti;
+    - Lopuksi kutsutaan finalize, joka tyhjentää puskuriin jääneen osan;
+    - Muunnos säilyttää tilan, joka ylittää osien rajat:
+        - Polyalfabeettisten salausten avainvirran sijainnin;
+        - Hill-salauksen keskeneräiset lohkot ja Playfair-salauksen parittomat kirjaimet;
+        - Polybioksen neliön numeron, joka voi muodostaa parin seuraavan osan kanssa;
+        - Aitasalauksen kiskot, jotka siirretään väliaikaisiin tiedostoihin niiden kasvaessa suuriksi.
+    - Muunnosten ketju vie jokaisen osan vuorollaan putken jokaisen salauksen läpi, ja se, minkä yksi muunnos tyhjentää lopussa, kulkee vielä sitä seuraavien läpi.
+'''
+
+from abc import ABC, abstractmethod
+
+from .zigzag import gather_text_rails, list_buffer, rail_lengths, scatter_rails, zigzag_slices
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+SPOOL_SIZE = 1 << 22
+
+class StreamTransform(ABC):
+
+    @abstractmethod
+    def update(self, chunk: str) -> str:
+        pass
+
+    def finalize(self) -> str:
+        return ''
+
+    def finalize_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        final_text = self.finalize()
+        if final_text:
+            yield final_text
+
+class StatelessTransform(StreamTransform):
+
+    def __init__(self, function):
+        self.function = function
+
+    def update(self, chunk: str) -> str:
+        return self.function(chunk)
+
+class KeystreamTransform(StreamTransform):
+
+    def __init__(self, function):
+        self.function = function
+        self.offset = 0
+
+    def update(self, chunk: str) -> str:
+        result, self.offset = self.function(chunk, offset=self.offset)
+        return result
+
+class BlockTransform(StreamTransform):
+
+    def __init__(self, cipher, encrypt: bool):
+        self.cipher = cipher
+        self.encrypt = encrypt
+        self.pending = ''
+
+    def update(self, chunk: str) -> str:
+        letters = self.pending + self.cipher.letters_only(chunk)
+        complete_length = len(letters) - len(letters) % self.cipher.block_size
+        self.pending = letters[complete_length:]
+        return self.transform(letters[:complete_length])
+
+    def finalize(self) -> str:
+        letters, self.pending = self.pending, ''
+        return self.transform(letters)
+
+    def transform(self, letters: str) -> str:
+        if self.encrypt:
+            return self.cipher.encrypt(letters)
+        return self.cipher.decrypt(letters)
+
+class PlayfairEncryptTransform(StreamTransform):
+
+    def __init__(self, cipher):
+        self.cipher = cipher
+        self.pending = ''
+
+    def update(self, chunk: str) -> str:
+        pairs, self.pending = self.cipher.pair_letters(self.pending + self.cipher.letters_only(chunk), final=False)
+        return self.cipher.encrypt_pairs(pairs)
+
+    def finalize(self) -> str:
+        pairs, _ = self.cipher.pair_letters(self.pending)
+        self.pending = ''
+        return self.cipher.encrypt_pairs(pairs)
+
+class PlayfairDecryptTransform(StreamTransform):
+
+    def __init__(self, cipher):
+        self.cipher = cipher
+        self.pending = ''
+
+    def update(self, chunk: str) -> str:
+        text = self.pending + chunk
+        even_length = len(text) - len(text) % 2
+        self.pending = text[even_length:]
+        return self.cipher.decrypt(text[:even_length])
+
+    def finalize(self) -> str:
+        text, self.pending = self.pending, ''
+        return self.cipher.decrypt(text)
+
+class PolybiusEncodeTransform(StreamTransform):
+
+    def __init__(self, cipher):
+        self.cipher = cipher
+        self.started = False
+
+    def update(self, chunk: str) -> str:
+        if not chunk:
+            return ''
+
+        encoded_text = self.cipher.encode(chunk)
+        if self.started:
+            return self.cipher.separator + encoded_text
+        self.started = True
+        return encoded_text
+
+class PolybiusDecodeTransform(StreamTransform):
+
+    def __init__(self, cipher):
+        self.cipher = cipher
+        self.pending = ''
+
+    def update(self, chunk: str) -> str:
+        code = self.pending + chunk.replace(' ', '')
+
+        trailing_digits = len(code) - len(code.rstrip('0123456789'))
+
+        split = len(code) - trailing_digits % 2
+        self.pending = code[split:]
+        return self.cipher.decode(code[:split])
+
+    def finalize(self) -> str:
+        code, self.pending = self.pending, ''
+        return self.cipher.decode(code)
+
+class RailFenceEncodeTransform(StreamTransform):
+
+    def __init__(self, rails: int):
+        self.rails = rails
+        self.position = 0
+        self.fence = []
+        from tempfile import SpooledTemporaryFile
+        for _ in range(rails):
+            self.fence.append(SpooledTemporaryFile(max_size=SPOOL_SIZE, mode='w+', encoding='utf-8'))
+
+    def update(self, chunk: str) -> str:
+        chunk = chunk.replace(" ", "")
+
+        for rail_file, rail_text in zip(self.fence, gather_text_rails(chunk, zigzag_slices(self.rails, len(chunk), self.position))):
+            rail_file.write(rail_text)
+
+        self.position += len(chunk)
+        return ''
+
+    def finalize_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        for rail_file in self.fence:
+            rail_file.seek(0)
+            while True:
+                characters = rail_file.read(chunk_size)
+                if not characters:
+                    break
+                yield characters
+            rail_file.close()
+
+    def finalize(self) -> str:
+        return ''.join(self.finalize_chunks())
+
+class RailFenceDecodeTransform(StreamTransform):
+
+    def __init__(self, rails: int):
+        self.rails = rails
+        self.cycle = max(2 * (rails - 1), 1)
+        self.length = 0
+        from tempfile import SpooledTemporaryFile
+        self.buffer = SpooledTemporaryFile(max_size=SPOOL_SIZE)
+
+    def update(self, chunk: str) -> str:
+        self.buffer.write(chunk.encode('utf-32-le'))
+        self.length += len(chunk)
+        return ''
+
+    def read_characters(self, position: int, count: int) -> str:
+        self.buffer.seek(4 * position)
+        return self.buffer.read(4 * count).decode('utf-32-le')
+
+    def finalize_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        block_size = max(chunk_size - chunk_size % self.cycle, self.cycle)
+
+        rail_positions = []
+        rail_start = 0
+        for length in rail_lengths(zigzag_slices(self.rails, self.length), self.length):
+            rail_positions.append(rail_start)
+            rail_start += length
+
+        for block_start in range(0, self.length, block_size):
+            block_length = min(block_size, self.length - block_start)
+            slices = zigzag_slices(self.rails, block_length, block_start)
+
+            rail_texts = []
+            for rail, count in enumerate(rail_lengths(slices, block_length)):
+                rail_texts.append(self.read_characters(rail_positions[rail], count))
+                rail_positions[rail] += count
+
+            characters = scatter_rails(rail_texts, slices, list_buffer(block_length))
+            yield ''.join(characters)
+
+        self.buffer.close()
+
+    def finalize(self) -> str:
+        return ''.join(self.finalize_chunks())
+
+class ChainTransform(StreamTransform):
+
+    def __init__(self, transforms: list):
+        self.transforms = list(transforms)
+
+    def pass_through(self, chunk: str, start: int = 0) -> str:
+        for transform in self.transforms[start:]:
+            if not chunk:
+                break
+            chunk = transform.update(chunk)
+        return chunk
+
+    def update(self, chunk: str) -> str:
+        return self.pass_through(chunk)
+
+    def finalize_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        for index, transform in enumerate(self.transforms):
+            for final_text in transform.finalize_chunks(chunk_size):
+                final_text = self.pass_through(final_text, index + 1)
+                if final_text:
+                    yield final_text
+
+    def finalize(self) -> str:
+        return ''.join(self.finalize_chunks())
+
+def process_chunks(transform: StreamTransform, chunks, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    for chunk in chunks:
+        result = transform.update(chunk)
+        if result:
+            yield result
+
+    yield from transform.finalize_chunks(chunk_size)
@@ -0,0 +1,212 @@
+'''
+A translation table compiles a character-by-character substitution into a single mapping that can be applied to a whole text with one call to str.translate.
+
+Compilation:
+    - Take a function that substitutes one character;
+    - Apply it once to every letter of the alphabet, Latin by default, and store the result under the letter's code point;
+    - Any other character is substituted on its first appearance and remembered afterwards, up to MEMOIZED_CHARACTER_LIMIT characters, so a table kept in the key schedule cache cannot grow beyond the size the cache accounts for; later ones are substituted each time they appear.
+
+Translation:
+    - Pass the table to str.translate;
+    - Each character is replaced by the stored result, so the text is processed without a Python-level loop;
+    - A byte table covers the 128 ASCII codes and leaves other bytes unchanged, so a byte buffer can be translated in place;
+    - str.translate leaves a character unchanged when the table raises a LookupError for it, so a KeyError of the function, such as the Affine cipher's for a letter outside its alphabet, is carried out of str.translate and raised again by translate.
+
+Code points:
+    - str.translate is fast for ASCII text, but a text in another script, such as Russian, is translated one dictionary lookup at a time;
+    - A long text that is not ASCII is therefore converted into an array of code points and translated with NumPy through a dense table of all code points up to the last letter of the alphabet;
+    - The dense table is built the first time it is needed and kept with the translation table, so it is built once per key;
+    - Code points above the table are rare, so each distinct one is substituted by the function itself;
+    - If a character is not replaced by exactly one character, or its substitution fails, the text is translated by str.translate instead, which gives the same result or the same error.
+
+Byte buffers:
+    - Any object with the buffer protocol is accepted: bytes, bytearray, memoryview, mmap or array;
+    - The result is written either into the same buffer or into a destination buffer given by the caller, so no new object is created;
+    - The buffer is translated by bytes.translate in small blocks through memory views, so the only temporary object is one block, which stays in the processor cache;
+    - A read-only source, such as bytes, needs a destination buffer, which must be writable and at least as long as the source.
+
+Таблица перевода превращает посимвольную подстановку в одно отображение, которое применяется ко всему тексту одним вызовом str.translate.
+
+Компиляция:
+    - Берётся функция, заменяющая один символ;
+    - Она один раз применяется к каждой букве алфавита, по умолчанию латинского, результат сохраняется под кодом буквы;
+    - Любой другой символ заменяется при первом появлении и затем запоминается, но не более MEMOIZED_CHARACTER_LIMIT символов, поэтому таблица в кэше расписаний ключей не может вырасти больше размера, учтённого кэшем; последующие заменяются при каждом появлении.
+
+Перевод:
+    - Таблица передаётся в str.translate;
+    - Каждый символ заменяется сохранённым результатом, поэтому текст обрабатывается без цикла на Python;
+    - Таблица байтов покрывает 128 кодов ASCII и не меняет остальные байты, поэтому буфер байтов можно перевести на месте;
+    - str.translate оставляет символ без изменений, если таблица вызывает для него LookupError, поэтому KeyError функции, например аффинного шифра для буквы вне его алфавита, выносится из str.translate и снова вызывается методом translate.
+
+Кодовые точки:
+    - str.translate быстр для текста ASCII, но текст другой письменности, например русский, переводится по одному поиску в словаре за раз;
+    - Поэтому длинный текст не в ASCII преобразуется в массив кодовых точек и переводится с помощью NumPy через плотную таблицу всех кодовых точек до последней буквы алфавита;
+    - Плотная таблица создаётся при первой необходимости и хранится вместе с таблицей перевода, поэтому строится один раз для каждого ключа;
+    - Кодовые точки выше таблицы редки, поэтому каждая из них заменяется самой функцией;
+    - Если символ заменяется не ровно одним символом или его замена завершается ошибкой, текст переводится через str.translate, что даёт тот же результат или ту же ошибку.
+
+Буферы байтов:
+    - Принимается любой объект с протоколом буфера: bytes, bytearray, memoryview, mmap или array;
+    - Результат записывается либо в тот же буфер, либо в буфер назначения, переданный вызывающим, поэтому новый объект не создаётся;
+    - Буфер переводится методом bytes.translate небольшими блоками через представления памяти, поэтому единственный временный объект - один блок, который остаётся в кэше процессора;
+    - Источнику только для чтения, например bytes, нужен буфер назначения, который должен быть записываемым и не короче источника.
+
+Käännöstaulukko kokoaa merkki kerrallaan tehtävän korvauksen yhdeksi kuvaukseksi, joka voidaan soveltaa koko tekstiin yhdellä str.translate-kutsulla.
+
+Kokoaminen:
+    - Otetaan funktio, joka korvaa yhden merkin;
+    - Sitä sovelletaan kerran jokaiseen aakkoston kirjaimeen, oletuksena latinalaiseen, ja tulos tallennetaan kirjaimen koodin alle;
+    - Muut merkit korvataan ensimmäisellä esiintymiskerralla ja tulos muistetaan, enintään MEMOIZED_CHARACTER_LIMIT merkkiä, joten avainaikataulujen välimuistissa oleva taulukko ei voi kasvaa välimuistin huomioimaa kokoa suuremmaksi; myöhemmät korvataan joka kerta.
+
+Kääntäminen:
+    - Taulukko annetaan str.translate-funktiolle;
+    - Jokainen merkki korvataan tallennetulla tuloksella, joten teksti käsitellään ilman Python-silmukkaa;
+    - Tavutaulukko kattaa 128 ASCII-koodia ja jättää muut tavut ennalleen, joten tavupuskurin voi kääntää paikallaan;
+    - str.translate jättää merkin ennalleen, kun taulukko nostaa sille LookupErrorin, joten funktion KeyError, kuten affiinin salauksen aakkoston ulkopuoliselle kirjaimelle, viedään ulos str.translate-kutsusta ja nostetaan uudelleen translate-metodissa.
+
+Koodipisteet:
+    - str.translate on nopea ASCII-tekstille, mutta muulla kirjoitusjärjestelmällä, kuten venäjäksi, kirjoitettu teksti käännetään sanakirjahaku kerrallaan;
+    - Pitkä teksti, joka ei ole ASCII-muotoista, muutetaan siksi koodipisteiden taulukoksi ja käännetään NumPylla tiheän taulukon kautta, joka kattaa kaikki koodipisteet aakkoston viimeiseen kirjaimeen asti;
+    - Tiheä taulukko rakennetaan, kun sitä tarvitaan ensimmäisen kerran, ja se säilytetään käännöstaulukon yhteydessä, joten se rakennetaan kerran kutakin avainta kohden;
+    - Taulukon yläpuolisia koodipisteitä on harvoin, joten jokainen niistä korvataan itse funktiolla;
+    - Jos merkkiä ei korvata täsmälleen yhdellä merkillä tai sen korvaus epäonnistuu, teksti käännetään sen sijaan str.translate-funktiolla, joka antaa saman tuloksen tai saman virheen.
+
+Tavupuskurit:
+    - Kelpaa mikä tahansa puskuriprotokollaa tukeva olio: bytes, bytearray, memoryview, mmap tai array;
+    - Tulos kirjoitetaan joko samaan puskuriin tai kutsujan antamaan kohdepuskuriin, joten uutta oliota ei luoda;
+    - Puskuri käännetään bytes.translate-metodilla pieninä lohkoina muistinäkymien kautta, joten ainoa väliaikainen olio on yksi lohko, joka pysyy suorittimen välimuistissa;
+    - Vain luettava lähde, kuten bytes, tarvitsee kohdepuskurin, jonka on oltava kirjoitettava ja vähintään lähteen pituinen.
+'''
+
+import string
+
+from .backends import numpy
+
+BLOCK_SIZE = 1 << 16
+MINIMUM_VECTORIZED_LENGTH = 256
+MEMOIZED_CHARACTER_LIMIT = 256
+MEMOIZED_ENTRY_SIZE = 160
+CODE_POINT_SIZE = 4
+
+class UntranslatableCharacter(Exception):
+
+    def __init__(self, error: LookupError):
+        super().__init__(error)
+        self.error = error
+
+class TranslationTable(dict):
+
+    def __init__(self, translate_character, characters: str = string.ascii_letters):
+        super().__init__()
+        self.translate_character = translate_character
+        self.table_size = max(map(ord, characters)) + 1
+        self.code_points = None
+
+        for character in characters:
+            self[ord(character)] = translate_character(character)
+        self.compiled_size = len(self)
+
+    def __missing__(self, code: int) -> str:
+        try:
+            translated_character = self.translate_character(chr(code))
+        except LookupError as error:
+            raise UntranslatableCharacter(error) from error
+
+        if len(self) < self.compiled_size + MEMOIZED_CHARACTER_LIMIT:
+            self[code] = translated_character
+        return translated_character
+
+    def reserved_size(self) -> int:
+        remaining_characters = max(self.compiled_size + MEMOIZED_CHARACTER_LIMIT - len(self), 0)
+        return remaining_characters * MEMOIZED_ENTRY_SIZE + self.table_size * CODE_POINT_SIZE
+
+    def code_point_table(self):
+        if self.code_points is None:
+            self.code_points = build_code_point_table(self.translate_character, self.table_size)
+        return self.code_points
+
+    def translate(self, text: str) -> str:
+        if len(text) >= MINIMUM_VECTORIZED_LENGTH and not text.isascii() and numpy:
+            translated_text = translate_code_points(text, self.code_point_table(), self.translate_character)
+            if translated_text is not None:
+                return translated_text
+        try:
+            return text.translate(self)
+        except UntranslatableCharacter as error:
+            raise error.error from None
+
+def text_code_points(text: str):
+    return numpy.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=numpy.uint32)
+
+def code_point_text(codes) -> str:
+    return codes.astype(numpy.uint32, copy=False).tobytes().decode('utf-32-le', 'surrogatepass')
+
+def single_code_point(translate_character, character: str) -> int:
+    try:
+        translated_character = translate_character(character)
+    except (KeyError, ValueError):
+        return -1
+    return ord(translated_character) if len(translated_character) == 1 else -1
+
+def build_code_point_table(translate_character, size: int):
+    table = [single_code_point(translate_character, chr(code)) for code in range(size)]
+    return numpy.array(table, dtype=numpy.int32)
+
+def translate_code_points(text: str, table, translate_character):
+    codes = text_code_points(text)
+    translated = numpy.take(table, codes, mode='clip')
+
+    outside = codes >= len(table)
+    if outside.any():
+        outside_codes = numpy.unique(codes[outside])
+        outside_table = [single_code_point(translate_character, chr(code)) for code in outside_codes.tolist()]
+        translated[outside] = numpy.array(outside_table, dtype=numpy.int32)[numpy.searchsorted(outside_codes, codes[outside])]
+
+    if translated.min() < 0:
+        return None
+    return code_point_text(translated)
+
+def build_byte_table(translate_character) -> bytes:
+    table = bytearray(range(256))
+    for code in range(128):
+        table[code] = ord(translate_character(chr(code)))
+    return bytes(table)
+
+def byte_view(buffer) -> memoryview:
+    view = memoryview(buffer)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view
+
+def output_view(source: memoryview, destination=None) -> memoryview:
+    if destination is None:
+        if source.readonly:
+            raise TypeError("A read-only buffer cannot be translated in place, pass a destination buffer!")
+        return source
+
+    view = byte_view(destination)
+    if view.readonly:
+        raise TypeError("The destination buffer is read-only!")
+    if len(view) < len(source):
+        raise ValueError(f"The destination buffer holds {len(view)} bytes, but {len(source)} are needed!")
+    return view[:len(source)]
+
+def copy_into(buffer, destination=None) -> memoryview:
+    source = byte_view(buffer)
+    view = output_view(source, destination)
+    if view is not source:
+        view[:] = source
+    return view
+
+def translate_buffer(buffer, table: bytes, destination=None) -> memoryview:
+    if table is None:
+        raise ValueError("Byte buffers can only be translated with an ASCII alphabet!")
+
+    source = byte_view(buffer)
+    view = output_view(source, destination)
+
+    for start in range(0, len(source), BLOCK_SIZE):
+        end = start + BLOCK_SIZE
+        view[start:end] = source[start:end].tobytes().translate(table)
+
+    return view
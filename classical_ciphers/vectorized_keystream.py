@@ -0,0 +1,156 @@
+'''
+The vectorized keystream applies a repeating key to all letters of a text at once with NumPy, instead of shifting one character at a time.
+
+Processing:
+    - Convert the text into an array of character codes;
+    - Build a mask of the positions that hold Latin letters;
+    - Repeat the key shifts over the letters only, so spaces and punctuation do not consume the key;
+    - Start the key at a given offset, so a long text can be processed in consecutive chunks;
+    - Compute every new letter position with a single modular operation;
+    - Restore the original letter case and write the letters back between the untouched characters.
+    - If NumPy is not installed, the text is not ASCII or it is too short to benefit, the ciphers use their pure Python loops.
+    - A byte buffer, such as a memory-mapped file, is shifted in place; bytes other than ASCII letters are left unchanged and do not consume the key.
+    - With another alphabet, or with a Latin text that is not ASCII, the text is converted into code points instead, which are mapped to letter indices through the tables of the alphabet;
+    - A text with letters outside the alphabet is left to the pure Python loops, because those letters are handled differently by each cipher.
+
+Векторизованный поток ключа применяет повторяющийся ключ сразу ко всем буквам текста с помощью NumPy, а не сдвигает символы по одному.
+
+Обработка:
+    - Текст преобразуется в массив кодов символов;
+    - Строится маска позиций, в которых находятся латинские буквы;
+    - Сдвиги ключа повторяются только по буквам, поэтому пробелы и знаки препинания не расходуют ключ;
+    - Ключ начинается с заданного смещения, поэтому длинный текст можно обрабатывать последовательными частями;
+    - Новые позиции всех букв вычисляются одной модульной операцией;
+    - Восстанавливается исходный регистр, и буквы записываются обратно между неизменёнными символами.
+    - Если NumPy не установлен, текст не является ASCII или слишком короток, шифры используют свои циклы на чистом Python.
+    - Буфер байтов (например, отображённый в память файл) изменяется на месте; байты вне ASCII-букв не меняются и не расходуют ключ.
+    - С другим алфавитом или с латинским текстом, не являющимся ASCII, текст преобразуется в кодовые точки, которые отображаются в индексы букв через таблицы алфавита;
+    - Текст с буквами вне алфавита обрабатывается циклами на чистом Python, так как каждый шифр обращается с такими буквами по-своему.
+
+Vektoroitu avainvirta soveltaa toistuvaa avainta kaikkiin tekstin kirjaimiin kerralla NumPyn avulla sen sijaan, että merkkejä siirrettäisiin yksi kerrallaan.
+
+Käsittely:
+    - Teksti muutetaan merkkikoodien taulukoksi;
+    - Muodostetaan maski kohdista, joissa on latinalaisia kirjaimia;
+    - Avaimen siirrot toistetaan vain kirjainten yli, joten välilyönnit ja välimerkit eivät kuluta avainta;
+    - Avain aloitetaan annetusta siirtymästä, joten pitkä teksti voidaan käsitellä peräkkäisinä osina;
+    - Kaikkien kirjainten uudet sijainnit lasketaan yhdellä modulo-operaatiolla;
+    - Alkuperäinen kirjainkoko palautetaan ja kirjaimet kirjoitetaan takaisin muuttumattomien merkkien väliin.
+    - Jos NumPy ei ole asennettu, teksti ei ole ASCII-muotoista tai se on liian lyhyt, salaukset käyttävät puhtaita Python-silmukoitaan.
+    - Tavupuskuri, kuten muistiin kuvattu tiedosto, siirretään paikallaan; muut kuin ASCII-kirjaimet jätetään ennalleen eivätkä ne kuluta avainta.
+    - Muulla aakkostolla tai latinalaisella tekstillä, joka ei ole ASCII-muotoista, teksti muutetaan sen sijaan koodipisteiksi, jotka kuvataan kirjainten indekseiksi aakkoston taulukoiden avulla;
+    - Teksti, jossa on aakkoston ulkopuolisia kirjaimia, jätetään puhtaille Python-silmukoille, koska kukin salaus käsittelee tällaiset kirjaimet eri tavalla.
+'''
+
+from .alphabet import LATIN
+from .backends import numpy
+from .translation_table import code_point_text, text_code_points
+
+MINIMUM_VECTORIZED_LENGTH = 256
+
+def is_vectorizable(text: str, key) -> bool:
+    return len(key) > 0 and len(text) >= MINIMUM_VECTORIZED_LENGTH and bool(numpy)
+
+def shift_buffer(buffer, shifts: list, multiplier: int = 1, offset: int = 0, uppercase: bool = False, alphabet=LATIN) -> int:
+    if len(shifts) == 0:
+        raise ValueError("The key must not be empty!")
+    if alphabet != LATIN:
+        raise ValueError(f"Byte buffers can only be shifted with the Latin alphabet, not the {alphabet.name} one!")
+
+    if numpy:
+        return shift_codes(numpy.frombuffer(buffer, dtype=numpy.uint8), shifts, multiplier, offset, uppercase)
+
+    view = memoryview(buffer)
+    for index, code in enumerate(view):
+        folded_code = code | 32
+        if 97 <= folded_code <= 122:
+            base = 65 if uppercase else code & 32 | 65
+            view[index] = (multiplier * (folded_code - 97) + shifts[offset % len(shifts)]) % 26 + base
+            offset += 1
+    return offset
+
+def shift_codes(codes, shifts: list, multiplier: int = 1, offset: int = 0, uppercase: bool = False) -> int:
+    folded_codes = codes | 32
+    letters = (folded_codes >= 97) & (folded_codes <= 122)
+
+    indices = folded_codes[letters].astype(numpy.int16) - 97
+    key = numpy.roll(numpy.asarray(shifts, dtype=numpy.int16), -offset)
+    keystream = numpy.tile(key, -(-len(indices) // len(key)))[:len(indices)]
+    shifted = ((multiplier * indices + keystream) % 26).astype(numpy.uint8)
+
+    if uppercase:
+        codes[letters] = shifted + 65
+    else:
+        codes[letters] = shifted + (codes[letters] & 32 | 65)
+    return offset + len(indices)
+
+def keystream_rows(shifts: list, alphabet, multiplier: int = 1, offset: int = 0, uppercase: bool = False):
+    # One row of target code points for every shift of the key, so no letter needs a modulo of its own.
+    _, letter_codes = alphabet.index_arrays()
+    size = len(alphabet)
+    indices = numpy.arange(2 * size)
+    positions = indices % size
+
+    key = numpy.roll(numpy.asarray(shifts, dtype=numpy.int64), -offset)
+    targets = (multiplier * positions + key[:, None]) % size
+    if not uppercase:
+        targets += indices - positions
+    return letter_codes[targets].ravel()
+
+def apply_alphabet_keystream(text: str, shifts: list, alphabet, multiplier: int = 1, letters_only: bool = False, offset: int = 0):
+    codes = text_code_points(text)
+    indices = alphabet.lookup(codes)
+    if indices is None:
+        return None
+
+    letters = indices >= 0
+    indices = indices[letters]
+    rows = keystream_rows(shifts, alphabet, multiplier, offset, uppercase=letters_only)
+    row_starts = numpy.arange(0, len(rows), 2 * len(alphabet), dtype=numpy.int32)
+    keystream = numpy.tile(row_starts, -(-len(indices) // len(row_starts)))[:len(indices)]
+    shifted = rows[keystream + indices]
+
+    if letters_only:
+        return code_point_text(shifted), offset + len(indices)
+
+    codes = codes.copy()
+    codes[letters] = shifted
+    return code_point_text(codes), offset + len(indices)
+
+def apply_keystream(text: str, shifts: list, multiplier: int = 1, letters_only: bool = False, offset: int = 0, alphabet=LATIN):
+    if alphabet != LATIN or not text.isascii():
+        return apply_alphabet_keystream(text, shifts, alphabet, multiplier, letters_only, offset)
+
+    codes = numpy.frombuffer(text.encode('ascii'), dtype=numpy.uint8)
+
+    if letters_only:
+        folded_codes = codes | 32
+        codes = codes[(folded_codes >= 97) & (folded_codes <= 122)]
+        offset = shift_codes(codes, shifts, multiplier, offset, uppercase=True)
+        return codes.tobytes().decode('ascii'), offset
+
+    codes = codes.copy()
+    offset = shift_codes(codes, shifts, multiplier, offset)
+    return codes.tobytes().decode('ascii'), offset
+
+def apply_keystream_many(texts: list, shifts: list, alphabet, multiplier: int = 1):
+    codes = text_code_points(''.join(texts))
+    indices = alphabet.lookup(codes)
+    if indices is None:
+        return None
+
+    lengths = numpy.fromiter(map(len, texts), dtype=numpy.intp, count=len(texts))
+    ends = numpy.cumsum(lengths)
+    letters = indices >= 0
+    letter_counts = numpy.concatenate(([0], numpy.cumsum(letters)))
+
+    # The key starts again with every text, so a letter is keyed by its position among the letters of its own text.
+    text_offsets = numpy.repeat(letter_counts[ends - lengths], lengths)
+    key_positions = (letter_counts[:-1] - text_offsets)[letters] % len(shifts)
+
+    rows = keystream_rows(shifts, alphabet, multiplier)
+    codes = codes.copy()
+    codes[letters] = rows[key_positions * (2 * len(alphabet)) + indices[letters]]
+
+    text = code_point_text(codes)
+    return [text[end - length:end] for end, length in zip(ends.tolist(), lengths.tolist())]
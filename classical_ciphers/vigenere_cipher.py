@@ -66,34 +66,40 @@ Purku:
     - Korvaa salattu kirjain lasketussa sijainnissa olevalla kirjaimella.
 """
 
+from functools import partial
+
+from .alphabet import get_alphabet
+from .key_schedule import key_schedules, schedule_attributes
+from .streaming import KeystreamTransform
+from .translation_table import copy_into
+from .vectorized_keystream import apply_keystream, apply_keystream_many, is_vectorizable, shift_buffer
+
+SCHEDULE_ATTRIBUTES = ('alphabet', 'reverse_alphabet', 'alphabet_size')
+
 class VigenereCipher:
 
-    def __init__(self, keyword: str):
+    def __init__(self, keyword: str, alphabet=None):
 
         self.keyword = keyword.upper()
-        
-        self.alphabet = {
-            'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8,
-            'I': 9, 'J': 10, 'K': 11, 'L': 12, 'M': 13, 'N': 14, 'O': 15,
-            'P': 16, 'Q': 17, 'R': 18, 'S': 19, 'T': 20, 'U': 21, 'V': 22,
-            'W': 23, 'X': 24, 'Y': 25, 'Z': 26
-        }
-
-        self.reverse_alphabet = {
-            1: 'A', 2: 'B', 3: 'C', 4: 'D', 5: 'E', 6: 'F', 7: 'G', 8: 'H',
-            9: 'I', 10: 'J', 11: 'K', 12: 'L', 13: 'M', 14: 'N', 15: 'O',
-            16: 'P', 17: 'Q', 18: 'R', 19: 'S', 20: 'T', 21: 'U', 22: 'V',
-            23: 'W', 24: 'X', 25: 'Y', 26: 'Z'
-        }
-
-        self.alphabet_size = 26
-
-    def extend_keyword(self, text: str) -> str:
-        repetitions_needed = len(text) // len(self.keyword)
-        remainder = len(text) % len(self.keyword)
-        keyword_extended = self.keyword * (repetitions_needed + 1)
-        keyword_extended = keyword_extended[:len(text)]
-        return keyword_extended
+        self.letters = get_alphabet(alphabet)
+        self.__dict__.update(key_schedules.get((type(self), self.letters), self.create_schedule))
+
+    def create_schedule(self) -> dict:
+        self.alphabet = {}
+        self.reverse_alphabet = {}
+        for position, letter in enumerate(self.letters, start=1):
+            self.alphabet[letter] = position
+            self.reverse_alphabet[position] = letter
+
+        self.alphabet_size = len(self.letters)
+
+        return schedule_attributes(self, SCHEDULE_ATTRIBUTES)
+
+    def keyword_shifts(self) -> list:
+        shifts = []
+        for character in self.keyword:
+            shifts.append(self.alphabet[character])
+        return shifts
 
     def shift_character(self, character: str, shift: int, encrypt: bool) -> str:
         if character.upper() in self.alphabet:
@@ -108,52 +114,71 @@ class VigenereCipher:
 
         return character
 
-    def process_text(self, text: str, encrypt: bool) -> str:
-        keyword_extended = self.extend_keyword(text)
+    def process_chunk(self, text: str, encrypt: bool, offset: int = 0) -> tuple:
+        if is_vectorizable(text, self.keyword):
+            shifts = self.keyword_shifts()
+            if not encrypt:
+                shifts = [-shift for shift in shifts]
+            result = apply_keystream(text, shifts, offset=offset, alphabet=self.letters)
+            if result is not None:
+                return result
+
         result = []
-        keyword_index = 0
+        keyword_index = offset
 
         for character in text:
             if character.isalpha():
-                shift = self.alphabet[keyword_extended[keyword_index].upper()]
+                shift = self.alphabet[self.keyword[keyword_index % len(self.keyword)]]
                 result.append(self.shift_character(character, shift, encrypt))
                 keyword_index += 1
             else:
                 result.append(character)
-        
-        return "".join(result)
+
+        return ''.join(result), keyword_index
 
     def encrypt(self, text: str) -> str:
-        result = []
-        keyword_extended = self.extend_keyword(text)
-        keyword_index = 0
+        encrypted_text, _ = self.process_chunk(text, encrypt=True)
+        return encrypted_text
 
-        for character in text:
-            if character.isalpha():
-                shift = self.alphabet[keyword_extended[keyword_index].upper()]
-                encrypted_character = self.shift_character(character, shift, encrypt=True)
-                result.append(encrypted_character)
-                keyword_index += 1
-            else:
-                result.append(character)
+    def decrypt(self, text: str) -> str:
+        decrypted_text, _ = self.process_chunk(text, encrypt=False)
+        return decrypted_text
 
-        return ''.join(result)
+    def process_many(self, texts, encrypt: bool) -> list:
+        texts = list(texts)
+        if len(texts) > 1 and is_vectorizable(''.join(texts), self.keyword):
+            shifts = self.keyword_shifts()
+            if not encrypt:
+                shifts = [-shift for shift in shifts]
+            results = apply_keystream_many(texts, shifts, self.letters)
+            if results is not None:
+                return results
 
-    def decrypt(self, text: str) -> str:
-        result = []
-        keyword_extended = self.extend_keyword(text)
-        keyword_index = 0
+        return [self.process_chunk(text, encrypt)[0] for text in texts]
 
-        for character in text:
-            if character.isalpha():
-                shift = self.alphabet[keyword_extended[keyword_index].upper()]
-                decrypted_chararacter = self.shift_character(character, shift, encrypt=False)
-                result.append(decrypted_chararacter)
-                keyword_index += 1
-            else:
-                result.append(character)
+    def encrypt_many(self, texts) -> list:
+        return self.process_many(texts, encrypt=True)
+
+    def decrypt_many(self, texts) -> list:
+        return self.process_many(texts, encrypt=False)
+
+    def translate_buffer(self, buffer, encrypt: bool = True, offset: int = 0, destination=None) -> int:
+        shifts = self.keyword_shifts()
+        if not encrypt:
+            shifts = [-shift for shift in shifts]
+        return shift_buffer(copy_into(buffer, destination), shifts, offset=offset, alphabet=self.letters)
+
+    def encrypt_into(self, buffer, destination=None, offset: int = 0) -> int:
+        return self.translate_buffer(buffer, True, offset, destination)
+
+    def decrypt_into(self, buffer, destination=None, offset: int = 0) -> int:
+        return self.translate_buffer(buffer, False, offset, destination)
+
+    def encoder(self):
+        return KeystreamTransform(partial(self.process_chunk, encrypt=True))
 
-        return ''.join(result)
+    def decoder(self):
+        return KeystreamTransform(partial(self.process_chunk, encrypt=False))
 
 if __name__ == "__main__":
 
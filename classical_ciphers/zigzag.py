@@ -0,0 +1,91 @@
+'''
+The zigzag of the Rail Fence cipher, shared by every part of the cipher that rearranges a text.
+
+Rails:
+    - With r rails the zigzag repeats every 2(r - 1) positions: the top and the bottom rail are visited once in a cycle, every other rail twice, on the way down and on the way up;
+    - zigzag_slices describes each rail of a block of text as one slice, or two interleaved slices for a middle rail, and is the only place where the zigzag is computed;
+    - A block may start at any position of the text, so a stream cut into chunks at arbitrary points reads the same rails as the whole text.
+
+Gathering and scattering:
+    - gather_rails reads the rails of any sliceable sequence, a string, a range or a NumPy array, interleaving the two slices of a middle rail, and gather_text_rails returns the rails of a text as strings;
+    - scatter_rails writes the rails back to their positions and undoes gather_rails;
+    - The cached permutations, the NumPy index arrays, the encoding and decoding of long texts and the streaming transforms are all built from these two functions.
+
+Зигзаг шифра «Железнодорожная изгородь», общий для всех частей шифра, переставляющих текст.
+
+Рельсы:
+    - При r рельсах зигзаг повторяется каждые 2(r - 1) позиций: верхний и нижний рельсы посещаются один раз за цикл, остальные - дважды, на пути вниз и на пути вверх;
+    - zigzag_slices описывает каждый рельс блока текста одним срезом или двумя чередующимися срезами для среднего рельса и является единственным местом, где вычисляется зигзаг;
+    - Блок может начинаться с любой позиции текста, поэтому поток, разрезанный на части в произвольных местах, даёт те же рельсы, что и весь текст.
+
+Сбор и распределение:
+    - gather_rails читает рельсы любой последовательности, допускающей срезы: строки, диапазона или массива NumPy, чередуя два среза среднего рельса, а gather_text_rails возвращает рельсы текста строками;
+    - scatter_rails записывает рельсы обратно на их позиции и отменяет gather_rails;
+    - Кэшированные перестановки, массивы индексов NumPy, шифрование и расшифровка длинных текстов и потоковые преобразования построены из этих двух функций.
+
+Aitasalauksen siksak, jota käyttävät kaikki salauksen osat, jotka järjestävät tekstiä uudelleen.
+
+Kiskot:
+    - r kiskolla siksak toistuu 2(r - 1) paikan välein: ylin ja alin kisko käydään kerran jaksossa, muut kiskot kahdesti, alas ja ylös mentäessä;
+    - zigzag_slices kuvaa tekstilohkon jokaisen kiskon yhtenä viipaleena tai keskikiskolle kahtena lomittuvana viipaleena, ja se on ainoa paikka, jossa siksak lasketaan;
+    - Lohko voi alkaa mistä tahansa tekstin kohdasta, joten mielivaltaisista kohdista osiin leikattu virta antaa samat kiskot kuin koko teksti.
+
+Kerääminen ja hajauttaminen:
+    - gather_rails lukee minkä tahansa viipaloitavan jonon, merkkijonon, välin tai NumPy-taulukon, kiskot lomittaen keskikiskon kaksi viipaletta, ja gather_text_rails palauttaa tekstin kiskot merkkijonoina;
+    - scatter_rails kirjoittaa kiskot takaisin paikoilleen ja kumoaa gather_rails-funktion;
+    - Välimuistin permutaatiot, NumPyn indeksitaulukot, pitkien tekstien salaus ja purku sekä virtamuunnokset rakennetaan näistä kahdesta funktiosta.
+'''
+
+def zigzag_slices(rails: int, length: int, position: int = 0) -> list:
+    if rails <= 1:
+        return [(slice(0, length),)]
+
+    cycle = 2 * (rails - 1)
+    slices = []
+
+    for rail in range(rails):
+        descending_start = (rail - position) % cycle
+
+        if rail == 0 or rail == rails - 1:
+            slices.append((slice(descending_start, length, cycle),))
+        else:
+            ascending_start = (cycle - rail - position) % cycle
+            first_start, second_start = sorted((descending_start, ascending_start))
+            slices.append((slice(first_start, length, cycle), slice(second_start, length, cycle)))
+
+    return slices
+
+def rail_lengths(slices: list, length: int) -> list:
+    positions = range(length)
+    return [sum(len(positions[rail_slice]) for rail_slice in rail) for rail in slices]
+
+def list_buffer(size: int) -> list:
+    return [''] * size
+
+def gather_rails(sequence, slices: list, allocate=list_buffer) -> list:
+    rails = []
+
+    for rail in slices:
+        if len(rail) == 1:
+            rails.append(sequence[rail[0]])
+        else:
+            first, second = sequence[rail[0]], sequence[rail[1]]
+            gathered = allocate(len(first) + len(second))
+            gathered[0::2] = first
+            gathered[1::2] = second
+            rails.append(gathered)
+
+    return rails
+
+def gather_text_rails(text: str, slices: list) -> list:
+    return [rail if isinstance(rail, str) else ''.join(rail) for rail in gather_rails(text, slices)]
+
+def scatter_rails(rails: list, slices: list, result):
+    for rail_sequence, rail in zip(rails, slices):
+        if len(rail) == 1:
+            result[rail[0]] = rail_sequence
+        else:
+            result[rail[0]] = rail_sequence[0::2]
+            result[rail[1]] = rail_sequence[1::2]
+
+    return result
@@ -0,0 +1,13 @@
+import pytest
+
+from classical_ciphers.backends import numpy
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request):
+    if request.param == 'python':
+        with numpy.disabled():
+            yield request.param
+    elif numpy:
+        yield request.param
+    else:
+        pytest.skip("NumPy is not installed")
@@ -0,0 +1,41 @@
+import pytest
+
+from classical_ciphers.backends import numpy
+from classical_ciphers.batch import cipher_function, many_function
+from classical_ciphers.registry import ALPHABET_CIPHERS, CIPHERS, create_cipher
+
+KEYS = {'affine': '5,8', 'beaufort': 'KEY', 'caesar': '3', 'gronsfeld': '31415', 'hill': '1,2;3,5', 'playfair': 'KEYWORD', 'rail-fence': '3', 'vigenere': 'LEMON'}
+RUSSIAN_KEYS = {'beaufort': 'КЛЮЧ', 'vigenere': 'КЛЮЧ'}
+
+TEXTS = {
+    'latin': "The quick brown fox jumps over the lazy dog, twice. Hello, World! ",
+    'russian': "Съешь же ещё этих мягких французских булок, да выпей чаю! ",
+    'finnish': "Törkylempijävongahdus, Åke ja öljyä! ",
+}
+
+CASES = [(name, 'latin') for name in sorted(CIPHERS)]
+CASES += [(name, alphabet) for name in sorted(ALPHABET_CIPHERS) for alphabet in ('russian', 'finnish')]
+
+def cipher_results(name: str, alphabet: str) -> list:
+    key = RUSSIAN_KEYS.get(name) if alphabet == 'russian' else None
+    cipher = create_cipher(name, key or KEYS.get(name), alphabet if name in ALPHABET_CIPHERS else None)
+    text = TEXTS[alphabet]
+
+    results = []
+    for sample in (text, text * 300):
+        encoded_text = cipher_function(cipher)(sample)
+        results.extend([encoded_text, cipher_function(cipher, decrypt=True)(encoded_text)])
+
+    batch_function = many_function(cipher)
+    if batch_function is not None:
+        results.append(batch_function([text[:length] for length in range(len(text))] * 4))
+    return results
+
+@pytest.mark.parametrize('name, alphabet', CASES, ids=[f'{name}-{alphabet}' for name, alphabet in CASES])
+def test_numpy_matches_pure_python(name, alphabet):
+    if not numpy:
+        pytest.skip("NumPy is not installed")
+
+    vectorized_results = cipher_results(name, alphabet)
+    with numpy.disabled():
+        assert cipher_results(name, alphabet) == vectorized_results
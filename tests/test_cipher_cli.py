@@ -0,0 +1,45 @@
+import os
+
+import pytest
+
+from classical_ciphers.cipher_cli import main
+from classical_ciphers.registry import create_cipher
+
+PREVIOUS_CONTENTS = b"Previous contents\n"
+
+def run_main(tmp_path, input_data: bytes, *arguments):
+    input_path = tmp_path / 'input.txt'
+    output_path = tmp_path / 'output.txt'
+    input_path.write_bytes(input_data)
+    main([*arguments, '--input', str(input_path), '--output', str(output_path), '--quiet'])
+
+@pytest.mark.parametrize('input_data, arguments', [
+    (b'\xff\xfeabc', ['encrypt', '--cipher', 'caesar', '--key', '3']),
+    (b'GYIZSCOKCFBU\n', ['decrypt', '--cipher', 'playfair', '--key', 'KEY']),
+    (b'ABC', ['decrypt', '--cipher', 'hill', '--key', '5,8;17,3']),
+    ('Élan'.encode(), ['encrypt', '--cipher', 'affine', '--key', '5,8']),
+], ids=['invalid-utf-8', 'playfair-newline', 'hill-partial-block', 'affine-foreign-letter'])
+def test_input_error_is_a_usage_error_and_keeps_the_output(tmp_path, capsys, input_data, arguments):
+    output_path = tmp_path / 'output.txt'
+    output_path.write_bytes(PREVIOUS_CONTENTS)
+    os.chmod(output_path, 0o640)
+
+    with pytest.raises(SystemExit) as error:
+        run_main(tmp_path, input_data, *arguments)
+
+    assert error.value.code == 2
+    assert 'error:' in capsys.readouterr().err
+    assert output_path.read_bytes() == PREVIOUS_CONTENTS
+    assert sorted(os.listdir(tmp_path)) == ['input.txt', 'output.txt']
+
+def test_output_is_replaced_on_success(tmp_path):
+    output_path = tmp_path / 'output.txt'
+    output_path.write_bytes(PREVIOUS_CONTENTS)
+    os.chmod(output_path, 0o640)
+    text = "Hello, World!\n" * 1000
+
+    run_main(tmp_path, text.encode(), 'encrypt', '--cipher', 'vigenere', '--key', 'LEMON', '--chunk-size', '7')
+
+    assert output_path.read_text() == create_cipher('vigenere', 'LEMON').encrypt(text)
+    assert os.stat(output_path).st_mode & 0o777 == 0o640
+    assert sorted(os.listdir(tmp_path)) == ['input.txt', 'output.txt']
@@ -0,0 +1,29 @@
+import pytest
+
+from classical_ciphers.batch import cipher_function
+from classical_ciphers.cipher_service import transform_batch, transform_texts
+from classical_ciphers.registry import ALPHABET_CIPHERS, CIPHERS, create_cipher
+
+KEYS = {'affine': '5,8', 'beaufort': 'KEY', 'caesar': '3', 'gronsfeld': '31415', 'hill': '1,2;3,5', 'playfair': 'KEYWORD', 'rail-fence': '3', 'vigenere': 'LEMON'}
+RUSSIAN_KEYS = {'beaufort': 'КЛЮЧ', 'vigenere': 'КЛЮЧ'}
+
+TEXTS = {
+    'latin': ["Hello, World!", "", "Attack at dawn", "The quick brown fox " * 20, "ab", "Zz"] * 8,
+    'mixed': ["Hello, World!", "", "Straße", "Élan", "Attack at dawn", "Съешь ещё", "Öljyä ja Åke", "The quick brown fox " * 20, "ab"] * 8,
+}
+
+CASES = [(name, None) for name in sorted(CIPHERS)]
+CASES += [(name, alphabet) for name in sorted(ALPHABET_CIPHERS) for alphabet in ('russian', 'finnish')]
+
+def comparable(results: list) -> list:
+    return [(type(result), str(result)) if isinstance(result, Exception) else result for result in results]
+
+@pytest.mark.parametrize('name, alphabet', CASES, ids=[f'{name}-{alphabet or "latin"}' for name, alphabet in CASES])
+@pytest.mark.parametrize('operation', ['encrypt', 'decrypt'])
+@pytest.mark.parametrize('texts', sorted(TEXTS))
+def test_batch_matches_single_texts(backend, name, alphabet, operation, texts):
+    key = RUSSIAN_KEYS.get(name) if alphabet == 'russian' else None
+    key = key or KEYS.get(name)
+    function = cipher_function(create_cipher(name, key, alphabet), operation == 'decrypt')
+
+    assert comparable(transform_batch(name, key, alphabet, operation, TEXTS[texts])) == comparable(transform_texts(function, TEXTS[texts]))
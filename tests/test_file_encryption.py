@@ -0,0 +1,40 @@
+import pytest
+
+from classical_ciphers import AffineCipher, AtbashCipher, BeaufortCipher, CaesarCipher, HillCipher, RailFenceCipher, VigenereCipher
+from classical_ciphers.batch import cipher_function
+from classical_ciphers.file_encryption import decrypt_file, encrypt_file
+
+TEXT = "Hello, World! The quick brown fox jumps over the lazy dog.\n" * 5
+PREVIOUS_CONTENTS = b"Previous contents\n"
+
+@pytest.mark.parametrize('cipher, error', [
+    (RailFenceCipher(3), TypeError),
+    (HillCipher([[3, 3], [2, 5]]), TypeError),
+    (VigenereCipher("КЛЮЧ", 'russian'), ValueError),
+], ids=['rail-fence', 'hill', 'vigenere-russian'])
+def test_rejected_cipher_keeps_the_destination(tmp_path, cipher, error):
+    source_path = tmp_path / 'source.txt'
+    destination_path = tmp_path / 'destination.txt'
+    source_path.write_text(TEXT)
+    destination_path.write_bytes(PREVIOUS_CONTENTS)
+
+    with pytest.raises(error):
+        encrypt_file(cipher, str(source_path), str(destination_path))
+
+    assert destination_path.read_bytes() == PREVIOUS_CONTENTS
+
+@pytest.mark.parametrize('cipher', [
+    CaesarCipher(3), AtbashCipher(), AffineCipher(5, 8), VigenereCipher("LEMON"), BeaufortCipher("KEY"),
+], ids=['caesar', 'atbash', 'affine', 'vigenere', 'beaufort'])
+@pytest.mark.parametrize('window_size', [5, 7, 1 << 24])
+def test_file_matches_the_text(tmp_path, cipher, window_size):
+    source_path = tmp_path / 'source.txt'
+    destination_path = tmp_path / 'destination.txt'
+    source_path.write_text(TEXT)
+    encoded_text = cipher_function(cipher)(TEXT)
+
+    assert encrypt_file(cipher, str(source_path), str(destination_path), window_size) == len(TEXT)
+    assert destination_path.read_text() == encoded_text
+
+    decrypt_file(cipher, str(destination_path), window_size=window_size)
+    assert destination_path.read_text() == cipher_function(cipher, decrypt=True)(encoded_text)
@@ -0,0 +1,45 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from classical_ciphers import HillCipher
+from classical_ciphers.hill_key_recovery import recover_key
+from classical_ciphers.modular_arithmetic import determinant, greatest_common_divisor, independent_rows
+
+MODULUS = 26
+
+# Entries sharing the factors of 26 make the greedy choice of rows fail often.
+ENTRIES = [0, 1, 2, 4, 13, 3]
+
+def is_invertible(matrix: list, modulus: int) -> bool:
+    return greatest_common_divisor(determinant(matrix, modulus), modulus) == 1
+
+def has_invertible_choice(rows: list, count: int, modulus: int) -> bool:
+    return any(is_invertible([rows[index] for index in indices], modulus) for indices in combinations(range(len(rows)), count))
+
+@pytest.mark.parametrize('count', [2, 3])
+@pytest.mark.parametrize('seed', range(200))
+def test_independent_rows_match_an_exhaustive_search(count, seed):
+    generator = random.Random(seed)
+    rows = [[generator.choice(ENTRIES) for _ in range(count)] for _ in range(generator.randint(count, 7))]
+
+    indices = independent_rows(rows, count, MODULUS)
+
+    assert len(set(indices)) == len(indices)
+    if has_invertible_choice(rows, count, MODULUS):
+        assert len(indices) == count
+        assert is_invertible([rows[index] for index in indices], MODULUS)
+    else:
+        assert len(indices) < count
+
+@pytest.mark.parametrize('key_matrix', [[[3, 3], [2, 5]], [[6, 24, 1], [13, 16, 10], [20, 17, 15]]])
+def test_recover_key_from_a_known_plaintext(key_matrix):
+    plaintext = "ATTACKATDAWNBEFORETHEENEMYWAKESUPANDSEESUS"
+    ciphertext = HillCipher(key_matrix).encrypt(plaintext)
+
+    assert recover_key(plaintext, ciphertext, len(key_matrix)) == key_matrix
+
+def test_recover_key_rejects_dependent_blocks():
+    with pytest.raises(ValueError):
+        recover_key("ABABABAB", HillCipher([[3, 3], [2, 5]]).encrypt("ABABABAB"))
@@ -0,0 +1,69 @@
+import gc
+import weakref
+
+import pytest
+
+from classical_ciphers import AffineCipher, AtbashCipher, CaesarCipher
+from classical_ciphers.key_schedule import estimate_size, key_schedules
+from classical_ciphers.translation_table import MEMOIZED_CHARACTER_LIMIT, MINIMUM_VECTORIZED_LENGTH
+
+FOREIGN_CHARACTERS = ''.join(map(chr, range(0x2500, 0x2500 + 4 * MEMOIZED_CHARACTER_LIMIT)))
+
+CIPHER_FACTORIES = [lambda: CaesarCipher(3), lambda: AtbashCipher(), lambda: AffineCipher(5, 8)]
+
+@pytest.fixture
+def schedules():
+    configuration = key_schedules.statistics()
+    key_schedules.clear()
+    yield key_schedules
+    key_schedules.configure(configuration['maximum_entries'], configuration['maximum_bytes'])
+    key_schedules.clear()
+
+def grow(cipher):
+    for character in FOREIGN_CHARACTERS:
+        cipher.encode(character)
+    cipher.encode(FOREIGN_CHARACTERS[:MINIMUM_VECTORIZED_LENGTH])
+
+def actual_size(table) -> int:
+    code_points_size = 0 if table.code_points is None else table.code_points.nbytes
+    return estimate_size(table) - table.reserved_size() + code_points_size
+
+@pytest.mark.parametrize('factory', CIPHER_FACTORIES, ids=['caesar', 'atbash', 'affine'])
+def test_memoized_characters_are_bounded(backend, schedules, factory):
+    cipher = factory()
+    grow(cipher)
+
+    for table in {id(table): table for table in vars(cipher).values() if hasattr(table, 'compiled_size')}.values():
+        assert len(table) <= table.compiled_size + MEMOIZED_CHARACTER_LIMIT
+
+@pytest.mark.parametrize('factory', CIPHER_FACTORIES, ids=['caesar', 'atbash', 'affine'])
+def test_estimate_covers_the_grown_table(backend, schedules, factory):
+    cipher = factory()
+    table = cipher.table if isinstance(cipher, AtbashCipher) else cipher.encoding_table
+    estimated_size = estimate_size(table)
+
+    grow(cipher)
+
+    assert estimated_size >= actual_size(table)
+
+def test_cache_stays_within_its_byte_limit(backend, schedules):
+    schedules.configure(maximum_bytes=4 * estimate_size(vars(CaesarCipher(0))))
+    schedules.clear()
+
+    for shift in range(26):
+        grow(CaesarCipher(shift))
+        assert schedules.statistics()['bytes'] <= schedules.maximum_bytes
+
+    assert schedules.statistics()['evictions'] > 0
+
+@pytest.mark.parametrize('factory', CIPHER_FACTORIES, ids=['caesar', 'atbash', 'affine'])
+def test_cached_schedule_does_not_keep_the_first_instance_alive(schedules, factory):
+    first = factory()
+    reference = weakref.ref(first)
+    second = factory()
+    del first
+    gc.collect()
+
+    assert reference() is None
+    assert second.encode("Hello, World!") == factory().encode("Hello, World!")
+    assert schedules.statistics()['hits'] >= 1
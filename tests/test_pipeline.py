@@ -0,0 +1,60 @@
+import pytest
+
+from classical_ciphers import AffineCipher, AtbashCipher, CaesarCipher, RailFenceCipher, VigenereCipher
+from classical_ciphers.batch import cipher_function
+from classical_ciphers.pipeline import CipherPipeline
+from classical_ciphers.rail_fence_cipher import CACHED_PERMUTATION_LENGTH
+from classical_ciphers.streaming import process_chunks
+
+TEXT = "The quick brown fox jumps over the lazy dog, twice. Hello, World! — ½ €1"
+
+PIPELINES = {
+    'substitutions': lambda: [CaesarCipher(3), AtbashCipher(), AffineCipher(5, 8)],
+    'transpositions': lambda: [RailFenceCipher(3), RailFenceCipher(4), RailFenceCipher(2)],
+    'mixed': lambda: [CaesarCipher(3), AtbashCipher(), AffineCipher(5, 8), VigenereCipher("LEMON"), RailFenceCipher(3), RailFenceCipher(4)],
+    'interleaved': lambda: [RailFenceCipher(5), CaesarCipher(7), CaesarCipher(11), RailFenceCipher(2), RailFenceCipher(6), AtbashCipher()],
+}
+
+def sequential_encode(ciphers: list, text: str) -> str:
+    for cipher in ciphers:
+        text = cipher_function(cipher)(text)
+    return text
+
+def sequential_decode(ciphers: list, text: str) -> str:
+    for cipher in reversed(ciphers):
+        text = cipher_function(cipher, decrypt=True)(text)
+    return text
+
+@pytest.mark.parametrize('name', sorted(PIPELINES))
+@pytest.mark.parametrize('length', [0, 1, 2, len(TEXT), CACHED_PERMUTATION_LENGTH + 1, 3 * CACHED_PERMUTATION_LENGTH])
+def test_fused_pipeline_matches_the_stages_one_by_one(backend, name, length):
+    ciphers = PIPELINES[name]()
+    pipeline = CipherPipeline(ciphers)
+    text = (TEXT * (length // len(TEXT) + 1))[:length]
+    encoded_text = sequential_encode(ciphers, text)
+
+    assert pipeline.encode(text) == encoded_text
+    assert pipeline.decode(encoded_text) == sequential_decode(ciphers, encoded_text)
+
+@pytest.mark.parametrize('length', [1, len(TEXT), 3 * CACHED_PERMUTATION_LENGTH])
+def test_fused_pipeline_rejects_a_foreign_letter_like_the_stages(backend, length):
+    ciphers = PIPELINES['mixed']()
+    text = (TEXT * (length // len(TEXT) + 1))[:length - 1] + 'Ё'
+
+    with pytest.raises(KeyError):
+        sequential_encode(ciphers, text)
+    with pytest.raises(KeyError):
+        CipherPipeline(ciphers).encode(text)
+
+@pytest.mark.parametrize('name', sorted(PIPELINES))
+@pytest.mark.parametrize('chunk_size', [1, 7, 64])
+def test_pipeline_stream_matches_the_stages_one_by_one(name, chunk_size):
+    ciphers = PIPELINES[name]()
+    pipeline = CipherPipeline(ciphers)
+    text = TEXT * 20
+    encoded_text = sequential_encode(ciphers, text)
+    chunks = [text[start:start + chunk_size] for start in range(0, len(text), chunk_size)]
+    encoded_chunks = [encoded_text[start:start + chunk_size] for start in range(0, len(encoded_text), chunk_size)]
+
+    assert ''.join(process_chunks(pipeline.encoder(), chunks)) == encoded_text
+    assert ''.join(process_chunks(pipeline.decoder(), encoded_chunks)) == sequential_decode(ciphers, encoded_text)
@@ -0,0 +1,39 @@
+import pytest
+
+from classical_ciphers import RailFenceCipher
+from classical_ciphers.rail_fence_cipher import CACHED_PERMUTATION_LENGTH, zigzag_permutation
+
+def reference_permutation(rails: int, length: int) -> list:
+    rail_of_position = []
+    rail, step = 0, 1
+    for _ in range(length):
+        rail_of_position.append(rail)
+        if rails > 1:
+            if rail + step not in range(rails):
+                step = -step
+            rail += step
+    return sorted(range(length), key=lambda position: (rail_of_position[position], position))
+
+@pytest.mark.parametrize('rails', range(1, 9))
+def test_permutation_follows_the_zigzag(rails):
+    for length in range(40):
+        assert list(zigzag_permutation(rails, length)) == reference_permutation(rails, length)
+
+@pytest.mark.parametrize('rails', [1, 2, 3, 7, 64])
+@pytest.mark.parametrize('length', [2, 17, CACHED_PERMUTATION_LENGTH, CACHED_PERMUTATION_LENGTH + 1, 5000])
+def test_encode_and_decode_follow_the_zigzag(backend, rails, length):
+    cipher = RailFenceCipher(rails)
+    text = ''.join(chr(0x400 + position % 0x800) for position in range(length))
+    encoded_text = ''.join(text[position] for position in reference_permutation(rails, length))
+
+    assert cipher.encode(text) == encoded_text
+    assert cipher.decode(encoded_text) == text
+
+@pytest.mark.parametrize('rails', [2, 3, 5])
+def test_batch_matches_single_messages(backend, rails):
+    cipher = RailFenceCipher(rails)
+    messages = [''.join(chr(97 + (seed * length + position) % 26) for position in range(length)) for seed in range(3) for length in range(60)]
+
+    encoded_messages = cipher.encode_many(messages)
+    assert encoded_messages == [cipher.encode(message) for message in messages]
+    assert cipher.decode_many(encoded_messages) == messages
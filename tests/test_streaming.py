@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from classical_ciphers.batch import cipher_function
+from classical_ciphers.rail_fence_cipher import CACHED_PERMUTATION_LENGTH
+from classical_ciphers.registry import CIPHERS, create_cipher
+from classical_ciphers.streaming import process_chunks
+
+TEXT = "The quick brown fox jumps over the lazy dog, twice. Hello, World!\n" * 3
+
+CHUNK_SIZES = [1, 2, 3, 7, 64]
+
+KEYS = {'affine': '5,8', 'beaufort': 'KEY', 'caesar': '3', 'gronsfeld': '31415', 'hill': '3,3;2,5', 'playfair': 'KEYWORD', 'rail-fence': '3', 'vigenere': 'LEMON'}
+
+def split_text(text: str, chunk_size: int) -> list:
+    return [text[start:start + chunk_size] for start in range(0, len(text), chunk_size)]
+
+def split_randomly(text: str, seed: int) -> list:
+    generator = random.Random(seed)
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + generator.randint(0, 40)
+        chunks.append(text[start:end])
+        start = end
+    return chunks
+
+@pytest.mark.parametrize('name', ['polybius', 'polybius-fixed'])
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_polybius_stream_decode_matches_the_whole_text(name, chunk_size):
+    cipher = create_cipher(name)
+    code = cipher.encode(TEXT)
+
+    assert ''.join(process_chunks(cipher.decoder(), split_text(code, chunk_size))) == cipher.decode(code)
+
+@pytest.mark.parametrize('name', sorted(CIPHERS))
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_stream_matches_the_whole_text(name, chunk_size):
+    cipher = create_cipher(name, KEYS.get(name))
+    encoded_text = cipher_function(cipher)(TEXT)
+
+    assert ''.join(process_chunks(cipher.encoder(), split_text(TEXT, chunk_size))) == encoded_text
+    assert ''.join(process_chunks(cipher.decoder(), split_text(encoded_text, chunk_size))) == cipher_function(cipher, decrypt=True)(encoded_text)
+
+@pytest.mark.parametrize('rails', [1, 2, 3, 5, 11])
+@pytest.mark.parametrize('seed', range(5))
+def test_rail_fence_stream_matches_the_whole_text_at_any_cut(rails, seed):
+    cipher = create_cipher('rail-fence', str(rails))
+    text = TEXT * (CACHED_PERMUTATION_LENGTH // len(TEXT) + 1)
+    encoded_text = cipher.encode(text)
+
+    assert ''.join(process_chunks(cipher.encoder(), split_randomly(text, seed), chunk_size=13)) == encoded_text
+    assert ''.join(process_chunks(cipher.decoder(), split_randomly(encoded_text, seed), chunk_size=13)) == cipher.decode(encoded_text)
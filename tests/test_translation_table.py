@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from classical_ciphers import AffineCipher, AtbashCipher, CaesarCipher
+from classical_ciphers.translation_table import MINIMUM_VECTORIZED_LENGTH
+
+LONG_LENGTH = 4 * MINIMUM_VECTORIZED_LENGTH
+
+def random_text(characters: str, length: int) -> str:
+    generator = random.Random(length)
+    return ''.join(generator.choice(characters) for _ in range(length))
+
+@pytest.mark.parametrize('text', ['É', 'abc É', 'x' * LONG_LENGTH + 'É', 'é' * LONG_LENGTH, 'ÄÖ' + 'abc' * LONG_LENGTH],
+                         ids=['letter', 'short', 'long-ascii', 'long-foreign', 'long-mixed'])
+def test_affine_raises_key_error_for_a_foreign_letter(backend, text):
+    cipher = AffineCipher(5, 8)
+
+    # The second call meets the character after the first one may have memoized its neighbours.
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            cipher.encode(text)
+        with pytest.raises(KeyError):
+            cipher.decode(text)
+
+@pytest.mark.parametrize('cipher, characters', [
+    (CaesarCipher(3), 'abcxyzABCXYZ ,.!-0123456789€—éßÄ'),
+    (CaesarCipher(5, 'russian'), 'абвэюяАБВЭЮЯЁё ,.!-0123€'),
+    (AtbashCipher(), 'abcxyzABCXYZ ,.!-0123456789€—éßÄ'),
+    (AtbashCipher('finnish'), 'abcåäöABCÅÄÖ ,.!-0123€—é'),
+    (AffineCipher(5, 8), 'abcxyzABCXYZ ,.!-0123456789€—'),
+    (AffineCipher(7, 3, 'russian'), 'абвэюяАБВЭЮЯЁё ,.!-0123€'),
+], ids=['caesar', 'caesar-russian', 'atbash', 'atbash-finnish', 'affine', 'affine-russian'])
+@pytest.mark.parametrize('length', [1, 40, LONG_LENGTH])
+def test_table_matches_the_character_function(backend, cipher, characters, length):
+    text = random_text(characters, length)
+
+    assert cipher.encode(text) == ''.join(map(cipher.encode_character, text))
+    if hasattr(cipher, 'decode_character'):
+        assert cipher.decode(text) == ''.join(map(cipher.decode_character, text))